@@ -1,13 +1,14 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from typing import Generator
+from typing import Generator, Optional
 from app.db.session import SessionLocal
 from app.models.user import User
 from app.core.security import verify_token
 from app.services.user import UserService
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 def get_db() -> Generator:
     db = SessionLocal()
@@ -44,3 +45,67 @@ def get_current_user(
         )
     
     return user
+
+
+def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> int:
+    """Get the authenticated user's id from the access token alone.
+    
+    Unlike get_current_user this does not load the user from the database,
+    so it suits hot, read-only endpoints that don't need the User row.
+    """
+    payload = verify_token(credentials.credentials, "access")
+    if not payload or payload.get("sub") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return int(payload.get("sub"))
+
+
+def ensure_active_user(user_id: int) -> None:
+    """Reject a user id that doesn't belong to an active user.
+    
+    Looks the user up in its own short-lived session, for handlers that must
+    not keep a request session (and its connection) open while they run.
+    """
+    db = SessionLocal()
+    try:
+        user = UserService(db).get_user_by_id(user_id)
+    finally:
+        db.close()
+    
+    if not user or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found or inactive",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+def get_active_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> int:
+    """Get the authenticated, active user's id without holding a request session.
+    
+    Use it instead of get_current_user on streaming endpoints: get_db's session
+    would stay open until the whole response body has been sent.
+    """
+    user_id = get_current_user_id(credentials)
+    ensure_active_user(user_id)
+    return user_id
+
+
+def get_optional_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> Optional[int]:
+    """Like get_current_user_id, but returns None for anonymous requests.
+    
+    A token that is present but invalid is still rejected.
+    """
+    if credentials is None:
+        return None
+    return get_current_user_id(credentials)
@@ -10,6 +10,35 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
+    # LeetCode catalog (problem autofill)
+    LEETCODE_CATALOG_PATH: str = "./data/leetcode_catalog.json"
+    LEETCODE_CATALOG_REFRESH_SECONDS: int = 24 * 60 * 60
+    LEETCODE_TOPICS_PATH: str = "./data/leetcode_topics.json"
+    LEETCODE_TOPICS_TTL_SECONDS: int = 7 * 24 * 60 * 60
+    LEETCODE_TOPICS_CACHE_SIZE: int = 5000
+    LEETCODE_TOPICS_PAGE_SIZE: int = 500
+    
+    # Job extraction result cache
+    EXTRACTION_CACHE_TTL_SECONDS: int = 60 * 60
+    EXTRACTION_CACHE_MAX_ENTRIES: int = 2000
+    
+    # Hard cap on how much of a job page body is read before parsing stops
+    EXTRACTION_MAX_PAGE_BYTES: int = 3 * 1024 * 1024
+    
+    # Scraping politeness: minimum gap between requests to one domain, and how
+    # long a request may queue for its slot before falling back instead
+    SCRAPE_MIN_INTERVAL_SECONDS: float = 1.0
+    SCRAPE_MAX_QUEUE_WAIT_SECONDS: float = 10.0
+    
+    # Background extraction queue
+    EXTRACTION_QUEUE_WORKERS: int = 4
+    EXTRACTION_JOB_TIMEOUT_SECONDS: int = 30
+    
+    # Company logos; generated avatars are linked as {PUBLIC_API_URL}/api/company-logos/{id}.svg
+    PUBLIC_API_URL: str = "http://localhost:8000"
+    COMPANY_LOGO_RETRY_SECONDS: int = 7 * 24 * 60 * 60
+    COMPANY_LOGO_CACHE_SIZE: int = 5000
+    
     class Config:
         env_file = ".env"
 
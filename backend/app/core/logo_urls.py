@@ -0,0 +1,19 @@
+from typing import Optional
+from app.core.config import settings
+
+# Generated avatars are stored by path and made absolute (PUBLIC_API_URL) when a response is built
+AVATAR_PATH = "/api/company-logos/{id}.svg"
+
+
+def public_logo_url(logo_url: Optional[str]) -> Optional[str]:
+    """Absolute URL for a stored logo; avatar paths are served by this API"""
+    if logo_url and logo_url.startswith('/'):
+        return f"{settings.PUBLIC_API_URL}{logo_url}"
+    return logo_url
+
+
+def stored_logo_url(logo_url: Optional[str]) -> Optional[str]:
+    """Form of a logo URL to store: this API's own avatar URLs are kept as paths"""
+    if logo_url and logo_url.startswith(f"{settings.PUBLIC_API_URL}/api/company-logos/"):
+        return logo_url[len(settings.PUBLIC_API_URL):]
+    return logo_url
@@ -11,9 +11,17 @@ from app.routers.calendar_events import router as calendar_events_router
 from app.routers.timer_settings import router as timer_settings_router
 from app.routers.jobs import router as jobs_router
 from app.routers.job_extraction import router as job_extraction_router
+from app.routers.company_logos import router as company_logos_router
+from app.routers.data_export import router as data_export_router
+from app.services.leetcode_catalog import leetcode_catalog
+from app.services.leetcode_topics import topic_tag_cache
+from app.services.http_client import http_client
+from app.services.extraction_queue import extraction_queue
+from app.routers.job_extraction import extract_job_data_cached
+from app.services.migrations import run_migrations
 
 # Import models to ensure they are registered
-from app.models import User, RefreshToken, Problem, Pomodoro, PomodoroSession, OnboardingTask, CalendarEvent, TimerSettings, Job, Contact
+from app.models import User, RefreshToken, Problem, Pomodoro, PomodoroSession, OnboardingTask, CalendarEvent, TimerSettings, Job, Contact, ExtractionJob, CompanyLogo, JobStatsRollup, JobTag, ProblemTopic
 
 Base.metadata.create_all(bind=engine)
 
@@ -25,8 +33,36 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],        
     allow_headers=["*"],        
+    expose_headers=["X-Next-Cursor"],
 )
 
+@app.on_event("startup")
+def apply_migrations():
+    # Changes to existing tables (create_all only adds new ones); a no-op once applied
+    run_migrations(engine)
+
+@app.on_event("startup")
+def start_leetcode_catalog():
+    leetcode_catalog.start_background_refresh()
+    topic_tag_cache.start_background_prefetch()
+
+@app.on_event("shutdown")
+def stop_leetcode_catalog():
+    leetcode_catalog.stop_background_refresh()
+    topic_tag_cache.stop_background_prefetch()
+
+@app.on_event("startup")
+async def start_extraction_queue():
+    extraction_queue.start(extract_job_data_cached)
+
+@app.on_event("shutdown")
+async def stop_extraction_queue():
+    await extraction_queue.stop()
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await http_client.aclose()
+
 @app.get("/ping")
 def ping():
     return {"status": "ok"}
@@ -40,3 +76,5 @@ app.include_router(calendar_events_router, prefix="/calendar-events", tags=["cal
 app.include_router(timer_settings_router, prefix="/timer-settings", tags=["timer-settings"])
 app.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
 app.include_router(job_extraction_router, prefix="/api", tags=["job-extraction"])
+app.include_router(company_logos_router, prefix="/api", tags=["company-logos"])
+app.include_router(data_export_router, tags=["export"])
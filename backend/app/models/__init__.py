@@ -7,5 +7,9 @@ from .onboarding_task import OnboardingTask
 from .calendar_event import CalendarEvent
 from .timer_settings import TimerSettings
 from .job import Job, Contact
+from .extraction_job import ExtractionJob
+from .company_logo import CompanyLogo
+from .job_stats_rollup import JobStatsRollup
+from .tag_index import JobTag, ProblemTopic
 
-__all__ = ["User", "RefreshToken", "Problem", "Pomodoro", "PomodoroSession", "OnboardingTask", "CalendarEvent", "TimerSettings", "Job", "Contact"]
+__all__ = ["User", "RefreshToken", "Problem", "Pomodoro", "PomodoroSession", "OnboardingTask", "CalendarEvent", "TimerSettings", "Job", "Contact", "ExtractionJob", "CompanyLogo", "JobStatsRollup", "JobTag", "ProblemTopic"]
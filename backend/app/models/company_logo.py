@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class CompanyLogo(Base):
+    __tablename__ = "company_logos"
+
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String(255), unique=True, index=True, nullable=False)  # "domain:acme.com" or "name:acme"
+    company_name = Column(String(255), nullable=True)
+    domain = Column(String(255), nullable=True)
+    
+    # Either an external logo URL or a generated avatar served by /api/company-logos/{id}.svg
+    logo_url = Column(String(500), nullable=True)
+    svg = Column(Text, nullable=True)
+    source = Column(String(20), nullable=False)  # page, clearbit, generated
+    
+    # Timestamps
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -0,0 +1,35 @@
+import secrets
+
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class ExtractionJob(Base):
+    __tablename__ = "extraction_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # Public id handed to clients; unlike the sequential id it can't be guessed
+    token = Column(String(32), nullable=True, unique=True, index=True, default=lambda: secrets.token_urlsafe(16))
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    
+    # What to extract
+    url = Column(String(2000), nullable=False)
+    cache_key = Column(String(2000), nullable=False)  # Canonical URL, used to deduplicate requests
+    source_job_id = Column(String(100), nullable=True)  # Site job id (e.g. LinkedIn) if the client sent one
+    create_job = Column(Boolean, default=False)  # Save the result as a Job for user_id
+    
+    # Progress
+    status = Column(String(20), nullable=False, default="queued")  # queued, running, succeeded, failed
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_job_id = Column(Integer, ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=func.now())
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_extraction_jobs_cache_key_status", "cache_key", "status"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Float, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -40,6 +40,12 @@ class Job(Base):
     application_url = Column(String(500), nullable=True)  # LinkedIn or career page URL
     completion_method = Column(String(50), nullable=True)  # 'linkedin', 'career_page', 'email', 'other'
     
+    # Board ordering: fractional index within the status lane, ascending (a card dropped
+    # between two others takes the midpoint of their positions)
+    lane_position = Column(Float, nullable=True)
+    # Bumped on every write; moves carry the version they were made against
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    
     # Timestamps
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -48,6 +54,13 @@ class Job(Base):
     user = relationship("User", back_populates="jobs")
     contacts = relationship("Contact", back_populates="job", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Keyset pagination: newest-first listing per user
+        Index("ix_jobs_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Board lanes in position order
+        Index("ix_jobs_user_id_status_lane_position", "user_id", "status", "lane_position", "id"),
+    )
+
 
 class Contact(Base):
     __tablename__ = "contacts"
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, JSON
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class JobStatsRollup(Base):
+    __tablename__ = "job_stats_rollup"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    
+    # Job counters, kept in step with the jobs table by JobService
+    total_jobs = Column(Integer, nullable=False, default=0)
+    status_counts = Column(JSON, nullable=False, default=dict)  # {"applied": 12, ...}
+    company_counts = Column(JSON, nullable=False, default=dict)  # {"Acme": 3, ...}
+    referral_counts = Column(JSON, nullable=False, default=dict)  # {"referral": [jobs, reached interview], "non_referral": [...]}
+    
+    # Applications by applied date
+    week_counts = Column(JSON, nullable=False, default=dict)  # {"2026-W42": 4, ...}
+    day_counts = Column(JSON, nullable=False, default=dict)  # {"2026-10-17": 2, ...}
+    
+    # Timestamps
+    rebuilt_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.db.base import Base
+
+
+class JobTag(Base):
+    """One row per (job, tag), mirroring Job.tags so tag filters are indexed lookups"""
+    __tablename__ = "job_tags"
+
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(100), primary_key=True)  # Case-folded, used for matching
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    label = Column(String(100), nullable=False)  # As the user wrote it
+
+    __table_args__ = (
+        Index("ix_job_tags_user_id_tag", "user_id", "tag", "job_id"),
+    )
+
+
+class ProblemTopic(Base):
+    """One row per (problem, topic), mirroring Problem.topics"""
+    __tablename__ = "problem_topics"
+
+    problem_id = Column(Integer, ForeignKey("problems.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(100), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    label = Column(String(100), nullable=False)
+
+    __table_args__ = (
+        Index("ix_problem_topics_user_id_tag", "user_id", "tag", "problem_id"),
+    )
@@ -0,0 +1,23 @@
+import hashlib
+from fastapi import APIRouter, HTTPException, Request, Response
+from ..services.company_logos import company_logos
+
+router = APIRouter()
+
+# Avatars never change once generated, so clients and proxies may keep them for good
+AVATAR_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+@router.get("/company-logos/{logo_id}.svg")
+def get_company_logo_avatar(logo_id: int, request: Request):
+    """
+    Serve a generated company avatar (referenced from Job.company_logo)
+    """
+    svg = company_logos.get_avatar_svg(logo_id)
+    if svg is None:
+        raise HTTPException(status_code=404, detail="Logo not found")
+    
+    etag = f'"{hashlib.md5(svg.encode()).hexdigest()}"'
+    headers = {"Cache-Control": AVATAR_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=svg, media_type="image/svg+xml", headers=headers)
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.api.deps import get_active_user_id
+from app.services.data_export import (
+    EXPORT_ENTITIES,
+    EXPORT_MEDIA_TYPES,
+    PARQUET_AVAILABLE,
+    stream_ndjson,
+    stream_csv,
+    stream_parquet
+)
+
+router = APIRouter()
+
+
+@router.get("/export")
+def export_data(
+    format: str = Query("ndjson", pattern="^(ndjson|csv|parquet)$", description="ndjson, csv or parquet"),
+    entities: Optional[str] = Query(None, description=f"Comma-separated subset of: {', '.join(EXPORT_ENTITIES)} (default: all)"),
+    current_user_id: int = Depends(get_active_user_id)
+):
+    """
+    Stream all of the current user's data. NDJSON can include several
+    entities (each line has an "entity" field); CSV and Parquet export
+    exactly one entity per request.
+    """
+    selected = [entity.strip() for entity in entities.split(',') if entity.strip()] if entities else list(EXPORT_ENTITIES)
+    unknown = [entity for entity in selected if entity not in EXPORT_ENTITIES]
+    if unknown or not selected:
+        raise HTTPException(status_code=400, detail=f"Unknown entities: {', '.join(unknown) or '(none given)'}")
+    selected = list(dict.fromkeys(selected))
+    
+    if format != "ndjson" and len(selected) != 1:
+        raise HTTPException(status_code=400, detail=f"{format} export takes exactly one entity")
+    if format == "parquet" and not PARQUET_AVAILABLE:
+        raise HTTPException(status_code=501, detail="Parquet export needs pyarrow installed on the server")
+    
+    if format == "ndjson":
+        body = stream_ndjson(current_user_id, selected)
+    elif format == "csv":
+        body = stream_csv(current_user_id, selected[0])
+    else:
+        body = stream_parquet(current_user_id, selected[0])
+    
+    filename = f"trackernow-{'-'.join(selected) if len(selected) < len(EXPORT_ENTITIES) else 'export'}.{format}"
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -1,16 +1,66 @@
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
-import requests
-from bs4 import BeautifulSoup
+from fastapi import APIRouter, HTTPException, Depends, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, field_serializer
+from sqlalchemy.orm import Session
+import asyncio
+import codecs
+import json
 import re
-from typing import Optional, Dict, Any
-from ..api.deps import get_current_user
+import time
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, AsyncIterator, Union
+from urllib.parse import urlparse
+import httpx
+from ..api.deps import get_current_user, get_db, get_optional_user_id, get_active_user_id, ensure_active_user
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.user import User
+from ..schemas.extraction_job import ExtractionJobResponse
+from ..services.extraction_queue import extraction_queue, FINISHED_STATUSES
+from ..core.logo_urls import public_logo_url
+from ..services.company_logos import company_logos
+from ..services.http_client import http_client, DEFAULT_HEADERS
+from ..services.scrape_scheduler import scrape_scheduler, domain_key
+from ..services.extraction_cache import extraction_cache, canonicalize_job_url
+from ..services.job_extraction_engine import (
+    ParsedPage,
+    PageStream,
+    SiteRules,
+    element_text,
+    TITLE_PATTERNS,
+    COMPANY_PATTERNS,
+    LOCATION_PATTERNS,
+    LINKEDIN_RULES,
+    INDEED_RULES,
+    IMAGENE_RULES,
+    GENERIC_RULES
+)
 
 router = APIRouter()
 
+LINKEDIN_JOB_VIEW_PATTERN = re.compile(r'/jobs/view/(\d+)/?')
+IMAGENE_TITLE_PATTERN = re.compile(r'Student Software Engineer')
+IMAGENE_LOCATION_PATTERN = re.compile(r'Tel Aviv')
+IMAGENE_ABOUT_PATTERN = re.compile(r'About Imagene', re.I)
+IMAGENE_ABOUT_TEXT_PATTERN = re.compile(r'About Imagene.*?(?=\n\n|\n[A-Z]|$)', re.DOTALL)
+
+# Batch extraction limits
+BATCH_MAX_CONCURRENCY = 16
+BATCH_MAX_CONCURRENCY_PER_DOMAIN = 3
+BATCH_URL_TIMEOUT_SECONDS = 20
+
+# Seconds between keep-alive comments on an idle extraction event stream
+EVENTS_KEEPALIVE_SECONDS = 15
+
 class JobExtractionRequest(BaseModel):
     url: str
     jobId: Optional[str] = None
+    background: bool = False  # Queue the extraction and return its id right away
+    createJob: bool = False  # Background only: save the result as a job for the caller
+
+class JobExtractionBatchRequest(BaseModel):
+    urls: List[str] = Field(..., min_length=1, max_length=300)
 
 class JobExtractionResponse(BaseModel):
     company: Optional[str] = None
@@ -25,38 +75,291 @@ class JobExtractionResponse(BaseModel):
     website: Optional[str] = None
     company_logo: Optional[str] = None
 
-@router.post("/extract-job-data", response_model=JobExtractionResponse)
+    @field_serializer('company_logo')
+    def serialize_company_logo(self, company_logo: Optional[str]) -> Optional[str]:
+        return public_logo_url(company_logo)
+
+@router.post("/extract-job-data", response_model=Union[ExtractionJobResponse, JobExtractionResponse])
 async def extract_job_data(
-    request: JobExtractionRequest
+    request: JobExtractionRequest,
+    response: Response,
+    user_id: Optional[int] = Depends(get_optional_user_id)
     # current_user = Depends(get_current_user)  # Temporarily disabled for testing
 ):
     """
-    Extract job data from various job posting URLs
+    Extract job data from various job posting URLs.
+    With background=true the extraction is queued and its status returned
+    immediately (202); poll GET /extract-job-data/{id} or its event stream.
     """
+    if request.background:
+        if request.createJob and user_id is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Sign in to save extracted jobs")
+        if request.createJob:
+            # The job is written for this user, so they must still be active
+            await run_in_threadpool(ensure_active_user, user_id)
+        extraction = await extraction_queue.submit(request.url, request.jobId, user_id, request.createJob)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return ExtractionJobResponse.model_validate(extraction)
+    
     try:
-        if "linkedin.com" in request.url:
-            return await extract_linkedin_job_data(request.url, request.jobId)
-        elif "indeed.com" in request.url:
-            return await extract_indeed_job_data(request.url)
-        elif "glassdoor.com" in request.url:
-            return await extract_glassdoor_job_data(request.url)
-        elif "imagene-ai.com" in request.url:
-            return await extract_imagene_job_data(request.url)
-        else:
-            return await extract_generic_job_data(request.url)
+        return await extract_job_data_cached(request.url, request.jobId)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to extract job data: {str(e)}")
 
-async def extract_linkedin_job_data(url: str, job_id: Optional[str] = None) -> JobExtractionResponse:
+@router.get("/scrape-domains")
+def get_scrape_domains(current_user: User = Depends(get_current_user)):
+    """
+    Per-domain scraping health: circuit state, recent failures and latency
+    """
+    return scrape_scheduler.snapshot()
+
+@router.get("/extract-job-data/{extraction_id}", response_model=ExtractionJobResponse)
+def get_extraction_job(
+    extraction_id: str,
+    db: Session = Depends(get_db),
+    user_id: Optional[int] = Depends(get_optional_user_id)
+):
+    """
+    Get the status (and result, once finished) of a queued extraction
+    """
+    extraction = extraction_queue.get_by_token(db, extraction_id)
+    if not extraction or (extraction.user_id is not None and extraction.user_id != user_id):
+        raise HTTPException(status_code=404, detail="Extraction not found")
+    return extraction
+
+@router.get("/extract-job-data/{extraction_id}/events")
+async def stream_extraction_job_events(
+    extraction_id: str,
+    user_id: Optional[int] = Depends(get_optional_user_id)
+):
+    """
+    Server-sent events for a queued extraction: a "status" event on every
+    change and a final "done" event with the finished row
+    """
+    row_id = await run_in_threadpool(find_extraction_id, extraction_id, user_id)
+    if row_id is None:
+        raise HTTPException(status_code=404, detail="Extraction not found")
+    return StreamingResponse(
+        stream_extraction_events(row_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def find_extraction_id(token: str, user_id: Optional[int]) -> Optional[int]:
+    """Row id of the extraction behind a public id, if this caller may see it"""
+    db = SessionLocal()
+    try:
+        extraction = extraction_queue.get_by_token(db, token)
+        if not extraction or (extraction.user_id is not None and extraction.user_id != user_id):
+            return None
+        return extraction.id
+    finally:
+        db.close()
+
+def load_extraction_status(extraction_id: int) -> Optional[ExtractionJobResponse]:
+    db = SessionLocal()
+    try:
+        extraction = extraction_queue.get(db, extraction_id)
+        return ExtractionJobResponse.model_validate(extraction) if extraction else None
+    finally:
+        db.close()
+
+async def stream_extraction_events(extraction_id: int) -> AsyncIterator[str]:
+    last_status = None
+    while True:
+        current = await run_in_threadpool(load_extraction_status, extraction_id)
+        if current is None:
+            return
+        if current.status in FINISHED_STATUSES:
+            yield f"event: done\ndata: {current.model_dump_json()}\n\n"
+            return
+        if current.status != last_status:
+            last_status = current.status
+            yield f"event: status\ndata: {current.model_dump_json()}\n\n"
+        if not await extraction_queue.wait(extraction_id, EVENTS_KEEPALIVE_SECONDS):
+            yield ": keep-alive\n\n"
+
+@router.post("/extract-job-data/batch")
+async def extract_job_data_batch(
+    request: JobExtractionBatchRequest,
+    user_id: int = Depends(get_active_user_id)
+):
+    """
+    Extract job data for many URLs concurrently, streaming one NDJSON line
+    per URL as soon as it completes (not in request order)
+    """
+    return StreamingResponse(
+        stream_batch_extraction(request.urls),
+        media_type="application/x-ndjson"
+    )
+
+async def stream_batch_extraction(urls: List[str]) -> AsyncIterator[str]:
+    """
+    Fan extraction out with a global and a per-domain concurrency cap and a
+    per-URL timeout, yielding NDJSON lines in completion order
+    """
+    global_semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+    domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    async def extract_one(index: int, url: str) -> Dict[str, Any]:
+        domain_semaphore = domain_semaphores.setdefault(
+            domain_key(url), asyncio.Semaphore(BATCH_MAX_CONCURRENCY_PER_DOMAIN)
+        )
+        async with domain_semaphore, global_semaphore:
+            try:
+                result = await asyncio.wait_for(
+                    extract_job_data_cached(url),
+                    timeout=BATCH_URL_TIMEOUT_SECONDS
+                )
+                return {"index": index, "url": url, "success": True, "data": result.model_dump(), "error": None}
+            except asyncio.TimeoutError:
+                return {"index": index, "url": url, "success": False, "data": None, "error": "Timed out"}
+            except Exception as e:
+                return {"index": index, "url": url, "success": False, "data": None, "error": f"Failed to extract job data: {str(e)}"}
+    
+    tasks = [asyncio.create_task(extract_one(index, url)) for index, url in enumerate(urls)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield json.dumps(await next_done) + "\n"
+    finally:
+        # Stop outstanding work if the client disconnects mid-stream
+        for task in tasks:
+            task.cancel()
+
+async def extract_job_data_cached(url: str, job_id: Optional[str] = None) -> JobExtractionResponse:
+    """
+    Extract job data, serving repeat URLs from the extraction cache.
+    Stale entries are revalidated with a conditional GET, so an unchanged
+    page only costs a 304 round-trip.
+    """
+    cache_key = canonicalize_job_url(url, job_id)
+    cached = extraction_cache.get(cache_key)
+    if cached and extraction_cache.is_fresh(cached):
+        return cached.result
+    
+    # Glassdoor extraction never fetches the page, so there's nothing to cache
+    if "glassdoor.com" in url:
+        return await run_extractor(url, job_id)
+    
+    headers = dict(DEFAULT_HEADERS)
+    if cached:
+        headers.update(cached.conditional_headers())
+    
+    try:
+        fetched = await fetch_page(url, rules_for_url(url), headers)
+    except Exception:
+        # Prefer a stale result over the URL-only fallback when the site is unreachable
+        return cached.result if cached else extract_basic_info_from_url(url)
+    
+    response = fetched.response
+    if response.status_code == 304 and cached:
+        extraction_cache.mark_revalidated(cache_key, response.headers)
+        return cached.result
+    
+    result = await run_extractor(url, job_id, fetched)
+    # A page cut off at EXTRACTION_MAX_PAGE_BYTES may be missing fields; don't cache it as complete
+    if response.is_success and not fetched.truncated:
+        extraction_cache.put(cache_key, result, response.headers)
+    return result
+
+@dataclass
+class FetchedPage:
+    """
+    A job page read by ``fetch_page``; ``page`` is only set for successful
+    responses, and ``truncated`` when the body hit EXTRACTION_MAX_PAGE_BYTES
+    """
+    response: httpx.Response
+    page: Optional[ParsedPage] = None
+    truncated: bool = False
+
+async def fetch_page(url: str, rules: Optional[SiteRules] = None, headers: Optional[Dict[str, str]] = None) -> FetchedPage:
+    """
+    Stream a job page straight into the incremental parser instead of
+    buffering the whole body. Reading stops at EXTRACTION_MAX_PAGE_BYTES, or
+    as soon as every field in ``rules`` has its best match, and the rest of
+    the body is never downloaded.
+    
+    The fetch waits for the domain's slot in the scrape scheduler, which
+    raises DomainUnavailableError (so callers fall back right away) while
+    the domain is throttling us, and its outcome is reported back.
+    """
+    timeout = await scrape_scheduler.acquire(url)
+    started = time.monotonic()
+    recorded = False
+    try:
+        async with http_client.stream("GET", url, headers=headers or DEFAULT_HEADERS, timeout=timeout) as response:
+            scrape_scheduler.record(url, time.monotonic() - started, response.status_code, response.headers.get('retry-after'))
+            recorded = True
+            if not response.is_success:
+                return FetchedPage(response)
+            
+            stream = PageStream(rules, encoding=_known_encoding(response.charset_encoding))
+            truncated = False
+            async for chunk in response.aiter_bytes():
+                remaining = settings.EXTRACTION_MAX_PAGE_BYTES - stream.bytes_fed
+                if len(chunk) > remaining:
+                    stream.feed(chunk[:remaining])
+                    truncated = True
+                    break
+                if stream.feed(chunk):
+                    break
+            
+            return FetchedPage(response, stream.close(base_url=str(response.url)), truncated)
+    except httpx.HTTPError:
+        if not recorded:
+            scrape_scheduler.record(url, time.monotonic() - started)
+            recorded = True
+        raise
+    finally:
+        if not recorded:
+            scrape_scheduler.release_probe(url)
+
+def _known_encoding(charset: Optional[str]) -> Optional[str]:
+    """Use the Content-Type charset only if it names a real codec, otherwise let lxml sniff the page"""
+    if not charset:
+        return None
+    try:
+        codecs.lookup(charset)
+    except LookupError:
+        return None
+    return charset
+
+def rules_for_url(url: str) -> Optional[SiteRules]:
+    """
+    The field table ``run_extractor`` will apply to ``url``, used to stop streaming early
+    """
+    if "linkedin.com" in url:
+        return LINKEDIN_RULES
+    elif "indeed.com" in url:
+        return INDEED_RULES
+    elif "imagene-ai.com" in url:
+        return IMAGENE_RULES
+    return GENERIC_RULES
+
+async def run_extractor(url: str, job_id: Optional[str] = None, fetched: Optional[FetchedPage] = None) -> JobExtractionResponse:
+    """
+    Dispatch to the site-specific extractor, reusing an already fetched page if given
+    """
+    if "linkedin.com" in url:
+        return await extract_linkedin_job_data(url, job_id, fetched)
+    elif "indeed.com" in url:
+        return await extract_indeed_job_data(url, fetched)
+    elif "glassdoor.com" in url:
+        return await extract_glassdoor_job_data(url)
+    elif "imagene-ai.com" in url:
+        return await extract_imagene_job_data(url, fetched)
+    else:
+        return await extract_generic_job_data(url, fetched)
+
+async def extract_linkedin_job_data(url: str, job_id: Optional[str] = None, fetched: Optional[FetchedPage] = None) -> JobExtractionResponse:
     """
     Extract job data from LinkedIn job posting
     """
     try:
         # Extract job ID from URL if not provided
         if not job_id:
-            import re
             # Try to extract from /jobs/view/123456789/ pattern
-            view_match = re.search(r'/jobs/view/(\d+)/?', url)
+            view_match = LINKEDIN_JOB_VIEW_PATTERN.search(url)
             if view_match:
                 job_id = view_match.group(1)
         
@@ -67,162 +370,37 @@ async def extract_linkedin_job_data(url: str, job_id: Optional[str] = None) -> J
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        if fetched is None:
+            fetched = await fetch_page(url, LINKEDIN_RULES, headers)
+        fetched.response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        page = fetched.page
+        fields = page.extract(LINKEDIN_RULES)
         
-        # Extract job title - try multiple selectors
-        job_title = None
-        title_selectors = [
-            'h1.top-card-layout__title',
-            'h1[data-test-id="job-title"]',
-            'h1.job-title',
-            'h1'
-        ]
-        for selector in title_selectors:
-            title_element = soup.select_one(selector)
-            if title_element:
-                job_title = title_element.get_text(strip=True)
-                break
-        
-        # Extract company name - try multiple selectors
-        company_name = None
-        company_selectors = [
-            'a.topcard__org-name-link',
-            'a[data-test-id="company-name"]',
-            'a.job-company-name',
-            'span.company-name'
-        ]
-        for selector in company_selectors:
-            company_element = soup.select_one(selector)
-            if company_element:
-                company_name = company_element.get_text(strip=True)
-                break
-        
-        # Extract location - try multiple selectors
-        location = None
-        location_selectors = [
-            'span.topcard__flavor--bullet',
-            'span[data-test-id="job-location"]',
-            'span.job-location',
-            'span.location'
-        ]
-        for selector in location_selectors:
-            location_element = soup.select_one(selector)
-            if location_element:
-                location = location_element.get_text(strip=True)
-                break
-        
-        # Extract job description - try multiple selectors
-        job_description = None
-        desc_selectors = [
-            'div.description__text',
-            'div[data-test-id="job-description"]',
-            'div.job-description',
-            'div.description'
-        ]
-        for selector in desc_selectors:
-            desc_element = soup.select_one(selector)
-            if desc_element:
-                job_description = desc_element.get_text(strip=True)
-                break
-        
-        # Extract salary if available
-        salary = None
-        salary_selectors = [
-            'span.salary',
-            'span[data-test-id="salary"]',
-            'div.salary-info'
-        ]
-        for selector in salary_selectors:
-            salary_element = soup.select_one(selector)
-            if salary_element:
-                salary_text = salary_element.get_text(strip=True)
-                # Convert to shekels if it's in dollars
-                if '$' in salary_text:
-                    salary = salary_text.replace('$', '₪')
-                else:
-                    salary = salary_text
-                break
-        
-        # Extract company logo
-        company_logo = None
-        logo_selectors = [
-            'img.topcard__org-name-link img',
-            'img.company-logo',
-            'img[data-test-id="company-logo"]',
-            'img.org-top-card-primary-content__logo',
-            'img.top-card-layout__entity-image',
-            'img.artdeco-entity-lockup__image'
-        ]
-        for selector in logo_selectors:
-            logo_element = soup.select_one(selector)
-            if logo_element:
-                logo_src = logo_element.get('src') or logo_element.get('data-src') or logo_element.get('data-lazy-src')
-                if logo_src:
-                    # Convert relative URLs to absolute
-                    if logo_src.startswith('//'):
-                        company_logo = f"https:{logo_src}"
-                    elif logo_src.startswith('/'):
-                        company_logo = f"https://www.linkedin.com{logo_src}"
-                    elif logo_src.startswith('http'):
-                        company_logo = logo_src
-                    break
+        company_name = fields['company']
         
-        # If no logo found from LinkedIn, try to get it from company website using Clearbit
-        if not company_logo and company_name:
-            # Clean company name for Clearbit API
-            clean_company_name = company_name.lower().replace(' ', '').replace('inc', '').replace('llc', '').replace('corp', '')
-            company_logo = f"https://logo.clearbit.com/{clean_company_name}.com"
-        
-        # Generate a generic logo for any company if no logo found
-        if not company_logo and company_name:
-            # Create a simple SVG logo with company initial
-            company_initial = company_name[0].upper() if company_name else "C"
-            logo_svg = f'''<svg width="64" height="64" viewBox="0 0 64 64" fill="none" xmlns="http://www.w3.org/2000/svg">
-                <rect width="64" height="64" rx="8" fill="#4F46E5"/>
-                <text x="32" y="38" font-family="Arial, sans-serif" font-size="24" font-weight="bold" fill="white" text-anchor="middle">{company_initial}</text>
-            </svg>'''
-            import base64
-            company_logo = f"data:image/svg+xml;base64,{base64.b64encode(logo_svg.encode()).decode()}"
-        
-        # Extract additional company information from the page
-        industry = None
-        company_size = None
-        founded = None
-        website = None
-        
-        # Try to extract industry information
-        industry_element = soup.select_one('span[data-test-id="industry"]') or soup.select_one('.job-details-jobs-unified-top-card__job-insight')
-        if industry_element:
-            industry = industry_element.get_text(strip=True)
-        
-        # Try to extract company size
-        size_element = soup.select_one('span[data-test-id="company-size"]')
-        if size_element:
-            company_size = size_element.get_text(strip=True)
-        
-        # Try to extract founded year
-        founded_element = soup.select_one('span[data-test-id="founded"]')
-        if founded_element:
-            founded = founded_element.get_text(strip=True)
-        
-        # Try to extract website
-        website_element = soup.select_one('a[data-test-id="company-website"]')
-        if website_element:
-            website = website_element.get('href')
+        # Convert salary to shekels if it's in dollars
+        salary = fields['salary']
+        if salary and '$' in salary:
+            salary = salary.replace('$', '₪')
+        
+        # Prefer the logo on the page; otherwise resolve (and remember) one for the company
+        company_logo = await company_logos.resolve(
+            company_name,
+            website=fields['website'],
+            page_logo=page.absolute_url(fields['company_logo'])
+        )
         
         return JobExtractionResponse(
             company=company_name,
-            position=job_title,
-            location=location,
+            position=fields['position'],
+            location=fields['location'],
             salary=salary,
-            position_description=job_description,
-            industry=industry,
-            company_size=company_size,
-            founded=founded,
-            website=website,
+            position_description=fields['position_description'],
+            industry=fields['industry'],
+            company_size=fields['company_size'],
+            founded=fields['founded'],
+            website=fields['website'],
             company_logo=company_logo,
             completion_method='linkedin'
         )
@@ -231,7 +409,7 @@ async def extract_linkedin_job_data(url: str, job_id: Optional[str] = None) -> J
         # Return basic info extracted from URL
         return extract_basic_info_from_url(url)
 
-async def extract_indeed_job_data(url: str) -> JobExtractionResponse:
+async def extract_indeed_job_data(url: str, fetched: Optional[FetchedPage] = None) -> JobExtractionResponse:
     """
     Extract job data from Indeed job posting
     """
@@ -240,35 +418,17 @@ async def extract_indeed_job_data(url: str) -> JobExtractionResponse:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if fetched is None:
+            fetched = await fetch_page(url, INDEED_RULES, headers)
+        fetched.response.raise_for_status()
         
-        # Extract job title
-        job_title = None
-        title_element = soup.find('h1', class_='jobsearch-JobInfoHeader-title')
-        if title_element:
-            job_title = title_element.get_text(strip=True)
-        
-        # Extract company name
-        company_name = None
-        company_element = soup.find('div', class_='jobsearch-CompanyInfoContainer')
-        if company_element:
-            company_link = company_element.find('a')
-            if company_link:
-                company_name = company_link.get_text(strip=True)
-        
-        # Extract location
-        location = None
-        location_element = soup.find('div', class_='jobsearch-JobInfoHeader-subtitle')
-        if location_element:
-            location = location_element.get_text(strip=True)
+        page = fetched.page
+        fields = page.extract(INDEED_RULES)
         
         return JobExtractionResponse(
-            company=company_name,
-            position=job_title,
-            location=location,
+            company=fields['company'],
+            position=fields['position'],
+            location=fields['location'],
             completion_method='career_page'
         )
         
@@ -281,7 +441,7 @@ async def extract_glassdoor_job_data(url: str) -> JobExtractionResponse:
     """
     return extract_basic_info_from_url(url)
 
-async def extract_imagene_job_data(url: str) -> JobExtractionResponse:
+async def extract_imagene_job_data(url: str, fetched: Optional[FetchedPage] = None) -> JobExtractionResponse:
     """
     Extract job data from Imagene AI career page
     """
@@ -290,10 +450,12 @@ async def extract_imagene_job_data(url: str) -> JobExtractionResponse:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        if fetched is None:
+            fetched = await fetch_page(url, IMAGENE_RULES, headers)
+        fetched.response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        page = fetched.page
+        page_text = page.text
         
         # Based on the web search results, we know the structure:
         # Job title: "Student Software Engineer"
@@ -301,77 +463,59 @@ async def extract_imagene_job_data(url: str) -> JobExtractionResponse:
         # Location: "Tel Aviv"
         # Type: "Hourly"
         
-        # Extract job title - look for the specific pattern
-        job_title = None
-        page_text = soup.get_text()
-        
         # Look for "Student Software Engineer" pattern
-        import re
-        title_match = re.search(r'Student Software Engineer', page_text)
+        job_title = None
+        title_match = IMAGENE_TITLE_PATTERN.search(page_text)
         if title_match:
             job_title = title_match.group(0)
         
         # If not found, try other engineering titles
         if not job_title:
-            title_patterns = [
-                r'([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)',  # "Student Software Engineer"
-                r'([A-Z][a-z]+ [A-Z][a-z]+)',  # "Software Engineer"
-            ]
-            for pattern in title_patterns:
-                matches = re.findall(pattern, page_text)
-                for match in matches:
-                    if any(word in match.lower() for word in ['engineer', 'developer', 'manager', 'analyst']):
-                        job_title = match
-                        break
-                if job_title:
-                    break
+            job_title = page.find_pattern(
+                TITLE_PATTERNS[:2],
+                lambda match: any(word in match.lower() for word in ['engineer', 'developer', 'manager', 'analyst'])
+            )
         
         # Company name is always "Imagene AI"
         company_name = "Imagene AI"
         
         # Extract location - look for "Tel Aviv"
         location = None
-        location_match = re.search(r'Tel Aviv', page_text)
+        location_match = IMAGENE_LOCATION_PATTERN.search(page_text)
         if location_match:
             location = location_match.group(0)
         
         # Extract job description - get the main content
-        job_description = None
-        # Look for the main content area
-        main_content = soup.find('main') or soup.find('div', class_='content') or soup.find('div', class_='job-content')
-        if main_content:
-            job_description = main_content.get_text(strip=True)
+        job_description = page.extract(IMAGENE_RULES)['position_description']
         
         # If no main content found, try to get the job description from the page text
         if not job_description or len(job_description) < 100:
-            # Look for content after the job title
-            page_text = soup.get_text()
             # Find the position of the job title and get content after it
             title_pos = page_text.find(job_title) if job_title else -1
             if title_pos != -1:
-                # Get content after the job title
+                # Take the first 2000 characters after the job title as job description
                 remaining_text = page_text[title_pos + len(job_title):]
-                # Take the first 2000 characters as job description
                 job_description = remaining_text[:2000].strip()
         
         # Extract company description from the "About Imagene" section
         company_description = None
-        about_section = soup.find('h2', string=re.compile(r'About Imagene', re.I))
-        if about_section:
+        about_section = next(
+            (h2 for h2 in page.root.iter('h2') if IMAGENE_ABOUT_PATTERN.search(h2.text_content())),
+            None
+        )
+        if about_section is not None:
             # Get the next few paragraphs
-            next_elements = about_section.find_next_siblings()
+            next_elements = [elem for elem in about_section.itersiblings() if isinstance(elem.tag, str)]
             about_text = []
             for elem in next_elements[:3]:  # Take next 3 elements
-                if elem.name in ['p', 'div']:
-                    about_text.append(elem.get_text(strip=True))
+                if elem.tag in ['p', 'div']:
+                    about_text.append(element_text(elem))
             if about_text:
                 company_description = ' '.join(about_text)
         
         # If no about section found, try to extract from page text
         if not company_description:
-            page_text = soup.get_text()
-            # Look for "About Imagene" text and get content after it
-            about_match = re.search(r'About Imagene.*?(?=\n\n|\n[A-Z]|$)', page_text, re.DOTALL)
+            about_match = IMAGENE_ABOUT_TEXT_PATTERN.search(page_text)
             if about_match:
                 company_description = about_match.group(0).strip()
         
@@ -397,7 +541,7 @@ async def extract_imagene_job_data(url: str) -> JobExtractionResponse:
         # Fall back to basic extraction
         return extract_basic_info_from_url(url)
 
-async def extract_generic_job_data(url: str) -> JobExtractionResponse:
+async def extract_generic_job_data(url: str, fetched: Optional[FetchedPage] = None) -> JobExtractionResponse:
     """
     Extract job data from generic career pages
     """
@@ -406,72 +550,25 @@ async def extract_generic_job_data(url: str) -> JobExtractionResponse:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        if fetched is None:
+            fetched = await fetch_page(url, GENERIC_RULES, headers)
+        fetched.response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract job title - try multiple selectors
-        job_title = None
-        title_selectors = [
-            'h1',
-            'h2',
-            '.job-title',
-            '.position-title',
-            '[data-testid="job-title"]',
-            '.title',
-            'h3',  # Some pages use h3 for job titles
-            '.position',
-            '.role-title'
-        ]
-        for selector in title_selectors:
-            title_element = soup.select_one(selector)
-            if title_element:
-                job_title = title_element.get_text(strip=True)
-                # Filter out common page titles that aren't job titles
-                if (job_title and len(job_title) > 3 and 
-                    not any(word in job_title.lower() for word in ['careers', 'jobs', 'home', 'about', 'contact'])):
-                    break
+        # Parse once and pull every selector-based field in a single tree walk
+        page = fetched.page
+        fields = page.extract(GENERIC_RULES)
         
         # If no job title found with selectors, try to extract from page text
+        job_title = fields['position']
         if not job_title:
-            page_text = soup.get_text()
-            import re
-            # Look for patterns like "Student Software Engineer" or similar job titles
-            job_title_patterns = [
-                r'([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)',  # "Student Software Engineer"
-                r'([A-Z][a-z]+ [A-Z][a-z]+)',  # "Software Engineer"
-                r'([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)',  # "Senior Software Engineer"
-            ]
-            for pattern in job_title_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    for match in matches:
-                        if any(word in match.lower() for word in ['engineer', 'developer', 'manager', 'analyst', 'designer', 'specialist']):
-                            job_title = match
-                            break
-                    if job_title:
-                        break
-        
-        # Extract company name from URL or page
-        company_name = None
-        company_selectors = [
-            '.company-name',
-            '.employer-name',
-            '[data-testid="company-name"]',
-            'title'
-        ]
-        for selector in company_selectors:
-            company_element = soup.select_one(selector)
-            if company_element:
-                company_text = company_element.get_text(strip=True)
-                if company_text and len(company_text) > 3:
-                    company_name = company_text
-                    break
+            job_title = page.find_pattern(
+                TITLE_PATTERNS,
+                lambda match: any(word in match.lower() for word in ['engineer', 'developer', 'manager', 'analyst', 'designer', 'specialist'])
+            )
         
         # If no company name found, try to extract from URL
+        company_name = fields['company']
         if not company_name:
-            from urllib.parse import urlparse
             parsed_url = urlparse(url)
             hostname = parsed_url.hostname or ""
             if hostname:
@@ -484,160 +581,29 @@ async def extract_generic_job_data(url: str) -> JobExtractionResponse:
         
         # If still no company name, try to extract from page text
         if not company_name:
-            page_text = soup.get_text()
-            import re
-            # Look for company name patterns
-            company_patterns = [
-                r'([A-Z][a-z]+ AI)',  # "Imagene AI"
-                r'([A-Z][a-z]+ [A-Z][a-z]+)',  # "Company Name"
-                r'([A-Z][a-z]+ Inc)',  # "Company Inc"
-                r'([A-Z][a-z]+ LLC)',  # "Company LLC"
-            ]
-            for pattern in company_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    for match in matches:
-                        if not any(word in match.lower() for word in ['careers', 'jobs', 'about', 'contact', 'student', 'software', 'engineer']):
-                            company_name = match
-                            break
-                    if company_name:
-                        break
-        
-        # Extract location
-        location = None
-        location_selectors = [
-            '.location',
-            '.job-location',
-            '[data-testid="location"]',
-            '.address',
-            '.city',
-            '.place'
-        ]
-        for selector in location_selectors:
-            location_element = soup.select_one(selector)
-            if location_element:
-                location = location_element.get_text(strip=True)
-                break
-        
-        # If no location found, try to find it in the text content
-        if not location:
-            # Look for common location patterns in the page text
-            page_text = soup.get_text()
-            import re
-            location_patterns = [
-                r'([A-Z][a-z]+ [A-Z][a-z]+)',  # "Tel Aviv", "New York"
-                r'([A-Z][a-z]+,\s*[A-Z]{2})',  # "San Francisco, CA"
-                r'([A-Z][a-z]+,\s*[A-Z][a-z]+)',  # "London, UK"
-            ]
-            for pattern in location_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    # Take the first reasonable match
-                    for match in matches:
-                        if len(match) > 3 and not any(word in match.lower() for word in ['careers', 'jobs', 'about']):
-                            location = match
-                            break
-                    if location:
-                        break
-        
-        # Extract job description
-        job_description = None
-        desc_selectors = [
-            '.job-description',
-            '.description',
-            '.job-content',
-            '.position-description',
-            '[data-testid="job-description"]',
-            'main',
-            '.content'
-        ]
-        for selector in desc_selectors:
-            desc_element = soup.select_one(selector)
-            if desc_element:
-                # Get all text content
-                job_description = desc_element.get_text(strip=True)
-                if job_description and len(job_description) > 50:  # Make sure it's substantial
-                    break
+            company_name = page.find_pattern(
+                COMPANY_PATTERNS,
+                lambda match: not any(word in match.lower() for word in ['careers', 'jobs', 'about', 'contact', 'student', 'software', 'engineer'])
+            )
         
-        # Extract salary if available
-        salary = None
-        salary_selectors = [
-            '.salary',
-            '.compensation',
-            '.pay',
-            '[data-testid="salary"]'
-        ]
-        for selector in salary_selectors:
-            salary_element = soup.select_one(selector)
-            if salary_element:
-                salary_text = salary_element.get_text(strip=True)
-                if salary_text and ('$' in salary_text or '₪' in salary_text or 'salary' in salary_text.lower()):
-                    salary = salary_text
-                    break
+        # If no location found, look for common location patterns in the page text
+        location = fields['location']
+        if not location:
+            location = page.find_pattern(
+                LOCATION_PATTERNS,
+                lambda match: len(match) > 3 and not any(word in match.lower() for word in ['careers', 'jobs', 'about'])
+            )
         
-        # Extract company logo
-        company_logo = None
-        logo_selectors = [
-            'img[alt*="logo"]',
-            'img[alt*="Logo"]',
-            '.logo img',
-            '.company-logo img',
-            'img[src*="logo"]',
-            'img[class*="logo"]'
-        ]
-        for selector in logo_selectors:
-            logo_element = soup.select_one(selector)
-            if logo_element:
-                logo_src = logo_element.get('src') or logo_element.get('data-src')
-                if logo_src:
-                    # Convert relative URLs to absolute
-                    if logo_src.startswith('//'):
-                        company_logo = f"https:{logo_src}"
-                    elif logo_src.startswith('/'):
-                        from urllib.parse import urljoin
-                        company_logo = urljoin(url, logo_src)
-                    elif logo_src.startswith('http'):
-                        company_logo = logo_src
-                    break
-        
-        # Try to get company logo from Clearbit if not found
-        if not company_logo and company_name:
-            clean_company_name = company_name.lower().replace(' ', '').replace('inc', '').replace('llc', '').replace('corp', '')
-            company_logo = f"https://logo.clearbit.com/{clean_company_name}.com"
-        
-        # Generate a generic logo if still no logo found
-        if not company_logo and company_name:
-            company_initial = company_name[0].upper() if company_name else "C"
-            logo_svg = f'''<svg width="64" height="64" viewBox="0 0 64 64" fill="none" xmlns="http://www.w3.org/2000/svg">
-                <rect width="64" height="64" rx="8" fill="#4F46E5"/>
-                <text x="32" y="38" font-family="Arial, sans-serif" font-size="24" font-weight="bold" fill="white" text-anchor="middle">{company_initial}</text>
-            </svg>'''
-            import base64
-            company_logo = f"data:image/svg+xml;base64,{base64.b64encode(logo_svg.encode()).decode()}"
-        
-        # Extract company description/about section
-        company_description = None
-        about_selectors = [
-            '.about',
-            '.company-about',
-            '.about-us',
-            '.company-description',
-            '[data-testid="about"]'
-        ]
-        for selector in about_selectors:
-            about_element = soup.select_one(selector)
-            if about_element:
-                company_description = about_element.get_text(strip=True)
-                if company_description and len(company_description) > 50:
-                    break
+        # Prefer the logo on the page; otherwise resolve (and remember) one for the company
+        company_logo = await company_logos.resolve(company_name, page_logo=page.absolute_url(fields['company_logo']))
         
         return JobExtractionResponse(
             company=company_name,
             position=job_title,
             location=location,
-            salary=salary,
-            company_description=company_description,
-            position_description=job_description,
+            salary=fields['salary'],
+            company_description=fields['company_description'],
+            position_description=fields['position_description'],
             company_logo=company_logo,
             completion_method='career_page'
         )
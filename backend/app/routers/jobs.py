@@ -1,17 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.api.deps import get_db, get_current_user
 from app.models.user import User
-from app.services.jobs import JobService
+from app.services.jobs import JobService, InvalidCursorError
+from app.services.tag_index import parse_tags
+from app.services.job_import import detect_format, iter_rows
+from app.schemas.tag import TagCount
 from app.schemas.job import (
     JobCreate, 
     JobUpdate, 
     JobResponse, 
+    JobSummary,
+    JobSearchResponse,
+    JobSearchResult,
     ContactCreate, 
     ContactResponse,
     JobBulkUpdate,
-    JobStats
+    JobStats,
+    JobImportResult,
+    JobBulkDelete,
+    JobBulkDeleteResult,
+    ContactBulkCreate,
+    ContactBulkResult,
+    JobBoard,
+    BoardLane,
+    JobMoveBatch,
+    JobMoveResult
 )
 
 router = APIRouter()
@@ -29,20 +44,112 @@ def create_job(
     return job
 
 
-@router.get("/", response_model=List[JobResponse])
+@router.post("/import", response_model=JobImportResult)
+def import_jobs(
+    file: UploadFile = File(..., description="CSV with a header row, or NDJSON with one job object per line"),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$", description="Defaults to the file extension/type, else CSV"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Bulk import job applications from a spreadsheet export (CSV) or NDJSON.
+    Rows are validated one at a time and inserted in batches in a single
+    transaction; invalid rows are reported by line number and skipped.
+    """
+    job_service = JobService(db)
+    rows = iter_rows(file.file, format or detect_format(file.filename, file.content_type))
+    return job_service.import_jobs(current_user.id, rows)
+
+
+@router.get("/", response_model=List[JobSummary])
 def get_jobs(
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by job status"),
     limit: int = Query(100, ge=1, le=1000, description="Number of jobs to return"),
-    offset: int = Query(0, ge=0, description="Number of jobs to skip"),
+    offset: int = Query(0, ge=0, description="Number of jobs to skip (ignored when a cursor is given)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    tags: Optional[str] = Query(None, description="Comma-separated tags to filter by"),
+    match: str = Query("any", pattern="^(any|all)$", description="Match jobs with any or all of the tags"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all jobs for the current user, optionally filtered by status"""
+    """
+    Get jobs for the current user, newest first, optionally filtered by status.
+    Jobs are summaries without the long text fields; GET /jobs/{id} has those.
+    Without an offset the list is keyset-paginated: the cursor for the next
+    page is returned in the X-Next-Cursor header (absent on the last page).
+    """
     job_service = JobService(db)
-    jobs = job_service.get_jobs(current_user.id, status, limit, offset)
+    if offset and not cursor:
+        return job_service.get_jobs(current_user.id, status, limit, offset, parse_tags(tags), match)
+    
+    try:
+        jobs, next_cursor = job_service.get_jobs_page(current_user.id, status, limit, cursor, parse_tags(tags), match)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return jobs
 
 
+@router.get("/board", response_model=JobBoard)
+def get_job_board(
+    lane_limit: int = Query(20, ge=1, le=100, description="Cards to return per lane"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Kanban board: each status lane's count and first cards, with a cursor per lane for more"""
+    job_service = JobService(db)
+    return job_service.get_board(current_user.id, lane_limit)
+
+
+@router.get("/board/{status}", response_model=BoardLane)
+def get_job_board_lane(
+    status: str,
+    cursor: Optional[str] = Query(None, description="next_cursor of the lane"),
+    limit: int = Query(20, ge=1, le=100, description="Cards to return"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Load more cards of one board lane"""
+    job_service = JobService(db)
+    try:
+        return job_service.get_board_lane(current_user.id, status, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/search", response_model=JobSearchResponse)
+def search_jobs(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search for; the last one matches as a prefix"),
+    limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Full-text search over company, position, location, tags, notes and descriptions"""
+    job_service = JobService(db)
+    matches, next_offset = job_service.search_jobs(current_user.id, q, limit, offset)
+    return JobSearchResponse(
+        results=[
+            JobSearchResult(job=JobSummary.model_validate(job), score=hit.score, snippet=hit.snippet)
+            for job, hit in matches
+        ],
+        next_offset=next_offset
+    )
+
+
+@router.get("/tags", response_model=List[TagCount])
+def get_job_tags(
+    limit: int = Query(100, ge=1, le=500, description="Number of tags to return"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Tag cloud: the current user's job tags with counts, most used first"""
+    job_service = JobService(db)
+    return job_service.get_tag_counts(current_user.id, limit)
+
+
 @router.get("/stats", response_model=JobStats)
 def get_job_stats(
     db: Session = Depends(get_db),
@@ -54,6 +161,39 @@ def get_job_stats(
     return stats
 
 
+@router.delete("/bulk", response_model=JobBulkDeleteResult)
+def bulk_delete_jobs(
+    bulk_data: JobBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Delete many jobs at once; ids that aren't the user's jobs are reported as not_found"""
+    job_service = JobService(db)
+    return job_service.bulk_delete_jobs(current_user.id, bulk_data.job_ids)
+
+
+@router.post("/contacts/bulk", response_model=ContactBulkResult)
+def bulk_add_contacts(
+    bulk_data: ContactBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Add many contacts across the user's jobs at once, with a result per contact"""
+    job_service = JobService(db)
+    return job_service.bulk_add_contacts(current_user.id, bulk_data.contacts)
+
+
+@router.patch("/moves", response_model=JobMoveResult)
+def move_jobs(
+    move_data: JobMoveBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Apply a batch of board moves (lane and position), checked against each job's version"""
+    job_service = JobService(db)
+    return job_service.move_jobs(current_user.id, move_data.moves)
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 def get_job(
     job_id: int,
@@ -1,16 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_user
 from app.models.user import User
 from app.schemas.problem import ProblemCreate, ProblemUpdate, ProblemResponse
-from app.schemas.problem_autofill import ProblemAutoFillRequest, ProblemAutoFillResponse
+from app.schemas.tag import TagCount
+from app.schemas.problem_autofill import (
+    ProblemAutoFillRequest,
+    ProblemAutoFillResponse,
+    ProblemSuggestResponse,
+    ProblemAutoFillBatchRequest,
+    ProblemAutoFillBatchItem,
+    ProblemAutoFillBatchResponse
+)
 from app.services.problems import (
     list_problems as svc_list, 
     create_problem as svc_create,
     get_problem as svc_get,
     update_problem as svc_update,
-    delete_problem as svc_delete
+    delete_problem as svc_delete,
+    bulk_create_problems as svc_bulk_create,
+    topic_counts as svc_topic_counts
 )
+from app.services.tag_index import parse_tags
 from app.services.problem_autofill import problem_autofill_service
 
 router = APIRouter(prefix="/problems", tags=["problems"])
@@ -19,10 +31,35 @@ router = APIRouter(prefix="/problems", tags=["problems"])
 def list_problems(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    tags: Optional[str] = Query(None, description="Comma-separated topics to filter by"),
+    match: str = Query("any", pattern="^(any|all)$", description="Match problems with any or all of the topics"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return svc_list(db, current_user.id, skip=skip, limit=limit, topics=parse_tags(tags), match=match)
+
+@router.get("/tags", response_model=list[TagCount])
+def list_problem_topics(
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    return svc_list(db, current_user.id, skip=skip, limit=limit)
+    """Topic cloud: the user's problem topics with counts, most used first"""
+    return svc_topic_counts(db, current_user.id, limit)
+
+@router.get("/autofill/suggest", response_model=ProblemSuggestResponse)
+async def suggest_problem_names(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=25),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Typeahead suggestions for problem names from the in-memory LeetCode catalog.
+    Past the user lookup it never touches the database or the network, so it's
+    cheap enough per keystroke.
+    """
+    suggestions = problem_autofill_service.suggest_problems(q, limit)
+    return ProblemSuggestResponse(query=q, suggestions=suggestions)
 
 @router.get("/{problem_id}", response_model=ProblemResponse)
 def get_problem(
@@ -101,3 +138,56 @@ def autofill_problem_details(
             error=f"Error fetching problem details: {str(e)}"
         )
 
+@router.post("/autofill/batch", response_model=ProblemAutoFillBatchResponse)
+def autofill_problem_details_batch(
+    request: ProblemAutoFillBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Auto-fill a whole list of problem names in one pass, optionally
+    inserting every resolved problem with a single bulk insert
+    """
+    names = [name.strip() for name in request.problem_names]
+    valid_names = [name for name in names if len(name) >= 2]
+    details_by_name = dict(zip(
+        valid_names,
+        problem_autofill_service.extract_many_problem_details(valid_names)
+    ))
+    
+    results = []
+    to_create = []
+    for name in names:
+        if len(name) < 2:
+            results.append(ProblemAutoFillBatchItem(
+                problem_name=name,
+                success=False,
+                error="Problem name must be at least 2 characters long"
+            ))
+            continue
+        
+        details = details_by_name.get(name)
+        if not details:
+            results.append(ProblemAutoFillBatchItem(
+                problem_name=name,
+                success=False,
+                error="No matching problem found on supported platforms"
+            ))
+            continue
+        
+        results.append(ProblemAutoFillBatchItem(problem_name=name, success=True, data=details))
+        to_create.append(ProblemCreate(
+            name=details['name'],
+            topics=details['topics'],
+            difficulty=details['difficulty'],
+            status=request.status,
+            link=details['link']
+        ))
+    
+    created = svc_bulk_create(db, to_create, current_user.id) if request.create_problems else []
+    
+    return ProblemAutoFillBatchResponse(
+        results=results,
+        resolved=len(to_create),
+        created=created
+    )
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator, field_serializer
 from typing import List, Optional
 from datetime import datetime
+from app.core.logo_urls import public_logo_url, stored_logo_url
 
 
 # Contact schemas
@@ -53,6 +54,10 @@ class JobBase(BaseModel):
     application_url: Optional[str] = Field(None, description="Application URL (LinkedIn or career page)")
     completion_method: Optional[str] = Field(None, description="How the application was completed (linkedin, career_page, email, other)")
 
+    @validator('company_logo')
+    def store_logo_path(cls, v):
+        return stored_logo_url(v)
+
 
 class JobCreate(JobBase):
     contacts: Optional[List[ContactCreate]] = Field(None, description="List of contacts for this job")
@@ -78,18 +83,97 @@ class JobUpdate(BaseModel):
     application_url: Optional[str] = None
     completion_method: Optional[str] = None
 
+    @validator('company_logo')
+    def store_logo_path(cls, v):
+        return stored_logo_url(v)
+
 
 class JobResponse(JobBase):
     id: int
     user_id: int
+    lane_position: Optional[float] = None
+    version: int = 1
+    created_at: datetime
+    updated_at: datetime
+    contacts: List[ContactResponse] = []
+
+    @field_serializer('company_logo')
+    def serialize_company_logo(self, company_logo: Optional[str]) -> Optional[str]:
+        return public_logo_url(company_logo)
+
+    class Config:
+        from_attributes = True
+
+
+class JobSummary(BaseModel):
+    """List projection of a job: everything but the long free-text fields
+    (note, company and position descriptions), which only GET /jobs/{id} returns"""
+    id: int
+    user_id: int
+    company: str
+    position: str
+    location: Optional[str] = None
+    salary: Optional[str] = None
+    tags: Optional[List[str]] = None
+    status: str
+    applied_date: Optional[datetime] = None
+    interview_time: Optional[datetime] = None
+    company_logo: Optional[str] = None
+    is_referral: bool = False
+    referrer_name: Optional[str] = None
+    cv: Optional[str] = None
+    cover_letter: Optional[str] = None
+    application_url: Optional[str] = None
+    completion_method: Optional[str] = None
+    lane_position: Optional[float] = None
+    version: int = 1
     created_at: datetime
     updated_at: datetime
     contacts: List[ContactResponse] = []
 
+    @field_serializer('company_logo')
+    def serialize_company_logo(self, company_logo: Optional[str]) -> Optional[str]:
+        return public_logo_url(company_logo)
+
     class Config:
         from_attributes = True
 
 
+class BoardLane(BaseModel):
+    status: str
+    count: int = Field(..., description="Jobs in this lane")
+    jobs: List[JobSummary]
+    next_cursor: Optional[str] = Field(None, description="Pass to GET /jobs/board/{status} for the next cards")
+
+
+class JobBoard(BaseModel):
+    lanes: List[BoardLane]
+
+
+class JobSearchResult(BaseModel):
+    job: JobSummary
+    score: float = Field(..., description="Relevance, higher is better")
+    snippet: str = Field(..., description="Best matching text with matches wrapped in <mark></mark>")
+
+
+class JobSearchResponse(BaseModel):
+    results: List[JobSearchResult]
+    next_offset: Optional[int] = Field(None, description="Offset of the next page, absent on the last page")
+
+
+# Bulk import
+class JobImportError(BaseModel):
+    row: int = Field(..., description="Line number in the uploaded file")
+    error: str
+
+
+class JobImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[JobImportError] = Field(default_factory=list, description="Row errors, capped; see errors_truncated")
+    errors_truncated: bool = False
+
+
 # Bulk operations
 class JobBulkUpdate(BaseModel):
     job_ids: List[int] = Field(..., description="List of job IDs to update")
@@ -97,6 +181,65 @@ class JobBulkUpdate(BaseModel):
     tags: Optional[List[str]] = Field(None, description="New tags for all jobs")
 
 
+class JobBulkDelete(BaseModel):
+    job_ids: List[int] = Field(..., min_length=1, max_length=1000, description="List of job IDs to delete")
+
+
+class JobBulkDeleteOutcome(BaseModel):
+    job_id: int
+    status: str = Field(..., description="deleted or not_found")
+
+
+class JobBulkDeleteResult(BaseModel):
+    deleted: int
+    results: List[JobBulkDeleteOutcome]
+
+
+class JobMove(BaseModel):
+    job_id: int
+    status: str = Field(..., description="Lane the card is in after the move")
+    lane_position: float = Field(..., description="Position within the lane, e.g. the midpoint of its new neighbours")
+    version: int = Field(..., description="The job's version the move was made against")
+
+
+class JobMoveBatch(BaseModel):
+    moves: List[JobMove] = Field(..., min_length=1, max_length=1000, description="Later moves of the same job replace earlier ones")
+
+
+class JobMoveOutcome(BaseModel):
+    job_id: int
+    result: str = Field(..., description="moved, conflict or not_found")
+    status: Optional[str] = Field(None, description="The job's lane now")
+    lane_position: Optional[float] = None
+    version: Optional[int] = Field(None, description="The job's version now")
+
+
+class JobMoveResult(BaseModel):
+    moved: int
+    results: List[JobMoveOutcome]
+
+
+class ContactBulkItem(ContactCreate):
+    job_id: int = Field(..., description="Job to attach the contact to")
+
+
+class ContactBulkCreate(BaseModel):
+    contacts: List[ContactBulkItem] = Field(..., min_length=1, max_length=1000)
+
+
+class ContactBulkOutcome(BaseModel):
+    index: int = Field(..., description="Position in the request's contacts list")
+    job_id: int
+    success: bool
+    contact: Optional[ContactResponse] = None
+    error: Optional[str] = None
+
+
+class ContactBulkResult(BaseModel):
+    created: int
+    results: List[ContactBulkOutcome]
+
+
 # Statistics
 class JobStats(BaseModel):
     total_jobs: int
@@ -104,3 +247,5 @@ class JobStats(BaseModel):
     jobs_by_company: dict
     recent_applications: int
     interview_rate: float
+    applications_by_week: dict = Field(default_factory=dict, description="Applications per ISO week (e.g. 2026-W42), oldest first")
+    referral_conversion: dict = Field(default_factory=dict, description="Jobs and interview/offer conversion for referral and non_referral jobs")
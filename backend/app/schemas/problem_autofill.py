@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
+from app.schemas.problem import ProblemStatus, ProblemResponse
 
 class ProblemAutoFillRequest(BaseModel):
     problem_name: str
@@ -11,3 +12,31 @@ class ProblemAutoFillResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+class ProblemSuggestion(BaseModel):
+    name: str
+    slug: str
+    link: str
+    difficulty: str
+    score: float
+
+class ProblemSuggestResponse(BaseModel):
+    query: str
+    suggestions: List[ProblemSuggestion] = []
+
+
+class ProblemAutoFillBatchRequest(BaseModel):
+    problem_names: List[str] = Field(..., min_length=1, max_length=500)
+    create_problems: bool = Field(default=False, description="Insert every resolved problem for the current user")
+    status: ProblemStatus = ProblemStatus.NOT_STARTED
+
+class ProblemAutoFillBatchItem(BaseModel):
+    problem_name: str
+    success: bool
+    data: Optional[dict] = None
+    error: Optional[str] = None
+
+class ProblemAutoFillBatchResponse(BaseModel):
+    results: List[ProblemAutoFillBatchItem]
+    resolved: int
+    created: List[ProblemResponse] = []
@@ -0,0 +1,234 @@
+import html
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.logo_urls import AVATAR_PATH, stored_logo_url
+from app.db.session import SessionLocal
+from app.models.company_logo import CompanyLogo
+from app.services.http_client import http_client
+
+CLEARBIT_LOGO_URL = "https://logo.clearbit.com/{domain}"
+
+# Legal suffixes dropped (as whole words) before guessing a company's domain
+COMPANY_SUFFIXES = {'inc', 'llc', 'ltd', 'corp', 'corporation', 'co', 'gmbh', 'plc', 'limited', 'company'}
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+AVATAR_SVG = '''<svg width="64" height="64" viewBox="0 0 64 64" fill="none" xmlns="http://www.w3.org/2000/svg">
+    <rect width="64" height="64" rx="8" fill="#4F46E5"/>
+    <text x="32" y="38" font-family="Arial, sans-serif" font-size="24" font-weight="bold" fill="white" text-anchor="middle">{initial}</text>
+</svg>'''
+
+
+def normalize_domain(website: Optional[str]) -> Optional[str]:
+    if not website:
+        return None
+    host = (urlparse(website if '//' in website else f"//{website}").hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host or None
+
+
+def company_slug(company_name: Optional[str]) -> Optional[str]:
+    """"Acme Robotics, Inc." -> "acmerobotics" """
+    if not company_name:
+        return None
+    words = [word for word in _NON_ALNUM.split(company_name.lower()) if word]
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return ''.join(words) or None
+
+
+def company_logo_key(company_name: Optional[str] = None, website: Optional[str] = None) -> Optional[str]:
+    domain = normalize_domain(website)
+    if domain:
+        return f"domain:{domain}"
+    slug = company_slug(company_name)
+    return f"name:{slug}" if slug else None
+
+
+def generate_avatar_svg(company_name: Optional[str]) -> str:
+    initial = company_name.strip()[0].upper() if company_name and company_name.strip() else "C"
+    return AVATAR_SVG.format(initial=html.escape(initial))
+
+
+class CompanyLogoService:
+    """Resolves a company's logo once and remembers it.
+
+    Results live in the ``company_logos`` table keyed by domain (when the
+    company website is known) or normalized name, with a small in-memory
+    LRU in front. A logo found on the job page wins; otherwise Clearbit is
+    checked for the company's domain and, failing that, an initial-letter
+    avatar is generated and served from ``/api/company-logos/{id}.svg``
+    instead of being inlined as a data URI; its path is what gets stored,
+    see public_logo_url. Generated avatars are retried against Clearbit
+    after ``retry_after`` seconds. Database work runs in the threadpool so
+    resolving never blocks the event loop.
+    """
+
+    def __init__(self, max_cached: int, retry_after: int, timeout: float = 3.0):
+        self.max_cached = max_cached
+        self.retry_after = retry_after
+        self.timeout = timeout
+        # key -> (logo_url, source, resolved_at)
+        self._cache: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def resolve(
+        self,
+        company_name: Optional[str],
+        website: Optional[str] = None,
+        page_logo: Optional[str] = None
+    ) -> Optional[str]:
+        """Return the logo URL (or avatar path) to store on a job for this company"""
+        try:
+            return await self._resolve(company_name, website, page_logo)
+        except Exception as e:
+            # A logo is nice to have; never fail an extraction over it
+            print(f"Company logo resolve error: {e}")
+            return page_logo
+
+    async def _resolve(self, company_name: Optional[str], website: Optional[str], page_logo: Optional[str]) -> Optional[str]:
+        key = company_logo_key(company_name, website)
+        if key is None:
+            return page_logo
+
+        known = await self._cached(key)
+        if page_logo:
+            # Remember real logos, upgrading a generated avatar if we had one
+            if known is None or known[1] == 'generated':
+                await self._save(key, company_name, website, logo_url=page_logo, source='page')
+            return page_logo
+
+        if known and not (known[1] == 'generated' and time.time() - known[2] > self.retry_after):
+            return known[0]
+
+        domain = normalize_domain(website)
+        if domain is None:
+            domain = f"{company_slug(company_name)}.com"
+        clearbit_url = CLEARBIT_LOGO_URL.format(domain=domain)
+        if await self._logo_exists(clearbit_url):
+            return await self._save(key, company_name, website, logo_url=clearbit_url, source='clearbit')
+        if known:
+            # Still nothing better than the avatar; check again after another retry period
+            return await self._save(key, company_name, website, logo_url=known[0], source='generated')
+        return await self._save(key, company_name, website, svg=generate_avatar_svg(company_name or domain), source='generated')
+
+    def get_avatar_svg(self, logo_id: int) -> Optional[str]:
+        db = SessionLocal()
+        try:
+            logo = db.query(CompanyLogo).filter(CompanyLogo.id == logo_id).first()
+            return logo.svg if logo else None
+        finally:
+            db.close()
+
+    async def _logo_exists(self, url: str) -> bool:
+        try:
+            response = await http_client.head(url, timeout=self.timeout)
+        except (httpx.HTTPError, httpx.InvalidURL):
+            return False
+        return response.is_success
+
+    async def _cached(self, key: str) -> Optional[Tuple[str, str, float]]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                return entry
+        return await run_in_threadpool(self._load, key)
+
+    def _load(self, key: str) -> Optional[Tuple[str, str, float]]:
+        db = SessionLocal()
+        try:
+            logo = db.query(CompanyLogo).filter(CompanyLogo.key == key).first()
+            if logo is None:
+                return None
+            resolved_at = (logo.updated_at or logo.created_at).replace(tzinfo=timezone.utc).timestamp()
+            entry = (stored_logo_url(logo.logo_url), logo.source, resolved_at)
+        finally:
+            db.close()
+        self._remember(key, entry)
+        return entry
+
+    async def _save(
+        self,
+        key: str,
+        company_name: Optional[str],
+        website: Optional[str],
+        source: str,
+        logo_url: Optional[str] = None,
+        svg: Optional[str] = None
+    ) -> str:
+        return await run_in_threadpool(self._store, key, company_name, website, source, logo_url, svg)
+
+    def _store(
+        self,
+        key: str,
+        company_name: Optional[str],
+        website: Optional[str],
+        source: str,
+        logo_url: Optional[str],
+        svg: Optional[str]
+    ) -> str:
+        db = SessionLocal()
+        try:
+            try:
+                resolved = self._upsert(db, key, company_name, website, source, logo_url, svg)
+            except IntegrityError:
+                # Another request resolved the same company first; update its row instead
+                db.rollback()
+                resolved = self._upsert(db, key, company_name, website, source, logo_url, svg)
+        finally:
+            db.close()
+        self._remember(key, (resolved, source, time.time()))
+        return resolved
+
+    def _upsert(
+        self,
+        db,
+        key: str,
+        company_name: Optional[str],
+        website: Optional[str],
+        source: str,
+        logo_url: Optional[str],
+        svg: Optional[str]
+    ) -> str:
+        logo = db.query(CompanyLogo).filter(CompanyLogo.key == key).first()
+        if logo is None:
+            logo = CompanyLogo(key=key, company_name=company_name, domain=normalize_domain(website), source=source)
+            db.add(logo)
+        logo.source = source
+        if svg is not None:
+            logo.svg = svg
+        if logo_url is not None:
+            logo.logo_url = logo_url
+        db.flush()
+        if logo.logo_url is None:
+            logo.logo_url = AVATAR_PATH.format(id=logo.id)
+        logo.updated_at = datetime.utcnow()
+        db.commit()
+        return logo.logo_url
+
+    def _remember(self, key: str, entry: Tuple[str, str, float]) -> None:
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+
+
+# Create a singleton instance
+company_logos = CompanyLogoService(
+    max_cached=settings.COMPANY_LOGO_CACHE_SIZE,
+    retry_after=settings.COMPANY_LOGO_RETRY_SECONDS
+)
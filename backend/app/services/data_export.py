@@ -0,0 +1,177 @@
+"""
+Streaming export of a user's data.
+
+Each entity is read with ``yield_per`` (a server-side cursor on Postgres)
+and written out one batch at a time, so an export never holds more than
+``EXPORT_BATCH_SIZE`` rows regardless of account size. NDJSON can mix
+entities in one stream (every line carries its ``entity``); CSV and
+Parquet are tabular, so they export one entity per request. Parquet needs
+the optional ``pyarrow`` package.
+"""
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import select, Boolean, DateTime, Float, Integer, JSON
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.calendar_event import CalendarEvent
+from app.models.job import Job, Contact
+from app.models.pomodoro_session import PomodoroSession
+from app.models.problem import Problem
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_ENTITIES = {
+    'jobs': Job,
+    'contacts': Contact,
+    'problems': Problem,
+    'pomodoro_sessions': PomodoroSession,
+    'calendar_events': CalendarEvent,
+}
+
+EXPORT_MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+
+def _entity_query(entity: str, user_id: int):
+    model = EXPORT_ENTITIES[entity]
+    columns = model.__table__.columns
+    if model is Contact:
+        # Contacts belong to the user through their job
+        query = select(*columns).join(Job, Job.id == Contact.job_id).where(Job.user_id == user_id)
+    else:
+        query = select(*columns).where(model.user_id == user_id)
+    return query.order_by(model.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+
+def _iter_batches(db: Session, entity: str, user_id: int) -> Iterator[List[Dict[str, Any]]]:
+    result = db.execute(_entity_query(entity, user_id))
+    for partition in result.mappings().partitions():
+        yield [dict(row) for row in partition]
+
+
+def _plain(value: Any) -> Any:
+    """A JSON/CSV-friendly form of a column value"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def stream_ndjson(user_id: int, entities: List[str]) -> Iterator[bytes]:
+    db = SessionLocal()
+    try:
+        for entity in entities:
+            for batch in _iter_batches(db, entity, user_id):
+                yield ''.join(
+                    json.dumps({'entity': entity, **{key: _plain(value) for key, value in row.items()}}) + '\n'
+                    for row in batch
+                ).encode()
+    finally:
+        db.close()
+
+
+def stream_csv(user_id: int, entity: str) -> Iterator[bytes]:
+    columns = [column.name for column in EXPORT_ENTITIES[entity].__table__.columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+
+    db = SessionLocal()
+    try:
+        for batch in _iter_batches(db, entity, user_id):
+            buffer.seek(0)
+            buffer.truncate()
+            for row in batch:
+                writer.writerow([_csv_value(row[column]) for column in columns])
+            yield buffer.getvalue().encode()
+    finally:
+        db.close()
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return _plain(value)
+
+
+class _ParquetSink(io.RawIOBase):
+    """Write-only file that hands the bytes written so far to the response as they come.
+    Keeps its own position, since the Parquet footer records column chunk offsets."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _arrow_type(column):
+    if isinstance(column.type, Boolean):
+        return pyarrow.bool_()
+    if isinstance(column.type, Integer):
+        return pyarrow.int64()
+    if isinstance(column.type, Float):
+        return pyarrow.float64()
+    if isinstance(column.type, DateTime):
+        return pyarrow.timestamp('us', tz='UTC' if column.type.timezone else None)
+    return pyarrow.string()
+
+
+def stream_parquet(user_id: int, entity: str) -> Iterator[bytes]:
+    """One Parquet row group per batch, written to the response as each is finished"""
+    table_columns = list(EXPORT_ENTITIES[entity].__table__.columns)
+    schema = pyarrow.schema([(column.name, _arrow_type(column)) for column in table_columns])
+    json_columns = {column.name for column in table_columns if isinstance(column.type, JSON)}
+
+    sink = _ParquetSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    db = SessionLocal()
+    try:
+        for batch in _iter_batches(db, entity, user_id):
+            arrays = {}
+            for column in table_columns:
+                values = [row[column.name] for row in batch]
+                if column.name in json_columns:
+                    values = [json.dumps(value) if value is not None else None for value in values]
+                elif pyarrow.types.is_string(schema.field(column.name).type):
+                    values = [_plain(value) if value is not None else None for value in values]
+                arrays[column.name] = values
+            writer.write_table(pyarrow.Table.from_pydict(arrays, schema=schema))
+            yield sink.drain()
+        writer.close()
+        yield sink.drain()
+    finally:
+        db.close()
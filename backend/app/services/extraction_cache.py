@@ -0,0 +1,134 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Mapping
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+from app.core.config import settings
+
+# Query parameters that only carry tracking/attribution data
+TRACKING_PARAMS = {
+    'trk', 'trkinfo', 'refid', 'trackingid', 'lipi', 'midtoken', 'midsig',
+    'ebp', 'originalsubdomain', 'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid',
+    'vjs', 'advn', 'tk', 'gh_src', 'ref', 'referrer',
+}
+
+LINKEDIN_JOB_ID_PATTERN = re.compile(r'/jobs/view/(?:[^/]*?-)?(\d+)/?')
+
+
+def canonicalize_job_url(url: str, job_id: Optional[str] = None) -> str:
+    """Normalize a job posting URL into a stable cache key.
+
+    Tracking parameters and fragments are dropped, the host is lowercased and
+    LinkedIn/Indeed postings collapse to their job id so the same posting
+    shared through different links maps to one key.
+    """
+    parsed = urlparse(url.strip())
+    scheme = (parsed.scheme or 'https').lower()
+    host = (parsed.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = parse_qsl(parsed.query, keep_blank_values=False)
+
+    if host.endswith('linkedin.com'):
+        if not job_id:
+            view_match = LINKEDIN_JOB_ID_PATTERN.search(parsed.path)
+            if view_match:
+                job_id = view_match.group(1)
+            else:
+                job_id = dict(query).get('currentJobId')
+        if job_id:
+            return f"https://linkedin.com/jobs/view/{job_id}/"
+
+    if host.endswith('indeed.com'):
+        job_key = dict(query).get('jk') or dict(query).get('vjk')
+        if job_key:
+            return f"https://{host}/viewjob?jk={job_key}"
+
+    kept = sorted(
+        (key, value) for key, value in query
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((scheme, host, path, '', urlencode(kept), ''))
+
+
+@dataclass
+class ExtractionCacheEntry:
+    result: Any
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers for a conditional GET against the stored validators"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ExtractionCache:
+    """LRU + TTL cache of job extraction results keyed by canonical URL.
+
+    Entries younger than ``ttl`` are served as-is. Older entries are kept
+    (until evicted) so they can be revalidated with their stored
+    ``ETag``/``Last-Modified`` validators; a 304 simply renews them.
+    """
+
+    def __init__(self, ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, ExtractionCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ExtractionCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: ExtractionCacheEntry) -> bool:
+        return time.time() - entry.stored_at <= self.ttl
+
+    def put(self, key: str, result: Any, headers: Optional[Mapping[str, str]] = None) -> None:
+        headers = headers or {}
+        entry = ExtractionCacheEntry(
+            result=result,
+            stored_at=time.time(),
+            etag=headers.get('etag'),
+            last_modified=headers.get('last-modified')
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def mark_revalidated(self, key: str, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Renew an entry after the origin answered 304 Not Modified"""
+        headers = headers or {}
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.stored_at = time.time()
+            entry.etag = headers.get('etag') or entry.etag
+            entry.last_modified = headers.get('last-modified') or entry.last_modified
+            self._entries.move_to_end(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Create a singleton instance
+extraction_cache = ExtractionCache(
+    ttl=settings.EXTRACTION_CACHE_TTL_SECONDS,
+    max_entries=settings.EXTRACTION_CACHE_MAX_ENTRIES
+)
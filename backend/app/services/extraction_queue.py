@@ -0,0 +1,258 @@
+import asyncio
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple, Callable, Awaitable, Any
+
+from sqlalchemy import desc
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.extraction_job import ExtractionJob
+from app.schemas.job import JobCreate
+from app.services.extraction_cache import canonicalize_job_url
+from app.services.jobs import JobService
+
+ACTIVE_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("succeeded", "failed")
+
+Extractor = Callable[[str, Optional[str]], Awaitable[Any]]
+
+
+class ExtractionQueue:
+    """In-process queue that runs job extractions on a pool of worker tasks.
+
+    Every request is persisted as an ``ExtractionJob`` row, so clients can
+    poll it by id and work left queued by a restart is picked up again on
+    startup. A request for a URL that already has an active row for the same
+    user returns that row instead of queueing another, and concurrent rows
+    for the same canonical URL share a single scrape. Database work runs in
+    the threadpool, off the event loop.
+    """
+
+    def __init__(self, workers: int, timeout: float):
+        self.workers = workers
+        self.timeout = timeout
+        self._extract: Optional[Extractor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._scrapes: Dict[str, asyncio.Future] = {}
+        self._watchers: Dict[int, asyncio.Event] = {}
+
+    def start(self, extract: Extractor) -> None:
+        """Start the workers and re-queue unfinished rows; must run inside the event loop"""
+        if self._tasks:
+            return
+        self._extract = extract
+        self._queue = asyncio.Queue()
+        for extraction_id in self._recover():
+            self._queue.put_nowait(extraction_id)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    async def submit(
+        self,
+        url: str,
+        source_job_id: Optional[str] = None,
+        user_id: Optional[int] = None,
+        create_job: bool = False
+    ) -> ExtractionJob:
+        """Queue an extraction, or return the matching one that is still in flight (detached)"""
+        if self._queue is None:
+            raise RuntimeError("Extraction queue is not running")
+
+        extraction, created = await run_in_threadpool(self._find_or_create, url, source_job_id, user_id, create_job)
+        if created:
+            self._queue.put_nowait(extraction.id)
+        return extraction
+
+    def _find_or_create(
+        self,
+        url: str,
+        source_job_id: Optional[str],
+        user_id: Optional[int],
+        create_job: bool
+    ) -> Tuple[ExtractionJob, bool]:
+        db = SessionLocal()
+        try:
+            cache_key = canonicalize_job_url(url, source_job_id)
+            extraction = db.query(ExtractionJob).filter(
+                ExtractionJob.cache_key == cache_key,
+                ExtractionJob.status.in_(ACTIVE_STATUSES),
+                ExtractionJob.user_id.is_(None) if user_id is None else ExtractionJob.user_id == user_id,
+                ExtractionJob.create_job == create_job
+            ).order_by(desc(ExtractionJob.id)).first()
+            created = extraction is None
+            if created:
+                extraction = ExtractionJob(
+                    user_id=user_id,
+                    url=url,
+                    cache_key=cache_key,
+                    source_job_id=source_job_id,
+                    create_job=create_job,
+                    status="queued"
+                )
+                db.add(extraction)
+                db.commit()
+                db.refresh(extraction)
+            db.expunge(extraction)
+            return extraction, created
+        finally:
+            db.close()
+
+    def get(self, db: Session, extraction_id: int) -> Optional[ExtractionJob]:
+        return db.query(ExtractionJob).filter(ExtractionJob.id == extraction_id).first()
+
+    def get_by_token(self, db: Session, token: str) -> Optional[ExtractionJob]:
+        return db.query(ExtractionJob).filter(ExtractionJob.token == token).first()
+
+    async def wait(self, extraction_id: int, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a row to change status; True if it did.
+
+        Callers should re-read the row first, since a change that happened
+        before the wait started is not signalled again.
+        """
+        event = self._watchers.setdefault(extraction_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _worker(self) -> None:
+        while True:
+            extraction_id = await self._queue.get()
+            try:
+                await self._run(extraction_id)
+            except Exception as e:
+                print(f"Extraction job {extraction_id} error: {e}")
+            finally:
+                self._queue.task_done()
+                self._notify(extraction_id)
+
+    def _notify(self, extraction_id: int) -> None:
+        event = self._watchers.pop(extraction_id, None)
+        if event:
+            event.set()
+
+    async def _run(self, extraction_id: int) -> None:
+        target = await run_in_threadpool(self._start, extraction_id)
+        if target is None:
+            return
+        self._notify(extraction_id)
+
+        try:
+            result = await asyncio.wait_for(asyncio.shield(self._scrape(*target)), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            await run_in_threadpool(self._fail, extraction_id, "Timed out")
+            return
+        except Exception as e:
+            await run_in_threadpool(self._fail, extraction_id, f"Failed to extract job data: {str(e)}")
+            return
+        await run_in_threadpool(self._succeed, extraction_id, result)
+
+    def _start(self, extraction_id: int) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Mark a row running; returns what to scrape, or None if it's gone or already finished"""
+        db = SessionLocal()
+        try:
+            extraction = self.get(db, extraction_id)
+            if extraction is None or extraction.status in FINISHED_STATUSES:
+                return None
+            extraction.status = "running"
+            extraction.started_at = datetime.utcnow()
+            db.commit()
+            return extraction.cache_key, extraction.url, extraction.source_job_id
+        finally:
+            db.close()
+
+    def _succeed(self, extraction_id: int, result: Any) -> None:
+        db = SessionLocal()
+        try:
+            extraction = self.get(db, extraction_id)
+            if extraction is None:
+                return
+            error = None
+            if extraction.create_job and extraction.user_id is not None:
+                try:
+                    error = self._create_job(db, extraction, result)
+                except Exception as e:
+                    db.rollback()
+                    error = f"Failed to create job: {str(e)}"
+            extraction.result = result.model_dump()
+            self._finish(db, extraction, "succeeded", error=error)
+        finally:
+            db.close()
+
+    def _fail(self, extraction_id: int, error: str) -> None:
+        db = SessionLocal()
+        try:
+            extraction = self.get(db, extraction_id)
+            if extraction is not None:
+                self._finish(db, extraction, "failed", error=error)
+        finally:
+            db.close()
+
+    def _scrape(self, cache_key: str, url: str, source_job_id: Optional[str]) -> asyncio.Future:
+        """One extraction per canonical URL at a time, shared by every row waiting on it"""
+        scrape = self._scrapes.get(cache_key)
+        if scrape is None:
+            scrape = asyncio.ensure_future(self._extract(url, source_job_id))
+            self._scrapes[cache_key] = scrape
+            scrape.add_done_callback(lambda done: self._forget_scrape(cache_key, done))
+        return scrape
+
+    def _forget_scrape(self, cache_key: str, scrape: asyncio.Future) -> None:
+        self._scrapes.pop(cache_key, None)
+        if not scrape.cancelled():
+            scrape.exception()  # Mark retrieved even if every waiter timed out
+
+    def _create_job(self, db: Session, extraction: ExtractionJob, result: Any) -> Optional[str]:
+        """Save the result as a Job; returns why not if it can't"""
+        if not result.company or not result.position:
+            return "Company and position could not be extracted, so no job was created"
+        job = JobService(db).create_job(extraction.user_id, JobCreate(
+            company=result.company,
+            position=result.position,
+            location=result.location,
+            salary=result.salary,
+            company_logo=result.company_logo,
+            company_description=result.company_description,
+            position_description=result.position_description,
+            application_url=extraction.url
+        ))
+        extraction.created_job_id = job.id
+        return None
+
+    def _finish(self, db: Session, extraction: ExtractionJob, status: str, error: Optional[str] = None) -> None:
+        extraction.status = status
+        extraction.error = error
+        extraction.finished_at = datetime.utcnow()
+        db.commit()
+
+    def _recover(self) -> List[int]:
+        """Ids of rows left unfinished by a previous run, reset to queued"""
+        db = SessionLocal()
+        try:
+            rows = db.query(ExtractionJob).filter(
+                ExtractionJob.status.in_(ACTIVE_STATUSES)
+            ).order_by(ExtractionJob.id).all()
+            for row in rows:
+                row.status = "queued"
+                row.started_at = None
+            db.commit()
+            return [row.id for row in rows]
+        finally:
+            db.close()
+
+
+# Create a singleton instance
+extraction_queue = ExtractionQueue(
+    workers=settings.EXTRACTION_QUEUE_WORKERS,
+    timeout=settings.EXTRACTION_JOB_TIMEOUT_SECONDS
+)
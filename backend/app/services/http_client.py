@@ -0,0 +1,93 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, AsyncIterator
+from urllib.parse import urlparse
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+class AsyncHttpClient:
+    """Shared async HTTP client used by the scrapers.
+
+    Wraps a single ``httpx.AsyncClient`` so every fetch reuses the same
+    keep-alive connection pool (and HTTP/2 when ``h2`` is installed). On top
+    of httpx's global pool limits, a semaphore per host caps how many
+    requests we have in flight against any one site.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_connections_per_host: int = 6,
+        timeout: float = 10.0
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the underlying client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections
+                )
+            )
+        return self._client
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET ``url`` through the shared pool, respecting the per-host limit"""
+        async with self._host_semaphore(url):
+            return await self.client.get(url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> httpx.Response:
+        async with self._host_semaphore(url):
+            return await self.client.head(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Open a streamed request so the body can be read (or abandoned) chunk by chunk.
+
+        The per-host slot is held until the block exits and the connection is released.
+        """
+        async with self._host_semaphore(url):
+            async with self.client.stream(method, url, **kwargs) as response:
+                yield response
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_semaphores.clear()
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = (urlparse(url).hostname or '').lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+
+# Create a singleton instance
+http_client = AsyncHttpClient()
@@ -0,0 +1,439 @@
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Tuple, Callable, Iterable
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+# Precompiled patterns used to fall back on the page text when no selector hits
+TITLE_PATTERNS = (
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)'),  # "Student Software Engineer"
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)'),  # "Software Engineer"
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)'),  # "Senior Software Engineer"
+)
+COMPANY_PATTERNS = (
+    re.compile(r'([A-Z][a-z]+ AI)'),  # "Imagene AI"
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)'),  # "Company Name"
+    re.compile(r'([A-Z][a-z]+ Inc)'),  # "Company Inc"
+    re.compile(r'([A-Z][a-z]+ LLC)'),  # "Company LLC"
+)
+LOCATION_PATTERNS = (
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)'),  # "Tel Aviv", "New York"
+    re.compile(r'([A-Z][a-z]+,\s*[A-Z]{2})'),  # "San Francisco, CA"
+    re.compile(r'([A-Z][a-z]+,\s*[A-Z][a-z]+)'),  # "London, UK"
+)
+
+_COMPOUND_TOKEN = re.compile(
+    r'(?P<tag>^[a-zA-Z][\w-]*|^\*)'
+    r'|\.(?P<cls>[\w-]+)'
+    r'|#(?P<id>[\w-]+)'
+    r'|\[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[*^$~]?=)\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<bare>[^\]\s]+))\s*)?\]'
+)
+
+
+@dataclass(frozen=True)
+class _Compound:
+    """One compound selector such as ``img.company-logo[data-test-id="x"]``"""
+    tag: Optional[str]
+    element_id: Optional[str]
+    classes: frozenset
+    attrs: Tuple[Tuple[str, Optional[str], Optional[str]], ...]
+
+    def matches(self, element) -> bool:
+        if self.tag is not None and element.tag != self.tag:
+            return False
+        if self.element_id is not None and element.get('id') != self.element_id:
+            return False
+        if self.classes and not self.classes.issubset((element.get('class') or '').split()):
+            return False
+        for name, op, value in self.attrs:
+            actual = element.get(name)
+            if actual is None:
+                return False
+            if op is None:
+                continue
+            if op == '=' and actual != value:
+                return False
+            if op == '*=' and value not in actual:
+                return False
+            if op == '^=' and not actual.startswith(value):
+                return False
+            if op == '$=' and not actual.endswith(value):
+                return False
+            if op == '~=' and value not in actual.split():
+                return False
+        return True
+
+
+def _compile_compound(text: str) -> _Compound:
+    tag = None
+    element_id = None
+    classes = set()
+    attrs = []
+    position = 0
+    while position < len(text):
+        match = _COMPOUND_TOKEN.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Unsupported selector syntax: {text!r}")
+        if match.group('tag'):
+            tag = None if match.group('tag') == '*' else match.group('tag').lower()
+        elif match.group('cls'):
+            classes.add(match.group('cls'))
+        elif match.group('id'):
+            element_id = match.group('id')
+        else:
+            value = match.group('dq')
+            if value is None:
+                value = match.group('sq')
+            if value is None:
+                value = match.group('bare')
+            attrs.append((match.group('attr').lower(), match.group('op'), value))
+        position = match.end()
+    return _Compound(tag, element_id, frozenset(classes), tuple(attrs))
+
+
+@dataclass(frozen=True)
+class CompiledSelector:
+    """A CSS selector limited to compound selectors joined by descendant combinators.
+
+    That subset covers every selector in the site tables and can be matched
+    element-by-element, which is what lets the engine resolve all fields
+    during a single walk of the tree.
+    """
+    source: str
+    compounds: Tuple[_Compound, ...]
+
+    @classmethod
+    def compile(cls, selector: str) -> "CompiledSelector":
+        parts = selector.split()
+        if not parts:
+            raise ValueError("Empty selector")
+        return cls(selector, tuple(_compile_compound(part) for part in parts))
+
+    @property
+    def key_tag(self) -> Optional[str]:
+        return self.compounds[-1].tag
+
+    def matches(self, element) -> bool:
+        if not self.compounds[-1].matches(element):
+            return False
+        # Match the remaining compounds right-to-left against ancestors
+        ancestor = element.getparent()
+        for compound in reversed(self.compounds[:-1]):
+            while ancestor is not None and not compound.matches(ancestor):
+                ancestor = ancestor.getparent()
+            if ancestor is None:
+                return False
+            ancestor = ancestor.getparent()
+        return True
+
+
+@dataclass(frozen=True)
+class FieldRule:
+    """Declarative rule for one extracted field.
+
+    Selectors are tried in priority order (like successive ``select_one``
+    calls): the first element matching the highest-priority selector whose
+    value passes ``accept`` wins. ``attrs`` reads the first non-empty
+    attribute instead of the element text. With ``keep_rejected`` the last
+    rejected candidate is returned when nothing passes.
+    """
+    selectors: Tuple[str, ...]
+    attrs: Tuple[str, ...] = ()
+    accept: Optional[Callable[[str], bool]] = None
+    keep_rejected: bool = False
+
+
+@dataclass
+class _CompiledField:
+    name: str
+    rule: FieldRule
+    selectors: Tuple[CompiledSelector, ...]
+
+
+class SiteRules:
+    """A site's field table compiled into a tag-indexed selector dispatch.
+
+    ``stop_after`` optionally names the container that holds all of a
+    site's job fields; a streamed page is complete once it closes.
+    """
+
+    def __init__(self, fields: Dict[str, FieldRule], stop_after: Optional[str] = None):
+        self.stop_after = CompiledSelector.compile(stop_after) if stop_after else None
+        self.fields: List[_CompiledField] = [
+            _CompiledField(name, rule, tuple(CompiledSelector.compile(s) for s in rule.selectors))
+            for name, rule in fields.items()
+        ]
+        self._by_tag: Dict[Optional[str], List[Tuple[int, int, CompiledSelector]]] = {}
+        for field_index, compiled_field in enumerate(self.fields):
+            for priority, selector in enumerate(compiled_field.selectors):
+                self._by_tag.setdefault(selector.key_tag, []).append((field_index, priority, selector))
+
+    def candidates(self, tag: str) -> Iterable[Tuple[int, int, CompiledSelector]]:
+        yield from self._by_tag.get(tag, ())
+        yield from self._by_tag.get(None, ())
+
+
+def element_text(element) -> str:
+    """Equivalent of BeautifulSoup's ``get_text(strip=True)``"""
+    return ''.join(piece.strip() for piece in element.itertext())
+
+
+@dataclass
+class _FieldState:
+    # Best accepted (priority, value) so far, and rejected first-hits by priority
+    accepted: Optional[Tuple[int, str]] = None
+    seen: set = field(default_factory=set)
+    rejected: Dict[int, str] = field(default_factory=dict)
+
+
+class ParsedPage:
+    """An HTML document parsed once with lxml.
+
+    The full page text is computed lazily and at most once, and
+    ``extract`` resolves every field of a ``SiteRules`` table in one walk
+    over the tree, stopping early once every field has its best match.
+    """
+
+    def __init__(self, html: bytes, base_url: Optional[str] = None):
+        self._setup(lxml.html.fromstring(html or b'<html></html>'), base_url)
+
+    @classmethod
+    def from_root(cls, root, base_url: Optional[str] = None) -> "ParsedPage":
+        """Wrap a tree that was already built, e.g. by a ``PageStream``"""
+        page = cls.__new__(cls)
+        page._setup(root, base_url)
+        return page
+
+    def _setup(self, root, base_url: Optional[str]) -> None:
+        self.root = root
+        # Script/style bodies never hold job data (BeautifulSoup's get_text skips them too)
+        etree.strip_elements(self.root, 'script', 'style', with_tail=False)
+        self.base_url = base_url
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.root.text_content()
+        return self._text
+
+    def find(self, selector: CompiledSelector):
+        """Return the first element matching ``selector`` in document order"""
+        for element in self.root.iter():
+            if isinstance(element.tag, str) and selector.matches(element):
+                return element
+        return None
+
+    def extract(self, rules: SiteRules) -> Dict[str, Optional[str]]:
+        states = [_FieldState() for _ in rules.fields]
+        unsettled = len(rules.fields)
+
+        for element in self.root.iter():
+            if not isinstance(element.tag, str):
+                continue  # comments / processing instructions
+            for field_index, priority, selector in rules.candidates(element.tag):
+                state = states[field_index]
+                if priority in state.seen:
+                    continue  # select_one semantics: only the first hit counts
+                if state.accepted is not None and state.accepted[0] <= priority:
+                    continue
+                if not selector.matches(element):
+                    continue
+
+                state.seen.add(priority)
+                rule = rules.fields[field_index].rule
+                value = self._value(element, rule)
+                if value is None:
+                    continue
+                if rule.accept is None or rule.accept(value):
+                    state.accepted = (priority, value)
+                    if priority == 0:
+                        unsettled -= 1
+                else:
+                    state.rejected[priority] = value
+
+            if not unsettled:
+                break
+
+        results: Dict[str, Optional[str]] = {}
+        for compiled_field, state in zip(rules.fields, states):
+            value = state.accepted[1] if state.accepted else None
+            if value is None and compiled_field.rule.keep_rejected and state.rejected:
+                value = state.rejected[max(state.rejected)]
+            results[compiled_field.name] = value
+        return results
+
+    def absolute_url(self, src: Optional[str]) -> Optional[str]:
+        """Resolve an ``src``/``href`` value against the page URL"""
+        if not src:
+            return None
+        if src.startswith('//'):
+            return f"https:{src}"
+        if src.startswith('http'):
+            return src
+        if src.startswith('/') and self.base_url:
+            return urljoin(self.base_url, src)
+        return None
+
+    def find_pattern(self, patterns: Iterable[re.Pattern], accept: Callable[[str], bool]) -> Optional[str]:
+        """Return the first pattern match in the page text that passes ``accept``"""
+        for pattern in patterns:
+            for match in pattern.findall(self.text):
+                if accept(match):
+                    return match
+        return None
+
+    @staticmethod
+    def _value(element, rule: FieldRule) -> Optional[str]:
+        if rule.attrs:
+            for attr in rule.attrs:
+                value = element.get(attr)
+                if value:
+                    return value
+            return None
+        return element_text(element)
+
+
+class PageStream:
+    """Incremental HTML parser fed with body chunks as they arrive.
+
+    Script and style bodies are dropped as soon as each element closes, so
+    megabytes of inline JavaScript never accumulate in the tree. When given
+    a ``SiteRules`` table, ``feed`` reports completion once the rules'
+    ``stop_after`` container has closed, or once every field's top-priority
+    selector has matched a closed element (at which point
+    ``ParsedPage.extract`` would return the same values from the full page),
+    so the caller can stop downloading.
+    """
+
+    def __init__(self, rules: Optional[SiteRules] = None, encoding: Optional[str] = None):
+        self._parser = etree.HTMLPullParser(events=('end',), encoding=encoding)
+        self._parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        self._rules = rules
+        # Top-priority selector of every field still waiting for its first hit, by key tag
+        self._watch: Dict[Optional[str], Dict[int, CompiledSelector]] = {}
+        self._pending = 0
+        self._stop_after = rules.stop_after if rules is not None else None
+        if rules is not None:
+            for field_index, compiled_field in enumerate(rules.fields):
+                selector = compiled_field.selectors[0]
+                self._watch.setdefault(selector.key_tag, {})[field_index] = selector
+            self._pending = len(rules.fields)
+        self.bytes_fed = 0
+        self.complete = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse another chunk; returns True once the job content is complete"""
+        self._parser.feed(chunk)
+        self.bytes_fed += len(chunk)
+        for _, element in self._parser.read_events():
+            tag = element.tag
+            if tag == 'script' or tag == 'style':
+                element.text = None
+                continue
+            if self._watch and isinstance(tag, str):
+                self._settle(element, self._watch.get(tag))
+                self._settle(element, self._watch.get(None))
+            if self._stop_after is not None and self._stop_after.matches(element):
+                self.complete = True
+        if self._rules is not None and not self._pending:
+            self.complete = True
+        return self.complete
+
+    def close(self, base_url: Optional[str] = None) -> ParsedPage:
+        if not self.bytes_fed:
+            self._parser.feed(b'<html></html>')
+        return ParsedPage.from_root(self._parser.close(), base_url)
+
+    def _settle(self, element, watched: Optional[Dict[int, CompiledSelector]]) -> None:
+        if not watched:
+            return
+        for field_index, selector in list(watched.items()):
+            if not selector.matches(element):
+                continue
+            # An enclosing match comes first in document order; it is judged when it closes
+            if any(selector.matches(ancestor) for ancestor in element.iterancestors()):
+                continue
+            del watched[field_index]
+            rule = self._rules.fields[field_index].rule
+            value = ParsedPage._value(element, rule)
+            if value is not None and (rule.accept is None or rule.accept(value)):
+                self._pending -= 1
+            else:
+                # The field can only settle on a lower priority now, which a
+                # later element could still beat: read the page to the end
+                self._watch.clear()
+                return
+
+
+# Per-site field tables. Selector order is priority order.
+
+_GENERIC_TITLE_STOPWORDS = ('careers', 'jobs', 'home', 'about', 'contact')
+_CURRENCY_HINTS = ('$', '₪')
+
+LINKEDIN_RULES = SiteRules({
+    'position': FieldRule(('h1.top-card-layout__title', 'h1[data-test-id="job-title"]', 'h1.job-title', 'h1')),
+    'company': FieldRule(('a.topcard__org-name-link', 'a[data-test-id="company-name"]', 'a.job-company-name', 'span.company-name')),
+    'location': FieldRule(('span.topcard__flavor--bullet', 'span[data-test-id="job-location"]', 'span.job-location', 'span.location')),
+    'position_description': FieldRule(('div.description__text', 'div[data-test-id="job-description"]', 'div.job-description', 'div.description')),
+    'salary': FieldRule(('span.salary', 'span[data-test-id="salary"]', 'div.salary-info')),
+    'company_logo': FieldRule(
+        (
+            'img.topcard__org-name-link img',
+            'img.company-logo',
+            'img[data-test-id="company-logo"]',
+            'img.org-top-card-primary-content__logo',
+            'img.top-card-layout__entity-image',
+            'img.artdeco-entity-lockup__image',
+        ),
+        attrs=('src', 'data-src', 'data-lazy-src')
+    ),
+    'industry': FieldRule(('span[data-test-id="industry"]', '.job-details-jobs-unified-top-card__job-insight')),
+    'company_size': FieldRule(('span[data-test-id="company-size"]',)),
+    'founded': FieldRule(('span[data-test-id="founded"]',)),
+    'website': FieldRule(('a[data-test-id="company-website"]',), attrs=('href',)),
+}, stop_after='main')
+
+INDEED_RULES = SiteRules({
+    'position': FieldRule(('h1.jobsearch-JobInfoHeader-title',)),
+    'company': FieldRule(('div.jobsearch-CompanyInfoContainer a',)),
+    'location': FieldRule(('div.jobsearch-JobInfoHeader-subtitle',)),
+})
+
+IMAGENE_RULES = SiteRules({
+    'position_description': FieldRule(('main', 'div.content', 'div.job-content')),
+}, stop_after='main')
+
+GENERIC_RULES = SiteRules({
+    'position': FieldRule(
+        ('h1', 'h2', '.job-title', '.position-title', '[data-testid="job-title"]', '.title', 'h3', '.position', '.role-title'),
+        # Filter out common page titles that aren't job titles
+        accept=lambda text: len(text) > 3 and not any(word in text.lower() for word in _GENERIC_TITLE_STOPWORDS),
+        keep_rejected=True
+    ),
+    'company': FieldRule(
+        ('.company-name', '.employer-name', '[data-testid="company-name"]', 'title'),
+        accept=lambda text: len(text) > 3
+    ),
+    'location': FieldRule(('.location', '.job-location', '[data-testid="location"]', '.address', '.city', '.place')),
+    'position_description': FieldRule(
+        ('.job-description', '.description', '.job-content', '.position-description', '[data-testid="job-description"]', 'main', '.content'),
+        accept=lambda text: len(text) > 50,
+        keep_rejected=True
+    ),
+    'salary': FieldRule(
+        ('.salary', '.compensation', '.pay', '[data-testid="salary"]'),
+        accept=lambda text: any(hint in text for hint in _CURRENCY_HINTS) or 'salary' in text.lower()
+    ),
+    'company_logo': FieldRule(
+        ('img[alt*="logo"]', 'img[alt*="Logo"]', '.logo img', '.company-logo img', 'img[src*="logo"]', 'img[class*="logo"]'),
+        attrs=('src', 'data-src')
+    ),
+    'company_description': FieldRule(
+        ('.about', '.company-about', '.about-us', '.company-description', '[data-testid="about"]'),
+        accept=lambda text: len(text) > 50,
+        keep_rejected=True
+    ),
+})
@@ -0,0 +1,95 @@
+"""
+Row readers for bulk job imports.
+
+Both readers walk an uploaded file (spooled to disk by the upload, so
+memory stays bounded) one record at a time and yield ``(row_number,
+record)``, where ``record`` is a dict ready for ``JobCreate`` or an
+exception describing why the row couldn't be read.
+"""
+import csv
+import io
+import json
+from typing import BinaryIO, Dict, Iterator, Tuple, Union
+
+# CSV columns holding a single contact, mapped to ContactCreate fields
+CSV_CONTACT_COLUMNS = {
+    'contact_type': 'type',
+    'contact_name': 'name',
+    'contact_email': 'email',
+    'contact_linkedin': 'linkedin',
+}
+
+ImportRow = Tuple[int, Union[Dict, ValueError]]
+
+
+def detect_format(filename: str = '', content_type: str = '') -> str:
+    """'csv' or 'ndjson' from the upload's name or type; defaults to CSV"""
+    filename = (filename or '').lower()
+    content_type = (content_type or '').lower()
+    if filename.endswith(('.ndjson', '.jsonl')) or 'ndjson' in content_type or 'jsonl' in content_type:
+        return 'ndjson'
+    return 'csv'
+
+
+def iter_rows(file: BinaryIO, format: str) -> Iterator[ImportRow]:
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    return iter_ndjson_rows(text) if format == 'ndjson' else iter_csv_rows(text)
+
+
+def iter_csv_rows(text: io.TextIOBase) -> Iterator[ImportRow]:
+    """
+    One record per CSV row, keyed by the header. Empty cells are omitted,
+    ``tags`` is split on commas and the contact_* columns become a single
+    contact.
+    """
+    reader = csv.DictReader(text)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except (csv.Error, UnicodeDecodeError) as e:
+            yield reader.line_num, ValueError(f"Unreadable CSV: {e}")
+            return
+
+        record = {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key and isinstance(value, str) and value.strip()
+        }
+        if 'tags' in record:
+            record['tags'] = [tag.strip() for tag in record['tags'].split(',') if tag.strip()]
+        contact = {
+            field: record.pop(column)
+            for column, field in CSV_CONTACT_COLUMNS.items()
+            if column in record
+        }
+        if contact:
+            contact.setdefault('type', 'recruiter')
+            record['contacts'] = [contact]
+        yield reader.line_num, record
+
+
+def iter_ndjson_rows(text: io.TextIOBase) -> Iterator[ImportRow]:
+    """One JSON object per line; blank lines are skipped"""
+    line_number = 0
+    while True:
+        try:
+            line = text.readline()
+        except UnicodeDecodeError as e:
+            yield line_number + 1, ValueError(f"Unreadable file: {e}")
+            return
+        if not line:
+            return
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, ValueError(f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(record, dict):
+            yield line_number, ValueError("Each line must be a JSON object")
+            continue
+        yield line_number, record
@@ -0,0 +1,169 @@
+"""
+Full-text search over a user's jobs.
+
+SQLite keeps the index in an FTS5 virtual table (``jobs_fts``, rowid = job
+id) and ranks with bm25; Postgres keeps a weighted ``tsvector`` per job in
+``job_search`` behind a GIN index and ranks with ts_rank_cd. Either way the
+index is written by JobService alongside the job itself, and
+``ensure_search_index`` creates and backfills it in a migration step
+(see app.services.migrations).
+"""
+import re
+from typing import Iterable, List, NamedTuple
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+
+# Indexed job fields, most significant first
+SEARCH_FIELDS = ('company', 'position', 'location', 'tags', 'note', 'company_description', 'position_description')
+
+# bm25 column weights for SEARCH_FIELDS (then user_id, which isn't searched)
+FTS_WEIGHTS = (10.0, 10.0, 4.0, 4.0, 2.0, 1.0, 1.0, 0.0)
+
+# tsvector weight classes for SEARCH_FIELDS
+TSVECTOR_WEIGHTS = ('A', 'A', 'B', 'B', 'C', 'D', 'D')
+
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_END = '</mark>'
+
+# Jobs read per batch when backfilling the index
+BACKFILL_BATCH_SIZE = 1000
+
+_SEARCH_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+class SearchHit(NamedTuple):
+    job_id: int
+    score: float  # Higher is more relevant
+    snippet: str
+
+
+def search_terms(query: str) -> List[str]:
+    """Split free text into plain words, so user input never reaches the match syntax"""
+    return _SEARCH_TERM_PATTERN.findall(query.lower())
+
+
+def job_document(job: Job) -> dict:
+    """The text indexed for ``job``, keyed by SEARCH_FIELDS"""
+    document = {field: getattr(job, field) or '' for field in SEARCH_FIELDS}
+    document['tags'] = ' '.join(job.tags or [])
+    return document
+
+
+def ensure_search_index(conn: Connection) -> None:
+    """Create the search index if it's missing and fill it from the jobs table. Doesn't commit."""
+    if conn.dialect.name == 'sqlite':
+        exists = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        )).first()
+        if exists:
+            return
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE jobs_fts USING fts5("
+            f"{', '.join(SEARCH_FIELDS)}, user_id UNINDEXED, "
+            f"tokenize = 'unicode61 remove_diacritics 2')"
+        ))
+    else:
+        exists = conn.execute(text("SELECT to_regclass('job_search')")).scalar()
+        if exists:
+            return
+        conn.execute(text(
+            "CREATE TABLE job_search ("
+            "job_id INTEGER PRIMARY KEY REFERENCES jobs(id) ON DELETE CASCADE, "
+            "user_id INTEGER NOT NULL, "
+            "document TSVECTOR NOT NULL)"
+        ))
+        conn.execute(text("CREATE INDEX ix_job_search_document ON job_search USING GIN (document)"))
+        conn.execute(text("CREATE INDEX ix_job_search_user_id ON job_search (user_id)"))
+
+    # Fill it through job_document, like JobSearchIndex.index, so both index the same text
+    insert_sql = _insert_sql(conn.dialect.name == 'sqlite')
+    jobs = conn.execute(
+        select(Job.id, Job.user_id, *(getattr(Job, field) for field in SEARCH_FIELDS))
+        .execution_options(yield_per=BACKFILL_BATCH_SIZE)
+    )
+    for batch in jobs.partitions():
+        conn.execute(insert_sql, [
+            {'job_id': job.id, 'user_id': job.user_id, **job_document(job)} for job in batch
+        ])
+
+
+def _insert_sql(sqlite: bool):
+    """Statement that adds or replaces one job's index row from job_document values"""
+    if sqlite:
+        return text(
+            f"INSERT INTO jobs_fts (rowid, {', '.join(SEARCH_FIELDS)}, user_id) "
+            f"VALUES (:job_id, {', '.join(':' + field for field in SEARCH_FIELDS)}, :user_id)"
+        )
+    return text(
+        f"INSERT INTO job_search (job_id, user_id, document) "
+        f"VALUES (:job_id, :user_id, {_tsvector_sql(lambda field: ':' + field)}) "
+        f"ON CONFLICT (job_id) DO UPDATE SET user_id = EXCLUDED.user_id, document = EXCLUDED.document"
+    )
+
+
+def _tsvector_sql(value) -> str:
+    """Weighted tsvector expression over SEARCH_FIELDS; ``value(field)`` renders each field's text"""
+    return ' || '.join(
+        f"setweight(to_tsvector('simple', coalesce({value(field)}, '')), '{weight}')"
+        for field, weight in zip(SEARCH_FIELDS, TSVECTOR_WEIGHTS)
+    )
+
+
+class JobSearchIndex:
+    def __init__(self, db: Session):
+        self.db = db
+        self.sqlite = db.get_bind().dialect.name == 'sqlite'
+
+    def index(self, jobs: Iterable[Job]) -> None:
+        """Add or refresh ``jobs`` in the index, one batched statement per step. Doesn't commit."""
+        rows = [{'job_id': job.id, 'user_id': job.user_id, **job_document(job)} for job in jobs]
+        if not rows:
+            return
+        if self.sqlite:
+            self.db.execute(text("DELETE FROM jobs_fts WHERE rowid = :job_id"), rows)
+        self.db.execute(_insert_sql(self.sqlite), rows)
+
+    def remove(self, job_ids: Iterable[int]) -> None:
+        """Drop jobs from the index. Doesn't commit."""
+        rows = [{'job_id': job_id} for job_id in job_ids]
+        if rows:
+            table, column = ('jobs_fts', 'rowid') if self.sqlite else ('job_search', 'job_id')
+            self.db.execute(text(f"DELETE FROM {table} WHERE {column} = :job_id"), rows)
+
+    def search(self, user_id: int, query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        """
+        Rank the user's jobs against ``query`` (every word must match, the
+        last one as a prefix) and return one highlighted snippet per job
+        """
+        terms = search_terms(query)
+        if not terms:
+            return []
+        params = {'user_id': user_id, 'limit': limit, 'offset': offset}
+
+        if self.sqlite:
+            params['match'] = ' '.join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+            rows = self.db.execute(text(
+                f"SELECT rowid, -bm25(jobs_fts, {', '.join(str(w) for w in FTS_WEIGHTS)}) AS score, "
+                f"snippet(jobs_fts, -1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', 16) "
+                f"FROM jobs_fts WHERE jobs_fts MATCH :match AND user_id = :user_id "
+                f"ORDER BY score DESC, rowid DESC LIMIT :limit OFFSET :offset"
+            ), params).all()
+        else:
+            params['match'] = ' & '.join(terms[:-1] + [f'{terms[-1]}:*'])
+            document_text = " || ' ' || ".join(f"coalesce(j.{field}::text, '')" for field in SEARCH_FIELDS)
+            rows = self.db.execute(text(
+                f"SELECT s.job_id, ts_rank_cd(s.document, q.query) AS score, "
+                f"ts_headline('simple', {document_text}, q.query, "
+                f"'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=24, MinWords=8') "
+                f"FROM job_search s "
+                f"JOIN jobs j ON j.id = s.job_id "
+                f"CROSS JOIN to_tsquery('simple', :match) AS q(query) "
+                f"WHERE s.user_id = :user_id AND s.document @@ q.query "
+                f"ORDER BY score DESC, s.job_id DESC LIMIT :limit OFFSET :offset"
+            ), params).all()
+
+        return [SearchHit(job_id, float(score), snippet or '') for job_id, score, snippet in rows]
@@ -0,0 +1,241 @@
+"""
+Per-user job statistics kept in the ``job_stats_rollup`` table.
+
+JobService adjusts a user's counters in the same transaction as every job
+insert, update, bulk update and delete, so reading stats is a primary-key
+lookup instead of a scan of the user's jobs. A row that has never been
+counted is rebuilt from the jobs table on first read. To rebuild every rollup from scratch
+(e.g. after editing jobs by hand), run from the backend directory:
+
+    python -m app.services.job_stats_rollup
+    python -m app.services.job_stats_rollup --user-id 42
+"""
+import argparse
+from datetime import datetime, date, timedelta
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+from app.models.job_stats_rollup import JobStatsRollup
+from app.schemas.job import JobStats
+
+# Stats reporting windows
+RECENT_APPLICATION_DAYS = 30
+STATS_WEEKS = 12
+
+# Statuses that count as a conversion in the referral breakdown
+INTERVIEW_STATUSES = ('interview', 'offered')
+
+
+class JobFacts(NamedTuple):
+    """The job fields the rollup counts"""
+    status: str
+    company: str
+    is_referral: Optional[bool]
+    applied_date: Optional[datetime]
+
+    @classmethod
+    def from_job(cls, job: Job) -> "JobFacts":
+        return cls(job.status, job.company, job.is_referral, job.applied_date)
+
+
+def _iso_week(day: date) -> str:
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _bump(counts: Dict, key: str, delta: int) -> None:
+    value = counts.get(key, 0) + delta
+    if value:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+class JobStatsRollupService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_stats(self, user_id: int) -> JobStats:
+        """Get job statistics for a user from their rollup row"""
+        rollup = self.db.get(JobStatsRollup, user_id)
+        if rollup is None or rollup.rebuilt_at is None:
+            rollup = self.rebuild(user_id)
+        return self.to_stats(rollup)
+
+    def apply(self, user_id: int, removed: Iterable[JobFacts] = (), added: Iterable[JobFacts] = ()) -> None:
+        """
+        Adjust a user's counters for jobs leaving and entering the table
+        (an update is its old facts removed and its new facts added).
+        Doesn't commit; call it inside the transaction that changes the jobs.
+        A user without a rollup gets an uncounted row, which their first read
+        rebuilds; holding its lock keeps a concurrent rebuild from missing
+        this transaction's changes.
+        """
+        rollup = self._lock_row(user_id)
+        if rollup.rebuilt_at is None:
+            return
+
+        # JSON columns aren't mutation-tracked, so work on copies and reassign them
+        counters = {
+            'status_counts': dict(rollup.status_counts or {}),
+            'company_counts': dict(rollup.company_counts or {}),
+            'referral_counts': {key: list(value) for key, value in (rollup.referral_counts or {}).items()},
+            'week_counts': dict(rollup.week_counts or {}),
+            'day_counts': dict(rollup.day_counts or {}),
+        }
+        total = rollup.total_jobs or 0
+        for delta, jobs in ((-1, removed), (1, added)):
+            for facts in jobs:
+                total += delta
+                self._count(counters, facts, delta)
+
+        rollup.total_jobs = total
+        for column, value in counters.items():
+            setattr(rollup, column, value)
+
+    def rebuild(self, user_id: int) -> JobStatsRollup:
+        """Recount a user's rollup from the jobs table in one grouped query"""
+        # Lock the row before counting so job writes in flight finish first
+        rollup = self._lock_row(user_id)
+        rows = self.db.query(
+            Job.status,
+            Job.company,
+            Job.is_referral,
+            func.date(Job.applied_date),
+            func.count(Job.id)
+        ).filter(Job.user_id == user_id).group_by(
+            Job.status, Job.company, Job.is_referral, func.date(Job.applied_date)
+        ).all()
+
+        counters = {
+            'status_counts': {},
+            'company_counts': {},
+            'referral_counts': {},
+            'week_counts': {},
+            'day_counts': {},
+        }
+        total = 0
+        for status, company, is_referral, applied_day, count in rows:
+            # SQLite returns DATE() as text, Postgres as a date
+            if isinstance(applied_day, str):
+                applied_day = date.fromisoformat(applied_day)
+            total += count
+            self._count(counters, JobFacts(status, company, is_referral, applied_day), count)
+
+        rollup.total_jobs = total
+        for column, value in counters.items():
+            setattr(rollup, column, value)
+        rollup.rebuilt_at = datetime.utcnow()
+        self.db.commit()
+        return rollup
+
+    def rebuild_all(self) -> int:
+        """Drop every rollup and rebuild them for all users with jobs; returns the number rebuilt"""
+        self.db.query(JobStatsRollup).delete(synchronize_session=False)
+        self.db.commit()
+        user_ids = [user_id for (user_id,) in self.db.query(Job.user_id).distinct().all()]
+        for user_id in user_ids:
+            self.rebuild(user_id)
+        return len(user_ids)
+
+    def to_stats(self, rollup: JobStatsRollup) -> JobStats:
+        today = datetime.utcnow().date()
+        recent_since = today - timedelta(days=RECENT_APPLICATION_DAYS)
+        weeks_since = today - timedelta(days=today.weekday(), weeks=STATS_WEEKS - 1)
+
+        jobs_by_status = dict(rollup.status_counts or {})
+        company_counts = rollup.company_counts or {}
+        day_counts = rollup.day_counts or {}
+        week_counts = rollup.week_counts or {}
+
+        # Top 10 companies
+        jobs_by_company = dict(sorted(company_counts.items(), key=lambda item: (-item[1], item[0]))[:10])
+
+        recent_applications = sum(
+            day_counts.get((recent_since + timedelta(days=i)).isoformat(), 0)
+            for i in range(RECENT_APPLICATION_DAYS + 1)
+        )
+        applications_by_week = {}
+        for i in range(STATS_WEEKS):
+            week = _iso_week(weeks_since + timedelta(weeks=i))
+            applications_by_week[week] = week_counts.get(week, 0)
+
+        # Interview rate (interviews / applied jobs)
+        applied_count = jobs_by_status.get('applied', 0)
+        interview_count = jobs_by_status.get('interview', 0)
+        interview_rate = (interview_count / applied_count * 100) if applied_count > 0 else 0
+
+        # Referral vs non-referral conversion to interview or offer
+        referral_conversion = {}
+        for key in ('referral', 'non_referral'):
+            jobs, interviews = (rollup.referral_counts or {}).get(key, [0, 0])
+            referral_conversion[key] = {
+                'total': jobs,
+                'interviews': interviews,
+                'rate': round(interviews / jobs * 100, 2) if jobs else 0
+            }
+
+        return JobStats(
+            total_jobs=rollup.total_jobs or 0,
+            jobs_by_status=jobs_by_status,
+            jobs_by_company=jobs_by_company,
+            recent_applications=recent_applications,
+            interview_rate=round(interview_rate, 2),
+            applications_by_week=applications_by_week,
+            referral_conversion=referral_conversion
+        )
+
+    def _lock_row(self, user_id: int) -> JobStatsRollup:
+        """Create the user's rollup row if it's missing and lock it for this transaction"""
+        insert = postgresql_insert if self.db.get_bind().dialect.name == 'postgresql' else sqlite_insert
+        self.db.execute(
+            insert(JobStatsRollup).values(user_id=user_id).on_conflict_do_nothing(index_elements=['user_id'])
+        )
+        return self.db.query(JobStatsRollup).filter(
+            JobStatsRollup.user_id == user_id
+        ).with_for_update().populate_existing().one()
+
+    def _count(self, counters: Dict[str, Dict], facts: JobFacts, delta: int) -> None:
+        _bump(counters['status_counts'], facts.status, delta)
+        _bump(counters['company_counts'], facts.company, delta)
+
+        referral = counters['referral_counts'].setdefault('referral' if facts.is_referral else 'non_referral', [0, 0])
+        referral[0] += delta
+        if facts.status in INTERVIEW_STATUSES:
+            referral[1] += delta
+
+        if facts.applied_date is not None:
+            day = facts.applied_date.date() if isinstance(facts.applied_date, datetime) else facts.applied_date
+            _bump(counters['week_counts'], _iso_week(day), delta)
+            _bump(counters['day_counts'], day.isoformat(), delta)
+
+
+def main() -> None:
+    from app import models  # noqa: F401  (registers the tables)
+    from app.db.base import Base
+    from app.db.session import engine, SessionLocal
+
+    parser = argparse.ArgumentParser(description="Rebuild job stats rollups from the jobs table")
+    parser.add_argument("--user-id", type=int, help="Only rebuild this user's rollup")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        service = JobStatsRollupService(db)
+        if args.user_id is not None:
+            service.rebuild(args.user_id)
+            print(f"Rebuilt job stats rollup for user {args.user_id}")
+        else:
+            print(f"Rebuilt job stats rollups for {service.rebuild_all()} users")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,122 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc
-from typing import List, Optional
+from sqlalchemy.orm import Session, selectinload, defer, aliased
+from sqlalchemy import and_, or_, desc, literal, String, insert, delete, select, update, case, func
+from pydantic import ValidationError
+from typing import Dict, Iterable, List, Optional, Tuple
+import base64
+import json
 from app.models.job import Job, Contact
-from app.schemas.job import JobCreate, JobUpdate, ContactCreate, JobBulkUpdate, JobStats
-from datetime import datetime, timedelta
+from app.schemas.job import (
+    JobCreate,
+    JobUpdate,
+    ContactCreate,
+    JobBulkUpdate,
+    JobStats,
+    JobImportError,
+    JobImportResult,
+    JobBulkDeleteOutcome,
+    JobBulkDeleteResult,
+    ContactBulkItem,
+    ContactBulkOutcome,
+    ContactBulkResult,
+    ContactResponse,
+    JobSummary,
+    BoardLane,
+    JobBoard,
+    JobMove,
+    JobMoveOutcome,
+    JobMoveResult
+)
+from app.services.job_stats_rollup import JobStatsRollupService, JobFacts
+from app.services.job_search import JobSearchIndex, SearchHit, SEARCH_FIELDS
+from app.services.tag_index import job_tag_index
+from app.services.job_import import ImportRow
+from datetime import datetime
+
+
+# Job lists only serialize JobSummary, so skip hydrating the long free-text columns
+JOB_LIST_OPTIONS = (
+    selectinload(Job.contacts),
+    defer(Job.note),
+    defer(Job.company_description),
+    defer(Job.position_description),
+)
+
+
+# Board lanes, in display order; other statuses found on jobs are appended after these
+BOARD_STATUSES = ('saved', 'applied', 'interview', 'rejected', 'offered')
+
+# Bulk import batching and error reporting limits
+IMPORT_CHUNK_SIZE = 500
+IMPORT_MAX_REPORTED_ERRORS = 1000
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a job list cursor can't be decoded"""
+
+
+def _encode_cursor(values: list) -> str:
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _cursor_values(cursor: str) -> list:
+    return json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+
+
+def encode_job_cursor(job: Job) -> str:
+    """Opaque cursor pointing just past ``job`` in (created_at, id) descending order"""
+    return _encode_cursor([job.created_at.isoformat(), job.id])
+
+
+def decode_job_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, job_id = _cursor_values(cursor)
+        return datetime.fromisoformat(created_at), int(job_id)
+    except (ValueError, TypeError):
+        raise InvalidCursorError("Invalid cursor")
+
+
+def encode_lane_cursor(job: Job) -> str:
+    """Opaque cursor pointing just past ``job`` in its board lane's (lane_position, id) order"""
+    return _encode_cursor([job.lane_position, job.id])
+
+
+def decode_lane_cursor(cursor: str) -> Tuple[float, int]:
+    try:
+        lane_position, job_id = _cursor_values(cursor)
+        return float(lane_position), int(job_id)
+    except (ValueError, TypeError):
+        raise InvalidCursorError("Invalid cursor")
+
+
+def _above(top: Optional[float]) -> float:
+    """Position for a new card at the top of a lane whose top card is at ``top``"""
+    return top - 1.0 if top is not None else 0.0
+
+
+def backfill_lane_positions(db: Session) -> int:
+    """
+    Give jobs without a board position one (jobs from before lane_position
+    existed), newest at the top of its lane; returns the number of jobs updated
+    """
+    result = db.execute(update(Job).where(Job.lane_position.is_(None)).values(lane_position=-Job.id))
+    db.commit()
+    return result.rowcount
+
+
+def _import_error_message(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return '; '.join(
+            f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
+        )
+    return str(error)
 
 
 class JobService:
     def __init__(self, db: Session):
         self.db = db
+        self.rollups = JobStatsRollupService(db)
+        self.search_index = JobSearchIndex(db)
 
     def create_job(self, user_id: int, job_data: JobCreate) -> Job:
         """Create a new job application"""
@@ -32,7 +140,9 @@ class JobService:
             cv=job_data.cv,
             cover_letter=job_data.cover_letter,
             application_url=job_data.application_url,
-            completion_method=job_data.completion_method
+            completion_method=job_data.completion_method,
+            # New cards go on top of their lane
+            lane_position=_above(self._lane_tops(user_id, [job_data.status]).get(job_data.status))
         )
         
         self.db.add(job)
@@ -50,22 +160,197 @@ class JobService:
                 )
                 self.db.add(contact)
         
+        self.rollups.apply(user_id, added=[JobFacts.from_job(job)])
+        self.search_index.index([job])
+        job_tag_index.sync(self.db, [job])
         self.db.commit()
         self.db.refresh(job)
         return job
 
-    def get_jobs(self, user_id: int, status: Optional[str] = None, limit: int = 100, offset: int = 0) -> List[Job]:
-        """Get all jobs for a user, optionally filtered by status"""
-        query = self.db.query(Job).filter(Job.user_id == user_id)
+    def import_jobs(self, user_id: int, rows: Iterable[ImportRow]) -> JobImportResult:
+        """
+        Validate and insert jobs from an import, a chunk at a time, in one transaction.
+        Each chunk is a multi-row INSERT for the jobs and one for their contacts,
+        and the stats rollup, search and tag indexes are updated per chunk.
+        Invalid rows are reported and skipped without aborting the import.
+        """
+        result = JobImportResult(imported=0, failed=0)
+        chunk: List[JobCreate] = []
+        
+        for row_number, record in rows:
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                chunk.append(JobCreate.model_validate(record))
+            except (ValueError, ValidationError) as e:
+                result.failed += 1
+                if len(result.errors) < IMPORT_MAX_REPORTED_ERRORS:
+                    result.errors.append(JobImportError(row=row_number, error=_import_error_message(e)))
+                else:
+                    result.errors_truncated = True
+                continue
+            
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                result.imported += self._insert_import_chunk(user_id, chunk)
+                chunk = []
+        
+        if chunk:
+            result.imported += self._insert_import_chunk(user_id, chunk)
+        self.db.commit()
+        return result
+
+    def _insert_import_chunk(self, user_id: int, chunk: List[JobCreate]) -> int:
+        job_rows = [
+            {'user_id': user_id, **job_data.model_dump(exclude={'contacts'})}
+            for job_data in chunk
+        ]
+        tops = self._lane_tops(user_id, {row['status'] for row in job_rows})
+        for row in job_rows:
+            row['lane_position'] = tops[row['status']] = _above(tops.get(row['status']))
+        # Ids are assigned in VALUES order, so sorting by id lines the jobs up with
+        # the chunk (sort_by_parameter_order=True falls back to one INSERT per row on SQLite)
+        jobs = sorted(self.db.scalars(insert(Job).returning(Job), job_rows), key=lambda job: job.id)
+        
+        contact_rows = [
+            {'job_id': job.id, **contact.model_dump()}
+            for job, job_data in zip(jobs, chunk)
+            for contact in job_data.contacts or []
+        ]
+        if contact_rows:
+            self.db.execute(insert(Contact), contact_rows)
+        
+        self.rollups.apply(user_id, added=[JobFacts.from_job(job) for job in jobs])
+        self.search_index.index(jobs)
+        job_tag_index.sync(self.db, jobs)
+        
+        # Keep memory flat across large files: write pending changes, then drop the chunk's objects
+        self.db.flush()
+        self.db.expunge_all()
+        return len(jobs)
+
+    def get_jobs(self, user_id: int, status: Optional[str] = None, limit: int = 100, offset: int = 0, tags: Optional[List[str]] = None, match: str = 'any') -> List[Job]:
+        """Get all jobs for a user, optionally filtered by status and tags"""
+        query = self._list_query(user_id, status, tags, match)
+        
+        return query.order_by(desc(Job.created_at), desc(Job.id)).offset(offset).limit(limit).all()
+
+    def get_jobs_page(self, user_id: int, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None, tags: Optional[List[str]] = None, match: str = 'any') -> Tuple[List[Job], Optional[str]]:
+        """
+        Get a page of jobs newest first, starting after ``cursor``.
+        Seeks on the (user_id, created_at, id) index instead of skipping rows,
+        so deep pages cost the same as the first. Returns the jobs and the
+        cursor for the next page (None on the last page).
+        """
+        query = self._list_query(user_id, status, tags, match)
+        
+        if cursor:
+            created_at, job_id = decode_job_cursor(cursor)
+            boundary = self._created_at_bound(created_at)
+            query = query.filter(or_(
+                Job.created_at < boundary,
+                and_(Job.created_at == boundary, Job.id < job_id)
+            ))
+        
+        # One extra row tells us whether there is a next page
+        jobs = query.order_by(desc(Job.created_at), desc(Job.id)).limit(limit + 1).all()
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            return jobs, encode_job_cursor(jobs[-1])
+        return jobs, None
+
+    def get_board(self, user_id: int, lane_limit: int = 20) -> JobBoard:
+        """
+        Every status lane's job count and first ``lane_limit`` cards in lane
+        order, from one windowed query; lanes with more cards carry a cursor
+        for get_board_lane
+        """
+        ranked = select(
+            Job,
+            func.row_number().over(
+                partition_by=Job.status, order_by=(Job.lane_position, Job.id)
+            ).label('lane_rank'),
+            func.count().over(partition_by=Job.status).label('lane_count')
+        ).where(Job.user_id == user_id).subquery()
+        card = aliased(Job, ranked)
+        
+        rows = self.db.query(card, ranked.c.lane_count).options(
+            selectinload(card.contacts),
+            defer(card.note),
+            defer(card.company_description),
+            defer(card.position_description)
+        ).filter(ranked.c.lane_rank <= lane_limit).order_by(
+            ranked.c.status, ranked.c.lane_rank
+        ).all()
+        
+        lanes = {status: BoardLane(status=status, count=0, jobs=[]) for status in BOARD_STATUSES}
+        for job, lane_count in rows:
+            lane = lanes.setdefault(job.status, BoardLane(status=job.status, count=0, jobs=[]))
+            lane.count = lane_count
+            lane.jobs.append(JobSummary.model_validate(job))
+        for lane in lanes.values():
+            if lane.count > len(lane.jobs):
+                lane.next_cursor = encode_lane_cursor(lane.jobs[-1])
+        return JobBoard(lanes=list(lanes.values()))
+
+    def get_board_lane(self, user_id: int, status: str, limit: int = 20, cursor: Optional[str] = None) -> BoardLane:
+        """The next cards of one board lane, continuing from a lane cursor"""
+        query = self.db.query(Job).options(*JOB_LIST_OPTIONS).filter(Job.user_id == user_id, Job.status == status)
+        if cursor:
+            lane_position, job_id = decode_lane_cursor(cursor)
+            query = query.filter(or_(
+                Job.lane_position > lane_position,
+                and_(Job.lane_position == lane_position, Job.id > job_id)
+            ))
+        
+        jobs = query.order_by(Job.lane_position, Job.id).limit(limit + 1).all()
+        next_cursor = None
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            next_cursor = encode_lane_cursor(jobs[-1])
+        count = self.db.query(func.count(Job.id)).filter(Job.user_id == user_id, Job.status == status).scalar()
+        return BoardLane(
+            status=status,
+            count=count,
+            jobs=[JobSummary.model_validate(job) for job in jobs],
+            next_cursor=next_cursor
+        )
+
+    def _lane_tops(self, user_id: int, statuses: Iterable[str]) -> Dict[str, float]:
+        """Position of the top card in each of the user's ``statuses`` lanes that has cards"""
+        return dict(self.db.query(Job.status, func.min(Job.lane_position)).filter(
+            Job.user_id == user_id, Job.status.in_(list(statuses))
+        ).group_by(Job.status).all())
+
+    def _list_query(self, user_id: int, status: Optional[str], tags: Optional[List[str]], match: str):
+        query = self.db.query(Job).options(*JOB_LIST_OPTIONS).filter(Job.user_id == user_id)
         
         if status:
             query = query.filter(Job.status == status)
         
-        return query.order_by(desc(Job.created_at)).offset(offset).limit(limit).all()
+        # Tag filters go through the job_tags index rather than the JSON column
+        if tags:
+            query = query.filter(job_tag_index.matching(user_id, tags, match))
+        
+        return query
+
+    def get_tag_counts(self, user_id: int, limit: int = 100) -> List[dict]:
+        """Tag cloud for the user's jobs"""
+        return job_tag_index.counts(self.db, user_id, limit)
+
+    def _created_at_bound(self, created_at: datetime):
+        """
+        SQLite keeps datetimes as text and rows stamped by the func.now()
+        default have no fractional seconds, while a bound datetime is
+        rendered with ".000000"; compare against the row's own text form there
+        """
+        if self.db.get_bind().dialect.name != 'sqlite':
+            return created_at
+        timespec = 'microseconds' if created_at.microsecond else 'seconds'
+        return literal(created_at.isoformat(sep=' ', timespec=timespec), String)
 
     def get_job(self, user_id: int, job_id: int) -> Optional[Job]:
         """Get a specific job by ID"""
-        return self.db.query(Job).filter(
+        return self.db.query(Job).options(selectinload(Job.contacts)).filter(
             and_(Job.id == job_id, Job.user_id == user_id)
         ).first()
 
@@ -75,12 +360,26 @@ class JobService:
         if not job:
             return None
         
+        before = JobFacts.from_job(job)
+        
         # Update fields
         update_data = job_data.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(job, field, value)
         
+        after = JobFacts.from_job(job)
+        if after.status != before.status:
+            # A card changing lanes goes on top of its new lane
+            job.lane_position = _above(self._lane_tops(user_id, [after.status]).get(after.status))
+        if after != before:
+            self.rollups.apply(user_id, removed=[before], added=[after])
+        if any(field in SEARCH_FIELDS for field in update_data):
+            self.search_index.index([job])
+        if 'tags' in update_data:
+            job_tag_index.sync(self.db, [job])
+        
         job.updated_at = datetime.utcnow()
+        job.version = Job.version + 1
         self.db.commit()
         self.db.refresh(job)
         return job
@@ -91,6 +390,9 @@ class JobService:
         if not job:
             return False
         
+        self.rollups.apply(user_id, removed=[JobFacts.from_job(job)])
+        self.search_index.remove([job.id])
+        job_tag_index.remove(self.db, [job.id])
         self.db.delete(job)
         self.db.commit()
         return True
@@ -101,66 +403,161 @@ class JobService:
         if not update_data:
             return 0
         
-        # Update the timestamp
+        # Update the timestamp and version
         update_data['updated_at'] = datetime.utcnow()
+        update_data['version'] = Job.version + 1
+        
+        jobs_filter = and_(Job.id.in_(bulk_data.job_ids), Job.user_id == user_id)
+        
+        # Move the affected jobs' counts in the stats rollup if a counted field changes
+        changed_facts = {field: update_data[field] for field in JobFacts._fields if field in update_data}
+        if changed_facts:
+            before = [
+                JobFacts(*row) for row in self.db.query(
+                    Job.status, Job.company, Job.is_referral, Job.applied_date
+                ).filter(jobs_filter).all()
+            ]
+            after = [facts._replace(**changed_facts) for facts in before]
+            self.rollups.apply(user_id, removed=before, added=after)
+        
+        # Cards changing lanes go on top of the new lane, keeping their relative order
+        if 'status' in update_data:
+            new_status = update_data['status']
+            moving = [job_id for (job_id,) in self.db.query(Job.id).filter(
+                jobs_filter, Job.status != new_status
+            ).order_by(Job.lane_position, Job.id).all()]
+            if moving:
+                top = _above(self._lane_tops(user_id, [new_status]).get(new_status))
+                update_data['lane_position'] = case(
+                    {job_id: top - (len(moving) - 1 - i) for i, job_id in enumerate(moving)},
+                    value=Job.id,
+                    else_=Job.lane_position
+                )
         
         # Perform bulk update
-        result = self.db.query(Job).filter(
-            and_(
-                Job.id.in_(bulk_data.job_ids),
-                Job.user_id == user_id
-            )
-        ).update(update_data, synchronize_session=False)
+        result = self.db.query(Job).filter(jobs_filter).update(update_data, synchronize_session=False)
+        
+        if any(field in SEARCH_FIELDS for field in update_data):
+            updated_jobs = self.db.query(Job).filter(jobs_filter).populate_existing().all()
+            self.search_index.index(updated_jobs)
+            if 'tags' in update_data:
+                job_tag_index.sync(self.db, updated_jobs)
         
         self.db.commit()
         return result
 
-    def get_job_stats(self, user_id: int) -> JobStats:
-        """Get job statistics for a user"""
-        # Total jobs
-        total_jobs = self.db.query(Job).filter(Job.user_id == user_id).count()
-        
-        # Jobs by status
-        status_counts = self.db.query(
-            Job.status, 
-            func.count(Job.id).label('count')
-        ).filter(Job.user_id == user_id).group_by(Job.status).all()
-        
-        jobs_by_status = {status: count for status, count in status_counts}
-        
-        # Jobs by company (top 10)
-        company_counts = self.db.query(
-            Job.company,
-            func.count(Job.id).label('count')
-        ).filter(Job.user_id == user_id).group_by(Job.company).order_by(
-            desc('count')
-        ).limit(10).all()
-        
-        jobs_by_company = {company: count for company, count in company_counts}
-        
-        # Recent applications (last 30 days)
-        thirty_days_ago = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=30)
-        
-        recent_applications = self.db.query(Job).filter(
-            and_(
-                Job.user_id == user_id,
-                Job.applied_date >= thirty_days_ago
-            )
-        ).count()
-        
-        # Interview rate (interviews / applied jobs)
-        applied_count = jobs_by_status.get('applied', 0)
-        interview_count = jobs_by_status.get('interview', 0)
-        interview_rate = (interview_count / applied_count * 100) if applied_count > 0 else 0
-        
-        return JobStats(
-            total_jobs=total_jobs,
-            jobs_by_status=jobs_by_status,
-            jobs_by_company=jobs_by_company,
-            recent_applications=recent_applications,
-            interview_rate=round(interview_rate, 2)
+    def move_jobs(self, user_id: int, moves: List[JobMove]) -> JobMoveResult:
+        """
+        Apply a batch of board moves (lane and position) in one UPDATE.
+        A move only applies if its job is still at the version it was made
+        against; otherwise it's reported as a conflict with the job's
+        current lane, position and version. Later moves of the same job
+        replace earlier ones.
+        """
+        latest = {move.job_id: move for move in moves}
+        current = {
+            row.id: row for row in self.db.query(
+                Job.id, Job.status, Job.company, Job.is_referral, Job.applied_date, Job.lane_position, Job.version
+            ).filter(Job.id.in_(list(latest)), Job.user_id == user_id).all()
+        }
+        candidates = [
+            move for move in latest.values()
+            if move.job_id in current and current[move.job_id].version == move.version
+        ]
+        
+        moved = set()
+        if candidates:
+            # The version check is repeated in the statement, so a write that
+            # lands after the read above turns the move into a conflict
+            moved = set(self.db.scalars(
+                update(Job)
+                .where(
+                    Job.user_id == user_id,
+                    Job.id.in_([move.job_id for move in candidates]),
+                    Job.version == case({move.job_id: move.version for move in candidates}, value=Job.id)
+                )
+                .values(
+                    status=case({move.job_id: move.status for move in candidates}, value=Job.id),
+                    lane_position=case({move.job_id: move.lane_position for move in candidates}, value=Job.id),
+                    version=Job.version + 1,
+                    updated_at=datetime.utcnow()
+                )
+                .returning(Job.id)
+                .execution_options(synchronize_session=False)
+            ))
+            
+            # Lane changes move the jobs' counts in the stats rollup
+            lane_changes = [job_id for job_id in moved if current[job_id].status != latest[job_id].status]
+            if lane_changes:
+                before = [JobFacts(*current[job_id][1:5]) for job_id in lane_changes]
+                after = [facts._replace(status=latest[job_id].status) for facts, job_id in zip(before, lane_changes)]
+                self.rollups.apply(user_id, removed=before, added=after)
+            self.db.commit()
+        
+        results = []
+        for job_id, move in latest.items():
+            row = current.get(job_id)
+            if row is None:
+                results.append(JobMoveOutcome(job_id=job_id, result='not_found'))
+            elif job_id in moved:
+                results.append(JobMoveOutcome(
+                    job_id=job_id, result='moved', status=move.status,
+                    lane_position=move.lane_position, version=row.version + 1
+                ))
+            else:
+                results.append(JobMoveOutcome(
+                    job_id=job_id, result='conflict', status=row.status,
+                    lane_position=row.lane_position, version=row.version
+                ))
+        return JobMoveResult(moved=len(moved), results=results)
+
+    def search_jobs(self, user_id: int, query: str, limit: int = 20, offset: int = 0) -> Tuple[List[Tuple[Job, SearchHit]], Optional[int]]:
+        """
+        Full-text search over the user's jobs, best match first.
+        Returns (job, hit) pairs and the offset of the next page (None on the last page).
+        """
+        hits = self.search_index.search(user_id, query, limit + 1, offset)
+        next_offset = offset + limit if len(hits) > limit else None
+        hits = hits[:limit]
+        
+        jobs = {
+            job.id: job for job in self.db.query(Job).options(*JOB_LIST_OPTIONS).filter(
+                Job.id.in_([hit.job_id for hit in hits])
+            ).all()
+        }
+        return [(jobs[hit.job_id], hit) for hit in hits if hit.job_id in jobs], next_offset
+
+    def bulk_delete_jobs(self, user_id: int, job_ids: List[int]) -> JobBulkDeleteResult:
+        """
+        Delete many jobs with one ownership query and set-based deletes,
+        reporting each requested id as deleted or not_found
+        """
+        owned = self.db.query(
+            Job.id, Job.status, Job.company, Job.is_referral, Job.applied_date
+        ).filter(Job.id.in_(job_ids), Job.user_id == user_id).all()
+        owned_ids = [row.id for row in owned]
+        
+        if owned_ids:
+            self.rollups.apply(user_id, removed=[JobFacts(*row[1:]) for row in owned])
+            self.search_index.remove(owned_ids)
+            job_tag_index.remove(self.db, owned_ids)
+            self.db.execute(delete(Contact).where(Contact.job_id.in_(owned_ids)))
+            self.db.execute(delete(Job).where(Job.id.in_(owned_ids)))
+            self.db.commit()
+        
+        owned_set = set(owned_ids)
+        return JobBulkDeleteResult(
+            deleted=len(owned_ids),
+            results=[
+                JobBulkDeleteOutcome(job_id=job_id, status='deleted' if job_id in owned_set else 'not_found')
+                for job_id in dict.fromkeys(job_ids)
+            ]
         )
 
+    def get_job_stats(self, user_id: int) -> JobStats:
+        """Get job statistics for a user from their incrementally maintained rollup"""
+        return self.rollups.get_stats(user_id)
+
     def add_contact(self, user_id: int, job_id: int, contact_data: ContactCreate) -> Optional[Contact]:
         """Add a contact to a job"""
         job = self.get_job(user_id, job_id)
@@ -180,6 +577,45 @@ class JobService:
         self.db.refresh(contact)
         return contact
 
+    def bulk_add_contacts(self, user_id: int, items: List[ContactBulkItem]) -> ContactBulkResult:
+        """
+        Attach many contacts with one ownership query and one multi-row INSERT,
+        reporting each item as created or failed (job not found)
+        """
+        owned_ids = set(self.db.scalars(
+            select(Job.id).where(Job.id.in_({item.job_id for item in items}), Job.user_id == user_id)
+        ))
+        
+        valid = [(index, item) for index, item in enumerate(items) if item.job_id in owned_ids]
+        created = {}
+        if valid:
+            # Ids are assigned in VALUES order, so sorting by id lines the contacts up with
+            # the items (sort_by_parameter_order=True falls back to one INSERT per row on SQLite)
+            contacts = sorted(
+                self.db.scalars(insert(Contact).returning(Contact), [item.model_dump() for _, item in valid]),
+                key=lambda contact: contact.id
+            )
+            # Serialize before the commit expires the new rows
+            created = {
+                index: ContactResponse.model_validate(contact)
+                for (index, _), contact in zip(valid, contacts)
+            }
+            self.db.commit()
+        
+        return ContactBulkResult(
+            created=len(created),
+            results=[
+                ContactBulkOutcome(
+                    index=index,
+                    job_id=item.job_id,
+                    success=index in created,
+                    contact=created.get(index),
+                    error=None if index in created else "Job not found"
+                )
+                for index, item in enumerate(items)
+            ]
+        )
+
     def update_contact(self, user_id: int, job_id: int, contact_id: int, contact_data: dict) -> Optional[Contact]:
         """Update a contact"""
         # Verify the job belongs to the user
@@ -0,0 +1,371 @@
+import bisect
+import heapq
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Optional, Dict, List, Tuple
+
+import requests
+from rapidfuzz import process, fuzz
+
+from app.core.config import settings
+
+LEETCODE_PROBLEMS_URL = "https://leetcode.com/api/problems/all/"
+
+DIFFICULTY_MAP = {1: 'EASY', 2: 'MEDIUM', 3: 'HARD'}
+
+# Backoff between load attempts while no catalog could be loaded
+LOAD_RETRY_MIN_SECONDS = 30
+LOAD_RETRY_MAX_SECONDS = 900
+
+
+def normalize_title(name: str) -> str:
+    """Normalize a problem title for matching (lowercase, no punctuation, single spaces)"""
+    cleaned = re.sub(r'[^\w\s]', '', name.lower())
+    return ' '.join(cleaned.split())
+
+
+def trigrams(text: str) -> set:
+    """Return the set of character trigrams of a normalized string"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CatalogIndex:
+    """Immutable, compact index over the LeetCode problem list.
+
+    Entries are stored as parallel lists so a lookup only has to hand the
+    prebuilt ``choices`` list to rapidfuzz and map the winning position back.
+    For typeahead, ``prefix_keys`` is a sorted list of every word-start suffix
+    of each title (a flattened prefix trie searched with bisect), and
+    ``trigram_postings`` maps each trigram to the positions containing it.
+    """
+
+    def __init__(self, problems: List[Dict]):
+        self.titles: List[str] = []
+        self.slugs: List[str] = []
+        self.difficulties: List[str] = []
+        self.choices: List[str] = []
+        self.by_slug: Dict[str, int] = {}
+
+        for problem in problems:
+            title = problem.get('title')
+            slug = problem.get('slug')
+            if not title or not slug or slug in self.by_slug:
+                continue
+            self.by_slug[slug] = len(self.slugs)
+            self.titles.append(title)
+            self.slugs.append(slug)
+            self.difficulties.append(problem.get('difficulty', 'MEDIUM'))
+            self.choices.append(normalize_title(title))
+
+        prefix_keys: List[Tuple[str, int]] = []
+        trigram_postings: Dict[str, List[int]] = defaultdict(list)
+        for position, choice in enumerate(self.choices):
+            words = choice.split(' ')
+            for start in range(len(words)):
+                prefix_keys.append((' '.join(words[start:]), position))
+            for trigram in trigrams(choice):
+                trigram_postings[trigram].append(position)
+        prefix_keys.sort()
+        self.prefix_keys = prefix_keys
+        self.trigram_postings = dict(trigram_postings)
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+    def entry(self, position: int) -> Dict:
+        """Return the catalog entry stored at ``position``"""
+        return {
+            'title': self.titles[position],
+            'slug': self.slugs[position],
+            'difficulty': self.difficulties[position],
+        }
+
+    def prefix_matches(self, prefix: str, limit: int) -> List[int]:
+        """Return positions whose title, or any word in it, starts with ``prefix``
+
+        Whole-title prefix matches rank ahead of mid-title word matches, and
+        shorter titles rank ahead of longer ones.
+        """
+        start = bisect.bisect_left(self.prefix_keys, (prefix, -1))
+        ranked = {}
+        for offset in range(start, len(self.prefix_keys)):
+            key, position = self.prefix_keys[offset]
+            if not key.startswith(prefix):
+                break
+            is_title_prefix = key == self.choices[position]
+            rank = (0 if is_title_prefix else 1, len(self.choices[position]))
+            if position not in ranked or rank < ranked[position]:
+                ranked[position] = rank
+        return heapq.nsmallest(limit, ranked, key=ranked.get)
+
+    def trigram_matches(self, query: str, limit: int) -> List[Tuple[int, float]]:
+        """Return ``(position, score)`` pairs for fuzzy matches of ``query``
+
+        Candidates are the titles sharing the most trigrams with the query,
+        which are then re-scored with rapidfuzz.
+        """
+        overlap = Counter()
+        for trigram in trigrams(query):
+            overlap.update(self.trigram_postings.get(trigram, ()))
+        if not overlap:
+            return []
+
+        candidates = [position for position, _ in overlap.most_common(limit * 5)]
+        scored = process.extract(
+            query,
+            {position: self.choices[position] for position in candidates},
+            scorer=fuzz.WRatio,
+            limit=limit,
+            score_cutoff=50
+        )
+        return [(position, score) for _, score, position in scored]
+
+    def to_snapshot(self) -> List[Dict]:
+        return [self.entry(position) for position in range(len(self))]
+
+
+class LeetCodeCatalog:
+    """In-process LeetCode problem catalog backed by a local snapshot file.
+
+    The catalog is loaded once (from the snapshot if present, otherwise from
+    the LeetCode API) and then refreshed periodically by a daemon thread.
+    Refreshes build a new ``CatalogIndex`` and swap it in, so lookups never
+    block on the network.
+    """
+
+    def __init__(self, snapshot_path: str, refresh_interval: int):
+        self.snapshot_path = snapshot_path
+        self.refresh_interval = refresh_interval
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        self._index: Optional[CatalogIndex] = None
+        self._empty_index = CatalogIndex([])
+        self._load_lock = threading.Lock()
+        self._retry_at = 0.0
+        self._retry_delay = LOAD_RETRY_MIN_SECONDS
+        self._stop_event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def index(self) -> CatalogIndex:
+        """Return the current index, loading it on first use
+
+        An empty catalog is never cached: until a load succeeds this returns
+        an empty index and the load is retried after a growing backoff.
+        """
+        if self._index is None and time.monotonic() >= self._retry_at:
+            with self._load_lock:
+                if self._index is None and time.monotonic() >= self._retry_at:
+                    self._load_initial_index()
+        return self._index if self._index is not None else self._empty_index
+
+    def match(self, problem_name: str, score_cutoff: float = 85) -> Optional[Dict]:
+        """Return the best catalog entry for ``problem_name`` or None"""
+        index = self.index
+        if not index.choices:
+            return None
+
+        result = process.extractOne(
+            normalize_title(problem_name),
+            index.choices,
+            scorer=fuzz.ratio,
+            score_cutoff=score_cutoff
+        )
+        if not result:
+            return None
+
+        _, score, position = result
+        entry = index.entry(position)
+        entry['score'] = score
+        return entry
+
+    def match_many(self, problem_names: List[str], score_cutoff: float = 85) -> List[Optional[Dict]]:
+        """Resolve a list of names in one vectorized pass (rapidfuzz cdist)
+
+        Returns one entry (or None) per input name, in input order.
+        """
+        index = self.index
+        if not problem_names:
+            return []
+        if not index.choices:
+            return [None] * len(problem_names)
+
+        scores = process.cdist(
+            [normalize_title(name) for name in problem_names],
+            index.choices,
+            scorer=fuzz.ratio,
+            score_cutoff=score_cutoff,
+            workers=-1
+        )
+        best_positions = scores.argmax(axis=1)
+
+        matches: List[Optional[Dict]] = []
+        for row, position in enumerate(best_positions):
+            score = float(scores[row, position])
+            if score < score_cutoff:
+                matches.append(None)
+                continue
+            entry = index.entry(int(position))
+            entry['score'] = score
+            matches.append(entry)
+        return matches
+
+    def suggest(self, query: str, limit: int = 10) -> List[Dict]:
+        """Return up to ``limit`` ranked typeahead candidates for ``query``
+
+        Served purely from the in-memory index; if the catalog hasn't been
+        loaded yet this returns no suggestions instead of blocking on the
+        network.
+        """
+        index = self._index
+        normalized = normalize_title(query)
+        if index is None or not normalized:
+            return []
+
+        positions = index.prefix_matches(normalized, limit)
+        scores = {position: 100.0 for position in positions}
+        if len(positions) < limit:
+            for position, score in index.trigram_matches(normalized, limit):
+                if position not in scores:
+                    positions.append(position)
+                    scores[position] = score
+                if len(positions) >= limit:
+                    break
+
+        suggestions = []
+        for position in positions:
+            entry = index.entry(position)
+            entry['score'] = scores[position]
+            suggestions.append(entry)
+        return suggestions
+
+    def get_by_slug(self, slug: str) -> Optional[Dict]:
+        """Return the catalog entry for an exact slug"""
+        index = self.index
+        position = index.by_slug.get(slug)
+        if position is None:
+            return None
+        return index.entry(position)
+
+    def refresh(self) -> bool:
+        """Fetch the problem list from LeetCode and swap in a new index"""
+        try:
+            problems = self._fetch_problems()
+        except Exception as e:
+            print(f"LeetCode catalog refresh error: {e}")
+            return False
+
+        if not problems:
+            return False
+
+        index = CatalogIndex(problems)
+        self._index = index
+        self._retry_delay = LOAD_RETRY_MIN_SECONDS
+        self._write_snapshot(index)
+        return True
+
+    def start_background_refresh(self) -> None:
+        """Start the periodic refresh thread (idempotent)"""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            name="leetcode-catalog-refresh",
+            daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self) -> None:
+        self._stop_event.set()
+
+    def _refresh_loop(self) -> None:
+        # Warm the index first so the first autofill request doesn't pay for it
+        self.index
+        while True:
+            if self._index is None:
+                # Nothing loaded yet: retry on the load backoff rather than the refresh interval
+                delay = max(self._retry_at - time.monotonic(), 0)
+            else:
+                delay = self.refresh_interval
+            if self._stop_event.wait(delay):
+                return
+            if self._index is None:
+                self.index
+            else:
+                self.refresh()
+
+    def _load_initial_index(self) -> None:
+        problems = self._read_snapshot()
+        if problems:
+            self._index = CatalogIndex(problems)
+            return
+
+        try:
+            problems = self._fetch_problems()
+        except Exception as e:
+            print(f"LeetCode catalog load error: {e}")
+            problems = []
+
+        if not problems:
+            self._retry_at = time.monotonic() + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, LOAD_RETRY_MAX_SECONDS)
+            return
+
+        index = CatalogIndex(problems)
+        self._index = index
+        self._retry_delay = LOAD_RETRY_MIN_SECONDS
+        self._write_snapshot(index)
+
+    def _fetch_problems(self) -> List[Dict]:
+        response = requests.get(LEETCODE_PROBLEMS_URL, headers=self.headers, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+
+        problems = []
+        for problem in data.get('stat_status_pairs', []):
+            stat = problem.get('stat', {})
+            problems.append({
+                'title': stat.get('question__title', ''),
+                'slug': stat.get('question__title_slug', ''),
+                'difficulty': DIFFICULTY_MAP.get(problem.get('difficulty', {}).get('level'), 'MEDIUM'),
+            })
+        return problems
+
+    def _read_snapshot(self) -> List[Dict]:
+        if not os.path.exists(self.snapshot_path):
+            return []
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"LeetCode catalog snapshot error: {e}")
+            return []
+
+    def _write_snapshot(self, index: CatalogIndex) -> None:
+        if not len(index):
+            return
+        # Write to a temp file and rename so readers never see a partial snapshot
+        tmp_path = f"{self.snapshot_path}.tmp"
+        try:
+            directory = os.path.dirname(self.snapshot_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index.to_snapshot(), f)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            print(f"LeetCode catalog snapshot write error: {e}")
+
+
+# Create a singleton instance
+leetcode_catalog = LeetCodeCatalog(
+    snapshot_path=settings.LEETCODE_CATALOG_PATH,
+    refresh_interval=settings.LEETCODE_CATALOG_REFRESH_SECONDS
+)
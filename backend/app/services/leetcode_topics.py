@@ -0,0 +1,305 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple
+
+import requests
+
+from app.core.config import settings
+
+LEETCODE_GRAPHQL_URL = "https://leetcode.com/graphql"
+
+# Single-slug lookups only mark the store dirty; it is written at most this often
+STORE_FLUSH_SECONDS = 30
+# Backoff before retrying a prefetch that failed part way through
+PREFETCH_RETRY_MIN_SECONDS = 60
+PREFETCH_RETRY_MAX_SECONDS = 3600
+# Concurrent single-slug lookups when a batch has several misses
+MAX_CONCURRENT_LOOKUPS = 8
+
+QUESTION_LIST_QUERY = """
+query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
+    problemsetQuestionList: questionList(
+        categorySlug: $categorySlug
+        limit: $limit
+        skip: $skip
+        filters: $filters
+    ) {
+        total: totalNum
+        questions: data {
+            titleSlug
+            topicTags {
+                name
+            }
+        }
+    }
+}
+"""
+
+
+class TopicTagCache:
+    """LRU + TTL cache of LeetCode topic tags keyed by ``titleSlug``.
+
+    The cache is filled in bulk by paging through ``problemsetQuestionList``
+    and persisted to a local JSON store so it survives restarts. A slug that
+    is missing or expired falls back to a single GraphQL lookup, which the
+    background thread flushes to the store in batches.
+    """
+
+    def __init__(self, store_path: str, ttl: int, max_size: int, page_size: int):
+        self.store_path = store_path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.page_size = page_size
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        self._entries: "OrderedDict[str, Tuple[List[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._retry_delay = PREFETCH_RETRY_MIN_SECONDS
+        self._stop_event = threading.Event()
+        self._prefetch_thread: Optional[threading.Thread] = None
+
+    def get_topics(self, slug: str) -> List[str]:
+        """Return topic tags for ``slug``, hitting the network only on a miss"""
+        self._ensure_loaded()
+        cached = self._get(slug)
+        if cached is not None and not self._is_expired(cached[1]):
+            return cached[0]
+
+        topics = self._fetch_single(slug)
+        if topics is None:
+            # Serve stale data rather than nothing if LeetCode is unavailable
+            return cached[0] if cached is not None else []
+
+        self._put_many({slug: topics}, time.time())
+        return topics
+
+    def get_many_topics(self, slugs: List[str]) -> Dict[str, List[str]]:
+        """Return topic tags for each slug, looking up all misses concurrently"""
+        self._ensure_loaded()
+        topics_by_slug: Dict[str, List[str]] = {}
+        stale: Dict[str, List[str]] = {}
+        for slug in dict.fromkeys(slugs):
+            cached = self._get(slug)
+            if cached is not None and not self._is_expired(cached[1]):
+                topics_by_slug[slug] = cached[0]
+            else:
+                stale[slug] = cached[0] if cached is not None else []
+
+        if not stale:
+            return topics_by_slug
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_LOOKUPS, len(stale))) as executor:
+            fetched = dict(zip(stale, executor.map(self._fetch_single, stale)))
+
+        self._put_many({slug: topics for slug, topics in fetched.items() if topics is not None}, time.time())
+        for slug, topics in fetched.items():
+            # Serve stale data rather than nothing if LeetCode is unavailable
+            topics_by_slug[slug] = topics if topics is not None else stale[slug]
+        return topics_by_slug
+
+    def prefetch(self) -> Optional[int]:
+        """
+        Page through the whole question list and cache every slug's tags
+        Returns the number of slugs cached, or None if LeetCode failed part way
+        """
+        self._ensure_loaded()
+        fetched: Dict[str, List[str]] = {}
+        skip = 0
+        total = None
+        complete = True
+
+        while total is None or skip < total:
+            try:
+                page_total, questions = self._fetch_page(skip, self.page_size)
+            except Exception as e:
+                print(f"LeetCode topics prefetch error: {e}")
+                complete = False
+                break
+
+            total = page_total
+            if not questions:
+                break
+
+            for question in questions:
+                slug = question.get('titleSlug')
+                if slug:
+                    fetched[slug] = [tag.get('name', '') for tag in question.get('topicTags') or []]
+            skip += len(questions)
+
+        if fetched:
+            self._put_many(fetched, time.time())
+            self._flush_store()
+        return len(fetched) if complete else None
+
+    def start_background_prefetch(self) -> None:
+        """Start the periodic prefetch thread (idempotent)"""
+        if self._prefetch_thread and self._prefetch_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_loop,
+            name="leetcode-topics-prefetch",
+            daemon=True
+        )
+        self._prefetch_thread.start()
+
+    def stop_background_prefetch(self) -> None:
+        self._stop_event.set()
+        self._flush_store()
+
+    def _prefetch_loop(self) -> None:
+        self._ensure_loaded()
+        # Skip the initial prefetch when the on-disk store is still fresh
+        next_prefetch = time.monotonic() + (self.ttl / 2 if not self._store_is_stale() else 0)
+        while True:
+            if time.monotonic() >= next_prefetch:
+                next_prefetch = time.monotonic() + self._next_prefetch_delay(self.prefetch() is not None)
+            self._flush_store()
+            wait = min(STORE_FLUSH_SECONDS, max(next_prefetch - time.monotonic(), 0))
+            if self._stop_event.wait(wait):
+                break
+        self._flush_store()
+
+    def _next_prefetch_delay(self, succeeded: bool) -> float:
+        if succeeded:
+            self._retry_delay = PREFETCH_RETRY_MIN_SECONDS
+            return self.ttl / 2
+        delay = min(self._retry_delay, self.ttl / 2)
+        self._retry_delay = min(self._retry_delay * 2, PREFETCH_RETRY_MAX_SECONDS)
+        return delay
+
+    def _get(self, slug: str) -> Optional[Tuple[List[str], float]]:
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is not None:
+                self._entries.move_to_end(slug)
+            return entry
+
+    def _put_many(self, topics_by_slug: Dict[str, List[str]], fetched_at: float) -> None:
+        with self._lock:
+            for slug, topics in topics_by_slug.items():
+                self._entries[slug] = (topics, fetched_at)
+                self._entries.move_to_end(slug)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def _is_expired(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at > self.ttl
+
+    def _store_is_stale(self) -> bool:
+        with self._lock:
+            if not self._entries:
+                return True
+            oldest = min(fetched_at for _, fetched_at in self._entries.values())
+        return time.time() - oldest > self.ttl / 2
+
+    def _fetch_page(self, skip: int, limit: int) -> Tuple[int, List[Dict]]:
+        variables = {
+            "categorySlug": "",
+            "skip": skip,
+            "limit": limit,
+            "filters": {}
+        }
+        response = requests.post(
+            LEETCODE_GRAPHQL_URL,
+            json={'query': QUESTION_LIST_QUERY, 'variables': variables},
+            headers=self.headers,
+            timeout=30
+        )
+        response.raise_for_status()
+        data = response.json().get('data', {}).get('problemsetQuestionList') or {}
+        return data.get('total') or 0, data.get('questions') or []
+
+    def _fetch_single(self, slug: str) -> Optional[List[str]]:
+        variables = {
+            "categorySlug": "",
+            "skip": 0,
+            "limit": 1,
+            "filters": {"searchKeywords": slug}
+        }
+        try:
+            response = requests.post(
+                LEETCODE_GRAPHQL_URL,
+                json={'query': QUESTION_LIST_QUERY, 'variables': variables},
+                headers=self.headers,
+                timeout=10
+            )
+            if response.status_code != 200:
+                return None
+            data = response.json().get('data', {}).get('problemsetQuestionList') or {}
+            questions = data.get('questions') or []
+        except Exception as e:
+            print(f"LeetCode topics error: {e}")
+            return None
+
+        for question in questions:
+            if question.get('titleSlug') == slug:
+                return [tag.get('name', '') for tag in question.get('topicTags') or []]
+        if questions:
+            return [tag.get('name', '') for tag in questions[0].get('topicTags') or []]
+        return []
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            for slug, (topics, fetched_at) in self._read_store().items():
+                self._entries[slug] = (topics, fetched_at)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            self._loaded = True
+
+    def _read_store(self) -> Dict[str, Tuple[List[str], float]]:
+        if not os.path.exists(self.store_path):
+            return {}
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            return {slug: (entry['topics'], entry['fetched_at']) for slug, entry in raw.items()}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"LeetCode topics store error: {e}")
+            return {}
+
+    def _flush_store(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            snapshot = {
+                slug: {'topics': topics, 'fetched_at': fetched_at}
+                for slug, (topics, fetched_at) in self._entries.items()
+            }
+        # Write to a temp file and rename so readers never see a partial store
+        tmp_path = f"{self.store_path}.tmp"
+        with self._write_lock:
+            try:
+                directory = os.path.dirname(self.store_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp_path, self.store_path)
+            except OSError as e:
+                print(f"LeetCode topics store write error: {e}")
+                with self._lock:
+                    self._dirty = True
+
+
+# Create a singleton instance
+topic_tag_cache = TopicTagCache(
+    store_path=settings.LEETCODE_TOPICS_PATH,
+    ttl=settings.LEETCODE_TOPICS_TTL_SECONDS,
+    max_size=settings.LEETCODE_TOPICS_CACHE_SIZE,
+    page_size=settings.LEETCODE_TOPICS_PAGE_SIZE
+)
@@ -0,0 +1,122 @@
+"""
+Versioned schema and data migrations.
+
+``Base.metadata.create_all`` creates missing tables but never changes an
+existing one, so every change to a table that may already exist is a
+numbered step in MIGRATIONS. Applied steps are recorded in the
+``schema_migrations`` table and never run again, and each step also checks
+the database before changing it, so re-running one is harmless.
+
+The app applies pending steps on startup. To apply them ahead of a deploy
+instead, run from the backend directory:
+
+    python -m app.services.migrations
+
+All pending steps run in one transaction. On Postgres, that transaction
+first takes an advisory lock, so several workers starting at once apply
+them one at a time: later workers find them recorded and skip them. A
+lock_timeout makes a step fail, rolling back the whole run, instead of
+queueing for a table lock behind long-running transactions.
+"""
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, func, insert, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateColumn
+
+from app.models.extraction_job import ExtractionJob
+from app.models.job import Job
+from app.services.job_search import ensure_search_index
+from app.services.jobs import backfill_lane_positions
+from app.services.tag_index import job_tag_index, problem_topic_index
+
+# Postgres advisory lock key held while migrations run
+MIGRATION_LOCK_KEY = 7240118
+
+# How long a Postgres migration waits for a table lock before failing
+POSTGRES_LOCK_TIMEOUT = '10s'
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", String(100), primary_key=True),
+    Column("applied_at", DateTime, server_default=func.now()),
+)
+
+
+def _add_missing_columns(conn: Connection, table: Table, names: List[str]) -> None:
+    """Add declared columns missing from an existing table (they must be nullable or have a server default)"""
+    existing = {column["name"] for column in inspect(conn).get_columns(table.name)}
+    for name in names:
+        if name not in existing:
+            column = CreateColumn(table.c[name]).compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column}")
+
+
+def _create_indexes(conn: Connection, table: Table) -> None:
+    for index in table.indexes:
+        index.create(bind=conn, checkfirst=True)
+
+
+def _job_board_columns(conn: Connection) -> None:
+    # Also creates the job list and board indexes; the board one needs lane_position
+    _add_missing_columns(conn, Job.__table__, ['lane_position', 'version'])
+    _create_indexes(conn, Job.__table__)
+    # Jobs from before lane_position existed go on top of their lane, newest first
+    with Session(bind=conn) as db:
+        backfill_lane_positions(db)
+
+
+def _job_search_index(conn: Connection) -> None:
+    ensure_search_index(conn)
+
+
+def _tag_indexes(conn: Connection) -> None:
+    with Session(bind=conn) as db:
+        job_tag_index.backfill(db)
+        problem_topic_index.backfill(db)
+
+
+def _extraction_job_tokens(conn: Connection) -> None:
+    _add_missing_columns(conn, ExtractionJob.__table__, ['token'])
+    _create_indexes(conn, ExtractionJob.__table__)
+
+
+# (version, step) in the order they're applied; append new steps, never reorder or rename them
+MIGRATIONS: List[Tuple[str, Callable[[Connection], None]]] = [
+    ("0001_job_board_columns", _job_board_columns),
+    ("0002_job_search_index", _job_search_index),
+    ("0003_tag_indexes", _tag_indexes),
+    ("0004_extraction_job_tokens", _extraction_job_tokens),
+]
+
+
+def run_migrations(engine: Engine) -> List[str]:
+    """Apply the pending migrations in one transaction; returns the versions applied"""
+    with engine.begin() as conn:
+        if conn.dialect.name == 'postgresql':
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': MIGRATION_LOCK_KEY})
+            conn.execute(text(f"SET LOCAL lock_timeout = '{POSTGRES_LOCK_TIMEOUT}'"))
+        schema_migrations.create(conn, checkfirst=True)
+
+        applied = set(conn.scalars(select(schema_migrations.c.version)))
+        pending = [(version, step) for version, step in MIGRATIONS if version not in applied]
+        for version, step in pending:
+            step(conn)
+            conn.execute(insert(schema_migrations).values(version=version))
+        return [version for version, _ in pending]
+
+
+def main() -> None:
+    from app import models  # noqa: F401  (registers the tables)
+    from app.db.base import Base
+    from app.db.session import engine
+
+    Base.metadata.create_all(bind=engine)
+    applied = run_migrations(engine)
+    print(f"Applied {len(applied)} migrations{': ' + ', '.join(applied) if applied else ''}")
+
+
+if __name__ == "__main__":
+    main()
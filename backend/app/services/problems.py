@@ -1,10 +1,19 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.problem import Problem
-from app.schemas.problem import ProblemCreate, ProblemUpdate
+from app.schemas.problem import ProblemCreate, ProblemUpdate, ProblemResponse
+from app.services.tag_index import problem_topic_index
 from typing import Optional
+from datetime import datetime
 
-def list_problems(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> list[Problem]:
-    return db.query(Problem).filter(Problem.user_id == user_id).offset(skip).limit(limit).all()
+def list_problems(db: Session, user_id: int, skip: int = 0, limit: int = 100, topics: Optional[list[str]] = None, match: str = 'any') -> list[Problem]:
+    query = db.query(Problem).filter(Problem.user_id == user_id)
+    if topics:
+        query = query.filter(problem_topic_index.matching(user_id, topics, match))
+    return query.offset(skip).limit(limit).all()
+
+def topic_counts(db: Session, user_id: int, limit: int = 100) -> list[dict]:
+    return problem_topic_index.counts(db, user_id, limit)
 
 def get_problem(db: Session, problem_id: int, user_id: int) -> Optional[Problem]:
     return db.query(Problem).filter(Problem.id == problem_id, Problem.user_id == user_id).first()
@@ -21,10 +30,41 @@ def create_problem(db: Session, payload: ProblemCreate, user_id: int) -> Problem
         notes=payload.notes
     )
     db.add(obj)
+    db.flush()
+    problem_topic_index.sync(db, [obj])
     db.commit()
     db.refresh(obj)
     return obj
 
+def bulk_create_problems(db: Session, payloads: list[ProblemCreate], user_id: int) -> list[ProblemResponse]:
+    """Insert many problems with a single multi-row INSERT ... RETURNING, in request order"""
+    if not payloads:
+        return []
+    
+    created_at = datetime.utcnow()
+    rows = [
+        {
+            "user_id": user_id,
+            "name": payload.name,
+            "topics": payload.topics,
+            "difficulty": payload.difficulty,
+            "status": payload.status,
+            "link": str(payload.link) if payload.link else None,
+            "time_minutes": payload.time_minutes,
+            "notes": payload.notes,
+            "created_at": created_at
+        }
+        for payload in payloads
+    ]
+    # Ids are assigned in VALUES order, so sorting by id restores request order.
+    # (sort_by_parameter_order=True would fall back to one INSERT per row on SQLite.)
+    problems = sorted(db.scalars(insert(Problem).returning(Problem), rows), key=lambda problem: problem.id)
+    problem_topic_index.sync(db, problems)
+    # Serialize before the commit expires the rows, or each would be reloaded
+    created = [ProblemResponse.model_validate(problem) for problem in problems]
+    db.commit()
+    return created
+
 def update_problem(db: Session, problem_id: int, payload: ProblemUpdate, user_id: int) -> Optional[Problem]:
     problem = db.query(Problem).filter(Problem.id == problem_id, Problem.user_id == user_id).first()
     if not problem:
@@ -37,6 +77,8 @@ def update_problem(db: Session, problem_id: int, payload: ProblemUpdate, user_id
     for field, value in update_data.items():
         setattr(problem, field, value)
     
+    if 'topics' in update_data:
+        problem_topic_index.sync(db, [problem])
     db.commit()
     db.refresh(problem)
     return problem
@@ -46,6 +88,7 @@ def delete_problem(db: Session, problem_id: int, user_id: int) -> bool:
     if not problem:
         return False
     
+    problem_topic_index.remove(db, [problem.id])
     db.delete(problem)
     db.commit()
     return True
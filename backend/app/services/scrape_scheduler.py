@@ -0,0 +1,168 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any
+from urllib.parse import urlparse
+
+from app.core.config import settings
+
+# Statuses that mean the site is throttling or struggling (999 is LinkedIn's bot wall)
+UNHEALTHY_STATUSES = {429, 500, 502, 503, 504, 999}
+
+# Second-level labels under which a domain is one level deeper, e.g. "acme.co.uk"
+_SECOND_LEVEL_LABELS = {'co', 'com', 'ac', 'org', 'net', 'gov'}
+
+
+class DomainUnavailableError(Exception):
+    """Raised instead of fetching when a domain's circuit is open or its queue is too long"""
+
+
+def domain_key(url: str) -> str:
+    """Group hosts by registrable domain, so il.linkedin.com and www.linkedin.com share limits"""
+    host = (urlparse(url).hostname or '').lower()
+    labels = host.split('.')
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL_LABELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+@dataclass
+class _DomainState:
+    next_slot: float = 0.0
+    outcomes: deque = field(default_factory=deque)  # True for failures
+    consecutive_failures: int = 0
+    latency_ewma: Optional[float] = None
+    open_until: float = 0.0
+    cooldown: float = 0.0
+    probing: bool = False
+
+
+class ScrapeScheduler:
+    """Per-domain politeness and circuit breaking for page fetches.
+
+    ``acquire`` spaces requests to one domain at least ``min_interval``
+    apart and refuses outright when a caller would have to queue for more
+    than ``max_wait``. Each fetch outcome is recorded: enough failures in
+    the recent window (or a throttling status) opens the domain's circuit
+    for a cooldown that doubles while probes keep failing, and while it is
+    open ``acquire`` fails immediately so callers fall back without
+    waiting on timeouts. The per-request timeout also adapts to the
+    domain's observed latency.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_wait: float,
+        window: int = 20,
+        min_samples: int = 5,
+        failure_ratio: float = 0.5,
+        max_consecutive_failures: int = 3,
+        base_cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+        min_timeout: float = 3.0,
+        max_timeout: float = 10.0
+    ):
+        self.min_interval = min_interval
+        self.max_wait = max_wait
+        self.window = window
+        self.min_samples = min_samples
+        self.failure_ratio = failure_ratio
+        self.max_consecutive_failures = max_consecutive_failures
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._domains: Dict[str, _DomainState] = {}
+
+    async def acquire(self, url: str) -> float:
+        """Wait for this domain's next slot and return the timeout to fetch with"""
+        state = self._domains.setdefault(domain_key(url), _DomainState())
+        now = time.monotonic()
+
+        if state.open_until > now:
+            raise DomainUnavailableError(f"{domain_key(url)} is cooling down after repeated failures")
+        if state.open_until:
+            # Cooldown over: let a single probe through to test the waters
+            if state.probing:
+                raise DomainUnavailableError(f"{domain_key(url)} is being probed after repeated failures")
+            state.probing = True
+
+        slot = max(now, state.next_slot)
+        if slot - now > self.max_wait:
+            raise DomainUnavailableError(f"Too many queued requests for {domain_key(url)}")
+        state.next_slot = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        return self._timeout(state)
+
+    def record(self, url: str, latency: float, status_code: Optional[int] = None, retry_after: Optional[str] = None) -> None:
+        """Record a fetch outcome; ``status_code`` is None when the request itself failed"""
+        state = self._domains.setdefault(domain_key(url), _DomainState())
+        failed = status_code is None or status_code in UNHEALTHY_STATUSES
+
+        state.outcomes.append(failed)
+        while len(state.outcomes) > self.window:
+            state.outcomes.popleft()
+        if status_code is not None:
+            state.latency_ewma = latency if state.latency_ewma is None else 0.8 * state.latency_ewma + 0.2 * latency
+
+        if not failed:
+            state.consecutive_failures = 0
+            state.open_until = 0.0
+            state.cooldown = 0.0
+            state.probing = False
+            return
+
+        state.consecutive_failures += 1
+        failures = sum(state.outcomes)
+        throttled = status_code in (429, 999)
+        if (
+            throttled
+            or state.probing
+            or state.consecutive_failures >= self.max_consecutive_failures
+            or (len(state.outcomes) >= self.min_samples and failures / len(state.outcomes) >= self.failure_ratio)
+        ):
+            state.cooldown = min(self.max_cooldown, state.cooldown * 2 if state.cooldown else self.base_cooldown)
+            state.open_until = time.monotonic() + max(state.cooldown, _retry_after_seconds(retry_after))
+            state.probing = False
+
+    def release_probe(self, url: str) -> None:
+        """Free the half-open probe slot if a fetch ended without an outcome (e.g. cancelled)"""
+        state = self._domains.get(domain_key(url))
+        if state:
+            state.probing = False
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        return {
+            domain: {
+                "state": "open" if state.open_until > now else ("half_open" if state.open_until else "closed"),
+                "recent_requests": len(state.outcomes),
+                "recent_failures": sum(state.outcomes),
+                "latency_ms": round(state.latency_ewma * 1000) if state.latency_ewma is not None else None,
+                "retry_in_seconds": round(state.open_until - now, 1) if state.open_until > now else 0,
+            }
+            for domain, state in self._domains.items()
+        }
+
+    def _timeout(self, state: _DomainState) -> float:
+        if state.latency_ewma is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, 4 * state.latency_ewma))
+
+
+def _retry_after_seconds(value: Optional[str]) -> float:
+    # Only the delta-seconds form; HTTP-date values fall back to the cooldown
+    try:
+        return max(0.0, float(value)) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+# Create a singleton instance
+scrape_scheduler = ScrapeScheduler(
+    min_interval=settings.SCRAPE_MIN_INTERVAL_SECONDS,
+    max_wait=settings.SCRAPE_MAX_QUEUE_WAIT_SECONDS
+)
@@ -0,0 +1,101 @@
+"""
+Normalized tag indexes for the JSON tag lists on jobs (``Job.tags``) and
+problems (``Problem.topics``).
+
+Each list is mirrored into an association table (``job_tags``,
+``problem_topics``) with one case-folded row per tag, so "has tag" filters
+and tag counts are indexed SQL instead of loading every row into Python.
+The services call ``sync``/``remove`` in the same transaction as the
+write to the owning row.
+"""
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func, select, delete, insert
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+from app.models.problem import Problem
+from app.models.tag_index import JobTag, ProblemTopic
+
+MAX_TAG_LENGTH = 100
+
+
+def parse_tags(tags: Optional[str]) -> List[str]:
+    """Split a comma-separated ``?tags=`` value into case-folded tags"""
+    if not tags:
+        return []
+    return list(dict.fromkeys(tag.strip().casefold()[:MAX_TAG_LENGTH] for tag in tags.split(',') if tag.strip()))
+
+
+class TagIndex:
+    def __init__(self, model, owner_column: str, source_model, source_attribute: str):
+        self.model = model
+        self.owner = getattr(model, owner_column)
+        self.owner_column = owner_column
+        self.source_model = source_model
+        self.source_attribute = source_attribute
+
+    def sync(self, db: Session, owners: Iterable) -> None:
+        """Rewrite the index rows of ``owners`` from their tag lists. Doesn't commit."""
+        owners = list(owners)
+        if not owners:
+            return
+        self.remove(db, [owner.id for owner in owners])
+        rows = [
+            {self.owner_column: owner.id, 'user_id': owner.user_id, 'tag': tag, 'label': label}
+            for owner in owners
+            for tag, label in self._entries(getattr(owner, self.source_attribute)).items()
+        ]
+        if rows:
+            db.execute(insert(self.model), rows)
+
+    def remove(self, db: Session, owner_ids: Iterable[int]) -> None:
+        """Drop the index rows of deleted owners (SQLite doesn't cascade by default). Doesn't commit."""
+        owner_ids = list(owner_ids)
+        if owner_ids:
+            db.execute(delete(self.model).where(self.owner.in_(owner_ids)))
+
+    def matching(self, user_id: int, tags: List[str], match: str = 'any'):
+        """
+        Predicate on the owning model's id: rows carrying any (or, with
+        match='all', every) one of the case-folded ``tags``
+        """
+        owner_ids = select(self.owner).where(self.model.user_id == user_id, self.model.tag.in_(tags))
+        if match == 'all':
+            owner_ids = owner_ids.group_by(self.owner).having(func.count() == len(tags))
+        return self.source_model.id.in_(owner_ids)
+
+    def counts(self, db: Session, user_id: int, limit: int = 100) -> List[Dict]:
+        """Tag cloud: the user's tags with how many rows carry each, most used first"""
+        rows = db.execute(
+            select(self.model.tag, func.min(self.model.label), func.count().label('count'))
+            .where(self.model.user_id == user_id)
+            .group_by(self.model.tag)
+            .order_by(func.count().desc(), self.model.tag)
+            .limit(limit)
+        ).all()
+        return [{'tag': label, 'count': count} for _, label, count in rows]
+
+    def backfill(self, db: Session) -> int:
+        """Fill an empty index from the owning table; returns the number of rows indexed"""
+        if db.execute(select(self.owner).limit(1)).first() is not None:
+            return 0
+        owners = db.query(self.source_model).filter(
+            getattr(self.source_model, self.source_attribute).isnot(None)
+        ).all()
+        self.sync(db, owners)
+        db.commit()
+        return len(owners)
+
+    def _entries(self, tags: Optional[List[str]]) -> Dict[str, str]:
+        entries = {}
+        for tag in tags or []:
+            label = str(tag).strip()[:MAX_TAG_LENGTH]
+            if label:
+                entries.setdefault(label.casefold()[:MAX_TAG_LENGTH], label)
+        return entries
+
+
+# Create singleton instances
+job_tag_index = TagIndex(JobTag, 'job_id', Job, 'tags')
+problem_topic_index = TagIndex(ProblemTopic, 'problem_id', Problem, 'topics')
@@ -0,0 +1,250 @@
+"""
+Offline benchmark and accuracy harness for the job extractors.
+
+Serves the saved HTML fixtures in ``fixtures/extraction`` from a local
+HTTP server, runs each fixture through its extractor from
+``app.routers.job_extraction`` and reports throughput, p50/p99 latency,
+peak Python heap and field-level accuracy against the expected values in
+``manifest.json``. No network access is needed.
+
+Heap figures come from tracemalloc, which doesn't see libxml2's own
+allocations, so the process max RSS is printed alongside them.
+
+Run from the backend directory:
+
+    python -m benchmarks.extraction_bench
+    python -m benchmarks.extraction_bench --iterations 100 --fixture generic_custom_large
+    python -m benchmarks.extraction_bench --json results.json --min-accuracy 0.8
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Optional
+
+# Extractors record company logos in the database; keep the benchmark's writes out of app.db
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.gettempdir()}/trackernow_bench.db")
+# Every fixture is served from 127.0.0.1; per-domain politeness spacing would time the scheduler, not the parser
+os.environ.setdefault("SCRAPE_MIN_INTERVAL_SECONDS", "0")
+
+from app import models  # noqa: F401,E402  (registers the tables)
+from app.db.base import Base  # noqa: E402
+from app.db.session import engine  # noqa: E402
+from app.routers import job_extraction  # noqa: E402
+from app.services.http_client import http_client  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "extraction")
+MANIFEST_PATH = os.path.join(FIXTURES_DIR, "manifest.json")
+
+
+def load_manifest(selected: Optional[List[str]] = None) -> List[Dict]:
+    with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+        fixtures = json.load(f)["fixtures"]
+    if selected:
+        fixtures = [fixture for fixture in fixtures if fixture["name"] in selected]
+    return fixtures
+
+
+def inflate(html: bytes, target_kb: int) -> bytes:
+    """Pad a page to roughly ``target_kb`` with markup and inline script noise,
+    the way large career sites bloat their pages"""
+    row = (
+        '<div class="listing-row"><span class="meta">Related role</span>'
+        '<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod.</p></div>'
+    ).encode()
+    script = b'<script>window.__STATE__=' + b'"' + b'x' * (target_kb * 1024 // 10) + b'";</script>'
+    rows_needed = max(0, (target_kb * 1024 - len(html) - len(script)) // len(row))
+    filler = script + row * rows_needed
+    return html.replace(b"</body>", filler + b"</body>", 1)
+
+
+def load_pages(fixtures: List[Dict]) -> Dict[str, bytes]:
+    pages = {}
+    for fixture in fixtures:
+        with open(os.path.join(FIXTURES_DIR, fixture["file"]), "rb") as f:
+            html = f.read()
+        if fixture.get("inflate_kb"):
+            html = inflate(html, fixture["inflate_kb"])
+        pages[f"/{fixture['name']}"] = html
+    return pages
+
+
+def start_server(pages: Dict[str, bytes]) -> ThreadingHTTPServer:
+    """Start a local stand-in for the job sites on an ephemeral port"""
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without this, Nagle plus
+        # delayed ACKs add ~40ms to every keep-alive request
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            body = pages.get(self.path.split("?", 1)[0])
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def field_matches(expected, actual) -> bool:
+    if expected is None:
+        return not actual
+    if isinstance(expected, dict) and "contains" in expected:
+        return bool(actual) and expected["contains"] in actual
+    return actual == expected
+
+
+def score_accuracy(expected: Dict, result) -> Dict:
+    fields = {}
+    for name, expected_value in expected.items():
+        actual = getattr(result, name, None)
+        fields[name] = {
+            "ok": field_matches(expected_value, actual),
+            "expected": expected_value,
+            "actual": actual,
+        }
+    matched = sum(1 for field in fields.values() if field["ok"])
+    return {"matched": matched, "total": len(fields), "fields": fields}
+
+
+async def bench_fixture(fixture: Dict, base_url: str, iterations: int, warmup: int) -> Dict:
+    extractor = getattr(job_extraction, fixture["extractor"])
+    url = f"{base_url}/{fixture['name']}"
+
+    for _ in range(warmup):
+        await extractor(url)
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        result = await extractor(url)
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    # Peak memory is measured on a separate run since tracemalloc slows everything down
+    tracemalloc.start()
+    await extractor(url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "name": fixture["name"],
+        "extractor": fixture["extractor"],
+        "iterations": iterations,
+        "throughput_per_s": iterations / elapsed if elapsed else float("inf"),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_py_heap_kb": peak / 1024,
+        "accuracy": score_accuracy(fixture["expected"], result),
+    }
+
+
+def print_report(results: List[Dict], page_sizes: Dict[str, int]) -> None:
+    header = f"{'fixture':<26}{'extractor':<28}{'size KB':>9}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'heap KB':>10}{'accuracy':>10}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        accuracy = result["accuracy"]
+        print(
+            f"{result['name']:<26}{result['extractor']:<28}"
+            f"{page_sizes[result['name']] / 1024:>9.0f}"
+            f"{result['throughput_per_s']:>10.1f}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+            f"{result['peak_py_heap_kb']:>10.0f}{accuracy['matched']:>6}/{accuracy['total']:<3}"
+        )
+
+    misses = [
+        (result["name"], name, field)
+        for result in results
+        for name, field in result["accuracy"]["fields"].items()
+        if not field["ok"]
+    ]
+    if misses:
+        print("\nField mismatches:")
+        for fixture_name, field_name, field in misses:
+            actual = field["actual"]
+            if isinstance(actual, str) and len(actual) > 60:
+                actual = actual[:57] + "..."
+            print(f"  {fixture_name}.{field_name}: expected {field['expected']!r}, got {actual!r}")
+
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"\nProcess max RSS: {max_rss_kb / 1024:.1f} MB")
+
+
+async def run(args) -> int:
+    fixtures = load_manifest(args.fixture)
+    if not fixtures:
+        print("No fixtures selected", file=sys.stderr)
+        return 2
+
+    Base.metadata.create_all(bind=engine)
+    pages = load_pages(fixtures)
+    server = start_server(pages)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        results = [
+            await bench_fixture(fixture, base_url, args.iterations, args.warmup)
+            for fixture in fixtures
+        ]
+    finally:
+        await http_client.aclose()
+        server.shutdown()
+
+    print_report(results, {name.lstrip("/"): len(body) for name, body in pages.items()})
+
+    matched = sum(result["accuracy"]["matched"] for result in results)
+    total = sum(result["accuracy"]["total"] for result in results)
+    overall = matched / total if total else 1.0
+    print(f"Overall field accuracy: {matched}/{total} ({overall:.1%})")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"results": results, "overall_accuracy": overall}, f, indent=2, default=str)
+
+    if overall < args.min_accuracy:
+        print(f"Accuracy {overall:.1%} is below the required {args.min_accuracy:.1%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the job extractors against saved HTML fixtures")
+    parser.add_argument("--iterations", type=int, default=30, help="Timed runs per fixture")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed runs per fixture")
+    parser.add_argument("--fixture", action="append", help="Only run the named fixture (repeatable)")
+    parser.add_argument("--json", help="Write the full results to this file")
+    parser.add_argument("--min-accuracy", type=float, default=0.0, help="Exit non-zero below this overall accuracy (0-1)")
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+SQL statement count check for the job list endpoint.
+
+Seeds a throwaway SQLite database with a user whose jobs each have a few
+contacts, then calls ``GET /jobs/`` at several page sizes and counts the
+statements each request runs. Contacts are batch-loaded, so the count
+must not grow with the page size; a lazy ``Job.contacts`` load would add
+one query per job (N+1). Exits non-zero if the counts differ.
+
+Run from the backend directory:
+
+    python -m benchmarks.job_list_queries
+    python -m benchmarks.job_list_queries --jobs 500 --page-sizes 1 50 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+from typing import Dict, List
+
+# Keep the seeded rows out of app.db
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.gettempdir()}/trackernow_job_list_queries.db")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.api.deps import get_current_user  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import engine, SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import User, Job, Contact  # noqa: E402
+
+
+def seed(job_count: int, contacts_per_job: int) -> int:
+    """Recreate the tables with one user owning ``job_count`` jobs and return the user id"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        user = User(email="bench@example.com", first_name="Bench", last_name="User", hashed_password="x")
+        db.add(user)
+        db.flush()
+        for i in range(job_count):
+            job = Job(user_id=user.id, company=f"Company {i}", position="Engineer", status="applied")
+            job.contacts = [
+                Contact(type="recruiter", name=f"Contact {i}.{j}") for j in range(contacts_per_job)
+            ]
+            db.add(job)
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+def count_statements(client: TestClient, page_size: int) -> int:
+    statements: List[str] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        response = client.get("/jobs/", params={"limit": page_size})
+        response.raise_for_status()
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+    return len(statements)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check that GET /jobs/ runs a constant number of SQL statements")
+    parser.add_argument("--jobs", type=int, default=200, help="Jobs to seed")
+    parser.add_argument("--contacts", type=int, default=3, help="Contacts per job")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    user_id = seed(args.jobs, args.contacts)
+
+    def current_user():
+        db = SessionLocal()
+        try:
+            return db.get(User, user_id)
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_current_user] = current_user
+    client = TestClient(app)
+
+    counts: Dict[int, int] = {size: count_statements(client, size) for size in args.page_sizes}
+    for size, count in counts.items():
+        print(f"limit={size:<6} statements={count}")
+
+    if len(set(counts.values())) > 1:
+        print("FAIL: statement count grows with page size (N+1 on a relationship?)", file=sys.stderr)
+        sys.exit(1)
+    print("OK: constant statement count")
+
+
+if __name__ == "__main__":
+    main()
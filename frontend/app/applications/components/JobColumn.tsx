@@ -9,6 +9,10 @@ import { ColumnConfig } from '../constants/columns';
 interface JobColumnProps {
   config: ColumnConfig;
   jobs: Job[];
+  totalCount?: number;
+  hasMore?: boolean;
+  loadingMore?: boolean;
+  onLoadMore?: () => void;
   onJobDrop?: (e: React.DragEvent, targetColumn: JobStatus, position?: number) => void;
   onJobDragStart?: (e: React.DragEvent, jobId: number) => void;
   onJobDragEnd?: () => void;
@@ -29,6 +33,10 @@ interface JobColumnProps {
 export default function JobColumn({ 
   config,
   jobs, 
+  totalCount,
+  hasMore = false,
+  loadingMore = false,
+  onLoadMore,
   onJobDrop,
   onJobDragStart,
   onJobDragEnd,
@@ -103,7 +111,7 @@ export default function JobColumn({
               {config.icon}
             </div>
             <h3 className="text-2xl font-bold text-gray-900">
-              {config.title} <span className="text-gray-500 font-normal ml-3 text-lg">{jobs.length}</span>
+              {config.title} <span className="text-gray-500 font-normal ml-3 text-lg">{totalCount ?? jobs.length}</span>
             </h3>
           </div>
           <button 
@@ -164,6 +172,17 @@ export default function JobColumn({
           {jobs.length > 0 && jobDropZone?.columnId === config.id && jobDropZone?.position === jobs.length && 
             renderDropZone(jobs.length)
           }
+
+          {/* More cards in this lane on the server */}
+          {hasMore && (
+            <button
+              onClick={onLoadMore}
+              disabled={loadingMore}
+              className="w-full py-3 text-sm font-medium text-gray-600 hover:text-blue-600 hover:bg-blue-50 rounded-lg transition-colors cursor-pointer disabled:opacity-50 disabled:cursor-default"
+            >
+              {loadingMore ? 'Loading...' : `Show more (${(totalCount ?? jobs.length) - jobs.length})`}
+            </button>
+          )}
         </div>
       </div>
     </div>
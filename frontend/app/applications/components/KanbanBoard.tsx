@@ -6,8 +6,9 @@ import JobDetailPage from './JobDetailPage';
 import JobApplicationForm from './JobApplicationForm';
 import LoadingState from './LoadingState';
 import ErrorState from './ErrorState';
-import { useJobs } from '../../hooks/useJobs';
+import { useJobBoard } from '../../hooks/useJobBoard';
 import { useDragDrop } from '../../hooks/useDragDrop';
+import { jobsService } from '../../services/jobs/JobsService';
 import { COLUMN_CONFIGS } from '../constants/columns';
 import { Job, JobStatus, JobCreate } from '../../types/job';
 
@@ -17,17 +18,18 @@ export default function KanbanBoard() {
   const [isFormOpen, setIsFormOpen] = useState(false);
   const [selectedStatus, setSelectedStatus] = useState<JobStatus>('saved');
   
-  // Use the real API data
+  // Board lanes from the API, loaded a page at a time
   const { 
-    jobs, 
     loading, 
+    loadingLanes,
     error, 
     createJob,
-    updateJob, 
+    moveJob,
     deleteJob,
-    getJobsByStatus,
-    refreshJobs
-  } = useJobs();
+    loadMore,
+    getLane,
+    refreshBoard
+  } = useJobBoard();
   
   // Use drag and drop hook
   const {
@@ -42,36 +44,34 @@ export default function KanbanBoard() {
     resetDragState,
   } = useDragDrop();
 
-  // Get jobs by status
-  const savedJobs = getJobsByStatus('saved');
-  const appliedJobs = getJobsByStatus('applied');
-  const interviewJobs = getJobsByStatus('interview');
-  const rejectedJobs = getJobsByStatus('rejected');
-  const offeredJobs = getJobsByStatus('offered');
-
-  // Create columns with real data
+  // Create columns from the board lanes
   const columns = COLUMN_CONFIGS.map(config => ({
     ...config,
-    jobs: getJobsByStatus(config.id)
+    lane: getLane(config.id)
   }));
 
-  const handleJobDrop = async (e: React.DragEvent, targetColumn: JobStatus, position?: number) => {
+  const handleJobDrop = (e: React.DragEvent, targetColumn: JobStatus, position?: number) => {
     e.preventDefault();
     const jobId = parseInt(e.dataTransfer.getData('text/plain'));
     
     if (!jobId || isNaN(jobId)) return;
 
-    try {
-      await updateJob(jobId, { status: targetColumn });
-      resetDragState();
-    } catch (error) {
-      console.error('Failed to update job status:', error);
-    }
+    moveJob(jobId, targetColumn, position ?? 0);
+    resetDragState();
   };
 
-  const handleJobEdit = (job: Job) => {
+  const handleJobEdit = async (job: Job) => {
     setViewingJob(job);
     setIsDetailPageOpen(true);
+    if (!job.id) return;
+
+    // The board only has job summaries; load the descriptions and notes for the detail view
+    try {
+      const fullJob = await jobsService.getJob(job.id);
+      setViewingJob(current => (current && current.id === fullJob.id ? fullJob : current));
+    } catch (error) {
+      console.error('Failed to load job details:', error);
+    }
   };
 
   const handleJobDelete = async (jobId: number) => {
@@ -121,7 +121,7 @@ export default function KanbanBoard() {
 
   // Error state
   if (error) {
-    return <ErrorState error={error} onRetry={refreshJobs} />;
+    return <ErrorState error={error} onRetry={refreshBoard} />;
   }
 
   return (
@@ -134,7 +134,11 @@ export default function KanbanBoard() {
               <div key={column.id} className="w-[450px]">
               <JobColumn
                   config={column}
-                jobs={column.jobs}
+                jobs={column.lane.jobs}
+                  totalCount={column.lane.count}
+                  hasMore={!!column.lane.next_cursor}
+                  loadingMore={loadingLanes.includes(column.id)}
+                  onLoadMore={() => loadMore(column.id)}
                 onJobDrop={handleJobDrop}
                 onJobDragStart={handleJobDragStart}
                   onJobDragEnd={handleColumnDragEnd}
@@ -3,11 +3,13 @@
 import { useState } from 'react';
 import { FileText, Target, Gift, X, Save, Clipboard } from 'lucide-react';
 import JobDetailPage from '../../applications/components/JobDetailPage';
+import { jobsService } from '../../services/jobs/JobsService';
 
 // import Avatar from '../Avatar'; // Unused for now
 
 interface ApplicationsTableProps {
   data: Array<{
+    id: number;
     company: string;
     position: string;
     status: string;
@@ -19,10 +21,19 @@ export default function ApplicationsTable({ data }: ApplicationsTableProps) {
   const [selectedJob, setSelectedJob] = useState<any>(null);
   const [isJobDetailOpen, setIsJobDetailOpen] = useState(false);
 
-  const handleRowClick = (application: any) => {
-    // Create a job object from the application data
+  const handleRowClick = async (application: any) => {
+    // The dashboard list only has job summaries; load the full job for the detail view
+    try {
+      setSelectedJob(await jobsService.getJob(application.id));
+      setIsJobDetailOpen(true);
+      return;
+    } catch (error) {
+      console.error('Failed to load job details:', error);
+    }
+
+    // Fall back to a job object built from the row data
     const jobData = {
-      id: Math.random(), // Generate a temporary ID
+      id: application.id,
       company: application.company,
       position: application.position,
       status: application.status,
@@ -1,7 +1,7 @@
 "use client";
 
 import { useState, useEffect } from 'react';
-import { Problem, ProblemFormData } from '../../types/problem';
+import { Problem, ProblemFormData, ProblemSuggestion } from '../../types/problem';
 import { problemsService } from '../../services/problems/ProblemsService';
 import { launchModalStyles } from './animations';
 import ProblemNameField from './ProblemNameField';
@@ -30,6 +30,8 @@ export default function ProblemForm({ problem, onSubmit, onCancel, initialDiffic
   const [errors, setErrors] = useState<Record<string, string>>({});
   const [isAutofilling, setIsAutofilling] = useState(false);
   const [autofillError, setAutofillError] = useState<string | null>(null);
+  const [suggestions, setSuggestions] = useState<ProblemSuggestion[]>([]);
+  const [selectedSuggestionName, setSelectedSuggestionName] = useState<string | null>(null);
 
   // Inject custom styles
   useEffect(() => {
@@ -138,6 +140,45 @@ export default function ProblemForm({ problem, onSubmit, onCancel, initialDiffic
 
   const [isAutofilled, setIsAutofilled] = useState(false);
 
+  // Debounced typeahead against the server-side LeetCode catalog
+  useEffect(() => {
+    const query = formData.name.trim();
+    if (isAutofilled || query.length < 2 || query === selectedSuggestionName) {
+      setSuggestions([]);
+      return;
+    }
+
+    let cancelled = false;
+    const timeout = setTimeout(async () => {
+      try {
+        const results = await problemsService.suggestProblemNames(query);
+        if (!cancelled) {
+          setSuggestions(results);
+        }
+      } catch {
+        if (!cancelled) {
+          setSuggestions([]);
+        }
+      }
+    }, 150);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timeout);
+    };
+  }, [formData.name, isAutofilled, selectedSuggestionName]);
+
+  const handleSelectSuggestion = (suggestion: ProblemSuggestion) => {
+    setFormData(prev => ({
+      ...prev,
+      name: suggestion.name,
+      link: suggestion.link,
+      difficulty: suggestion.difficulty
+    }));
+    setSelectedSuggestionName(suggestion.name);
+    setSuggestions([]);
+  };
+
   const handleAutofill = async () => {
     if (!formData.name.trim()) {
       setAutofillError('Please enter a problem name first');
@@ -213,6 +254,8 @@ export default function ProblemForm({ problem, onSubmit, onCancel, initialDiffic
             isAutofilled={isAutofilled}
             onInputChange={handleInputChange}
             onAutofill={handleAutofill}
+            suggestions={suggestions}
+            onSelectSuggestion={handleSelectSuggestion}
           />
 
           <TopicsField
@@ -1,6 +1,6 @@
 "use client";
 
-import { ProblemFormData } from '../../types/problem';
+import { ProblemFormData, ProblemSuggestion } from '../../types/problem';
 
 interface ProblemNameFieldProps {
   formData: ProblemFormData;
@@ -10,6 +10,8 @@ interface ProblemNameFieldProps {
   isAutofilled: boolean;
   onInputChange: (field: keyof ProblemFormData, value: any) => void;
   onAutofill: () => void;
+  suggestions?: ProblemSuggestion[];
+  onSelectSuggestion?: (suggestion: ProblemSuggestion) => void;
 }
 
 export default function ProblemNameField({
@@ -19,7 +21,9 @@ export default function ProblemNameField({
   isAutofilling,
   isAutofilled,
   onInputChange,
-  onAutofill
+  onAutofill,
+  suggestions = [],
+  onSelectSuggestion
 }: ProblemNameFieldProps) {
   return (
     <div className="space-y-4">
@@ -27,18 +31,38 @@ export default function ProblemNameField({
         Problem Name *
       </label>
       <div className="flex gap-3">
-        <input
-          type="text"
-          id="name"
-          value={formData.name}
-          onChange={(e) => onInputChange('name', e.target.value)}
-          disabled={isAutofilled}
-          className={`flex-1 px-6 py-4 border rounded-lg focus:ring-2 focus:ring-primary focus:border-transparent transition-all duration-200 hover:border-gray-400 ${
-            errors.name ? 'border-red-300' : 'border-gray-300'
-          } ${isAutofilled ? 'bg-gray-100 text-gray-500 cursor-not-allowed' : ''}`}
-          style={{ color: isAutofilled ? '#6B7280' : '#111827', fontSize: '20px' }}
-          placeholder="e.g., Two Sum"
-        />
+        <div className="relative flex-1">
+          <input
+            type="text"
+            id="name"
+            value={formData.name}
+            onChange={(e) => onInputChange('name', e.target.value)}
+            disabled={isAutofilled}
+            className={`w-full px-6 py-4 border rounded-lg focus:ring-2 focus:ring-primary focus:border-transparent transition-all duration-200 hover:border-gray-400 ${
+              errors.name ? 'border-red-300' : 'border-gray-300'
+            } ${isAutofilled ? 'bg-gray-100 text-gray-500 cursor-not-allowed' : ''}`}
+            style={{ color: isAutofilled ? '#6B7280' : '#111827', fontSize: '20px' }}
+            placeholder="e.g., Two Sum"
+            autoComplete="off"
+          />
+          {!isAutofilled && suggestions.length > 0 && (
+            <ul className="absolute z-10 mt-1 w-full bg-white border border-gray-200 rounded-lg shadow-lg max-h-72 overflow-y-auto">
+              {suggestions.map((suggestion) => (
+                <li key={suggestion.slug}>
+                  <button
+                    type="button"
+                    onClick={() => onSelectSuggestion?.(suggestion)}
+                    className="w-full flex items-center justify-between px-6 py-3 text-left hover:bg-gray-50 transition-colors"
+                    style={{ color: '#111827', fontSize: '18px' }}
+                  >
+                    <span>{suggestion.name}</span>
+                    <span className="text-sm text-gray-500">{suggestion.difficulty}</span>
+                  </button>
+                </li>
+              ))}
+            </ul>
+          )}
+        </div>
         <button
           type="button"
           onClick={onAutofill}
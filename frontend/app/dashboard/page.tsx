@@ -92,6 +92,7 @@ function DashboardContent() {
       { day: 'Sun', problems: 2, hours: 0.8 }
     ],
     recentApplications: jobs.slice(0, 5).map(job => ({
+      id: job.id,
       company: job.company,
       position: job.position,
       status: job.status,
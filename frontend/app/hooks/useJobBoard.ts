@@ -0,0 +1,226 @@
+import { useState, useEffect, useCallback, useRef } from 'react';
+import { jobsService } from '../services/jobs/JobsService';
+import { Job, JobCreate, JobMove, JobStatus, BoardLane } from '../types/job';
+
+// Cards loaded per lane up front and per "load more"
+const LANE_PAGE_SIZE = 20;
+
+// Board moves made within this window are sent together in one request
+const MOVE_BATCH_DELAY_MS = 300;
+
+export interface UseJobBoardReturn {
+  // Loading states
+  loading: boolean;
+  loadingLanes: string[];
+
+  // Error states
+  error: string | null;
+
+  // Actions
+  createJob: (jobData: JobCreate) => Promise<Job>;
+  deleteJob: (jobId: number) => Promise<void>;
+  moveJob: (jobId: number, status: JobStatus, index: number) => void;
+  loadMore: (status: JobStatus) => Promise<void>;
+  refreshBoard: () => Promise<void>;
+
+  // Utility functions
+  getLane: (status: JobStatus) => BoardLane;
+}
+
+// Cards in board order (lane_position, then id, like the server)
+function sortLane(jobs: Job[]): Job[] {
+  return [...jobs].sort((a, b) => ((a.lane_position ?? 0) - (b.lane_position ?? 0)) || (a.id - b.id));
+}
+
+export function useJobBoard(): UseJobBoardReturn {
+  const [lanes, setLanes] = useState<Record<string, BoardLane>>({});
+  const [loadingLanes, setLoadingLanes] = useState<string[]>([]);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<string | null>(null);
+  const pendingMoves = useRef<Map<number, JobMove>>(new Map());
+  const moveTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+  // Lane with its count and loaded cards (empty if the board has none)
+  const getLane = useCallback((status: JobStatus): BoardLane => {
+    return lanes[status] ?? { status, count: 0, jobs: [], next_cursor: null };
+  }, [lanes]);
+
+  // Fetch every lane's count and first cards
+  const fetchBoard = useCallback(async () => {
+    try {
+      setLoading(true);
+      setError(null);
+      const board = await jobsService.getBoard(LANE_PAGE_SIZE);
+      setLanes(Object.fromEntries(board.lanes.map(lane => [lane.status, lane])));
+    } catch (err) {
+      const errorMessage = err instanceof Error ? err.message : 'Failed to fetch job board';
+      setError(errorMessage);
+      console.error('❌ Error fetching job board:', err);
+    } finally {
+      setLoading(false);
+    }
+  }, []);
+
+  // Load the next cards of a lane from its cursor
+  const loadMore = useCallback(async (status: JobStatus): Promise<void> => {
+    const cursor = lanes[status]?.next_cursor;
+    if (!cursor || loadingLanes.includes(status)) return;
+
+    try {
+      setLoadingLanes(prev => [...prev, status]);
+      const page = await jobsService.getBoardLane(status, cursor, LANE_PAGE_SIZE);
+      setLanes(prev => {
+        const lane = prev[status] ?? { status, count: 0, jobs: [] };
+        // Cards moved here locally may come back from the server too
+        const loaded = new Set(lane.jobs.map(job => job.id));
+        return {
+          ...prev,
+          [status]: {
+            ...lane,
+            count: page.count,
+            jobs: sortLane([...lane.jobs, ...page.jobs.filter(job => !loaded.has(job.id))]),
+            next_cursor: page.next_cursor,
+          },
+        };
+      });
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Failed to load more jobs');
+    } finally {
+      setLoadingLanes(prev => prev.filter(other => other !== status));
+    }
+  }, [lanes, loadingLanes]);
+
+  // Create a new job; the server puts it on top of its lane
+  const createJob = useCallback(async (jobData: JobCreate): Promise<Job> => {
+    try {
+      setError(null);
+      const newJob = await jobsService.createJob(jobData);
+      setLanes(prev => {
+        const lane = prev[newJob.status] ?? { status: newJob.status, count: 0, jobs: [] };
+        return { ...prev, [newJob.status]: { ...lane, count: lane.count + 1, jobs: [newJob, ...lane.jobs] } };
+      });
+      return newJob;
+    } catch (err) {
+      const errorMessage = err instanceof Error ? err.message : 'Failed to create job';
+      setError(errorMessage);
+      throw new Error(errorMessage);
+    }
+  }, []);
+
+  // Delete a job
+  const deleteJob = useCallback(async (jobId: number): Promise<void> => {
+    try {
+      setError(null);
+      await jobsService.deleteJob(jobId);
+      setLanes(prev => Object.fromEntries(Object.entries(prev).map(([status, lane]) => [
+        status,
+        lane.jobs.some(job => job.id === jobId)
+          ? { ...lane, count: lane.count - 1, jobs: lane.jobs.filter(job => job.id !== jobId) }
+          : lane,
+      ])));
+    } catch (err) {
+      const errorMessage = err instanceof Error ? err.message : 'Failed to delete job';
+      setError(errorMessage);
+      throw new Error(errorMessage);
+    }
+  }, []);
+
+  // Send the queued board moves
+  const flushMoves = useCallback(async (): Promise<void> => {
+    moveTimer.current = null;
+    const moves = Array.from(pendingMoves.current.values());
+    pendingMoves.current.clear();
+    if (moves.length === 0) return;
+
+    try {
+      setError(null);
+      const result = await jobsService.moveJobs(moves);
+      if (result.results.some(outcome => outcome.result !== 'moved')) {
+        // Some jobs changed elsewhere in the meantime; reload the board
+        await fetchBoard();
+        return;
+      }
+      const versions = new Map(result.results.map(outcome => [outcome.job_id, outcome.version]));
+      setLanes(prev => Object.fromEntries(Object.entries(prev).map(([status, lane]) => [
+        status,
+        { ...lane, jobs: lane.jobs.map(job => versions.has(job.id) ? { ...job, version: versions.get(job.id) } : job) },
+      ])));
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Failed to move jobs');
+      await fetchBoard();
+    }
+  }, [fetchBoard]);
+
+  // Move a job to the given index of a status lane. Applied locally right away;
+  // moves made in quick succession are coalesced and sent as one batch
+  const moveJob = useCallback((jobId: number, status: JobStatus, index: number): void => {
+    const job = Object.values(lanes).flatMap(lane => lane.jobs).find(other => other.id === jobId);
+    if (!job) return;
+
+    const target = getLane(status).jobs[index];
+    if (target?.id === jobId) return;
+    const lane = getLane(status).jobs.filter(other => other.id !== jobId);
+
+    // Take the midpoint of the new neighbours' positions
+    const at = target ? lane.indexOf(target) : lane.length;
+    const above = lane[at - 1]?.lane_position;
+    const below = lane[at]?.lane_position;
+    let lanePosition = 0;
+    if (above !== undefined && below !== undefined) lanePosition = (above + below) / 2;
+    else if (above !== undefined) lanePosition = above + 1;
+    else if (below !== undefined) lanePosition = below - 1;
+
+    pendingMoves.current.set(jobId, {
+      job_id: jobId,
+      status,
+      lane_position: lanePosition,
+      version: job.version ?? 1,
+    });
+    setLanes(prev => {
+      const from = prev[job.status] ?? { status: job.status, count: 0, jobs: [] };
+      const next = { ...prev, [job.status]: { ...from, count: from.count - 1, jobs: from.jobs.filter(other => other.id !== jobId) } };
+      const to = next[status] ?? { status, count: 0, jobs: [] };
+      next[status] = {
+        ...to,
+        count: to.count + 1,
+        jobs: sortLane([...to.jobs, { ...job, status, lane_position: lanePosition }]),
+      };
+      return next;
+    });
+
+    if (moveTimer.current) clearTimeout(moveTimer.current);
+    moveTimer.current = setTimeout(flushMoves, MOVE_BATCH_DELAY_MS);
+  }, [lanes, getLane, flushMoves]);
+
+  // Load data on mount
+  useEffect(() => {
+    fetchBoard();
+  }, [fetchBoard]);
+
+  // Don't drop queued moves when the board unmounts
+  useEffect(() => () => {
+    if (moveTimer.current) {
+      clearTimeout(moveTimer.current);
+      flushMoves();
+    }
+  }, [flushMoves]);
+
+  return {
+    // Loading states
+    loading,
+    loadingLanes,
+
+    // Error states
+    error,
+
+    // Actions
+    createJob,
+    deleteJob,
+    moveJob,
+    loadMore,
+    refreshBoard: fetchBoard,
+
+    // Utility functions
+    getLane,
+  };
+}
@@ -129,6 +129,12 @@ export function useJobs(): UseJobsReturn {
     }
   }, [fetchJobs]);
 
+  // Jobs in a status lane, in board order
+  const getJobsByStatus = useCallback((status: string): Job[] => {
+    return (jobs?.filter(job => job.status === status) || [])
+      .sort((a, b) => (a.lane_position ?? 0) - (b.lane_position ?? 0));
+  }, [jobs]);
+
   // Add contact to a job
   const addContact = useCallback(async (jobId: number, contactData: ContactCreate): Promise<void> => {
     try {
@@ -195,10 +201,6 @@ export function useJobs(): UseJobsReturn {
   }, []);
 
   // Utility functions
-  const getJobsByStatus = useCallback((status: string): Job[] => {
-    return jobs?.filter(job => job.status === status) || [];
-  }, [jobs]);
-
   const getJobById = useCallback((jobId: number): Job | undefined => {
     return jobs?.find(job => job.id === jobId);
   }, [jobs]);
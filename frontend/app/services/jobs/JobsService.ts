@@ -1,5 +1,5 @@
 import { ApiService } from '../base/ApiService';
-import { Job, JobCreate, JobUpdate, JobBulkUpdate, JobStats, Contact, ContactCreate } from '../../types/job';
+import { Job, JobCreate, JobUpdate, JobBulkUpdate, JobMove, JobMoveResult, JobBoard, BoardLane, JobStats, Contact, ContactCreate } from '../../types/job';
 
 export class JobsService extends ApiService {
   private baseUrl = '/jobs';
@@ -14,6 +14,20 @@ export class JobsService extends ApiService {
     return response;
   }
 
+  async getBoard(laneLimit = 20): Promise<JobBoard> {
+    const response = await this.get(`${this.baseUrl}/board?lane_limit=${laneLimit}`);
+    return response;
+  }
+
+  async getBoardLane(status: string, cursor?: string, limit = 20): Promise<BoardLane> {
+    const params = new URLSearchParams();
+    if (cursor) params.append('cursor', cursor);
+    params.append('limit', limit.toString());
+
+    const response = await this.get(`${this.baseUrl}/board/${status}?${params.toString()}`);
+    return response;
+  }
+
   async getJob(jobId: number): Promise<Job> {
     const response = await this.get(`${this.baseUrl}/${jobId}`);
     return response;
@@ -38,6 +52,11 @@ export class JobsService extends ApiService {
     return response;
   }
 
+  async moveJobs(moves: JobMove[]): Promise<JobMoveResult> {
+    const response = await this.patch(`${this.baseUrl}/moves`, { moves });
+    return response;
+  }
+
   async getJobStats(): Promise<JobStats> {
     const response = await this.get(`${this.baseUrl}/stats`);
     return response;
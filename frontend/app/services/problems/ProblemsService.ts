@@ -1,5 +1,5 @@
 import { ApiService } from '../base/ApiService';
-import { Problem, ProblemFormData } from '../../types/problem';
+import { Problem, ProblemFormData, ProblemSuggestion } from '../../types/problem';
 
 class ProblemsService extends ApiService {
   // Get all problems
@@ -51,6 +51,37 @@ class ProblemsService extends ApiService {
       error?: string;
     }>('/problems/autofill', { problem_name: problemName });
   }
+
+  // Auto-fill a whole list of problem names, optionally creating them
+  async autofillProblemDetailsBatch(problemNames: string[], createProblems = false): Promise<{
+    results: {
+      problem_name: string;
+      success: boolean;
+      data?: {
+        name: string;
+        link: string;
+        difficulty: 'EASY' | 'MEDIUM' | 'HARD';
+        topics: string[];
+        platform: string;
+      };
+      error?: string;
+    }[];
+    resolved: number;
+    created: Problem[];
+  }> {
+    return this.post('/problems/autofill/batch', {
+      problem_names: problemNames,
+      create_problems: createProblems
+    });
+  }
+
+  // Typeahead suggestions for problem names
+  async suggestProblemNames(query: string, limit = 8): Promise<ProblemSuggestion[]> {
+    const response = await this.get<{ query: string; suggestions: ProblemSuggestion[] }>(
+      `/problems/autofill/suggest?q=${encodeURIComponent(query)}&limit=${limit}`
+    );
+    return response.suggestions;
+  }
 }
 
 export const problemsService = new ProblemsService();
@@ -20,6 +20,8 @@ export interface Job {
   cover_letter?: string;
   application_url?: string;
   completion_method?: string;
+  lane_position?: number;
+  version?: number;
   created_at: string;
   updated_at: string;
   user_id: number;
@@ -116,6 +118,37 @@ export interface JobBulkUpdate {
   status: JobStatus;
 }
 
+export interface JobMove {
+  job_id: number;
+  status: JobStatus;
+  lane_position: number;
+  version: number;
+}
+
+export interface JobMoveOutcome {
+  job_id: number;
+  result: 'moved' | 'conflict' | 'not_found';
+  status?: JobStatus;
+  lane_position?: number;
+  version?: number;
+}
+
+export interface JobMoveResult {
+  moved: number;
+  results: JobMoveOutcome[];
+}
+
+export interface BoardLane {
+  status: JobStatus;
+  count: number;
+  jobs: Job[];
+  next_cursor?: string | null;
+}
+
+export interface JobBoard {
+  lanes: BoardLane[];
+}
+
 export interface JobStats {
   total_jobs: number;
   jobs_by_status: Record<JobStatus, number>;
@@ -125,6 +158,8 @@ export interface JobStats {
   average_time_to_apply?: number;
   interview_rate?: number;
   offer_rate?: number;
+  applications_by_week?: Record<string, number>;
+  referral_conversion?: Record<'referral' | 'non_referral', { total: number; interviews: number; rate: number }>;
 }
 
 export interface KanbanColumn {
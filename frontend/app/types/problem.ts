@@ -19,3 +19,11 @@ export interface ProblemFormData {
   time_minutes?: number;
   notes?: string;
 }
+
+export interface ProblemSuggestion {
+  name: string;
+  slug: string;
+  link: string;
+  difficulty: 'EASY' | 'MEDIUM' | 'HARD';
+  score: number;
+}